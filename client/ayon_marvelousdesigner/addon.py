@@ -5,11 +5,17 @@ Marvelous Designer host application with the AYON pipeline.
 """
 import os
 
-from ayon_core.addon import AYONAddon, IHostAddon
+from ayon_core.addon import AYONAddon, IHostAddon, click_wrap
 
 from .version import __version__
 
 MARVELOUS_DESIGNER_HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+# Environment variable enabling headless mode without Qt and AYON tools
+HEADLESS_ENV = "AYON_MD_HEADLESS"
+# Environment variable with AYON metadata of a new workfile, JSON with
+# `workfile` path and `metadata`, set by the prelaunch hook and read by
+# the host
+SEEDED_METADATA_ENV = "AYON_MD_SEEDED_METADATA"
 
 
 class MarvelousDesignerAddon(AYONAddon, IHostAddon):
@@ -48,3 +54,145 @@ class MarvelousDesignerAddon(AYONAddon, IHostAddon):
             List of supported workfile extensions.
         """
         return [".zprj"]
+
+    def cli(self, click_group: object) -> None:  # noqa: PLR6301
+        """Add Marvelous Designer commands to AYON command line.
+
+        Args:
+            click_group: Click group of the addon commands.
+        """
+        click_group.add_command(cli_main.to_command())
+
+
+@click_wrap.group(
+    MarvelousDesignerAddon.name,
+    help="Marvelous Designer addon commands."
+)
+def cli_main() -> None:
+    """Marvelous Designer addon commands."""
+
+
+@cli_main.command("batch-publish")
+@click_wrap.argument("workfiles", nargs=-1, required=True)
+@click_wrap.option(
+    "--log", "log_path", required=True,
+    help="JSONL log with result of each workfile, used to resume.")
+@click_wrap.option(
+    "--workers", type=int, default=2, show_default=True,
+    help="Number of sessions publishing at the same time.")
+@click_wrap.option(
+    "--no-resume", is_flag=True, default=False,
+    help="Publish workfiles which were already published successfully.")
+@click_wrap.option(
+    "--worker-command", default=None,
+    help=(
+        "Command starting a headless session, {python}, {script}, "
+        "{workfile} and {result} are replaced."
+    ))
+@click_wrap.option(
+    "--md-api-path", default=None,
+    help="Directory with (stand-in) Marvelous Designer API modules.")
+@click_wrap.option(
+    "--timeout", type=float, default=None,
+    help="Timeout of one workfile in seconds.")
+def batch_publish_command(  # noqa: PLR0913, PLR0917
+        workfiles: tuple[str],
+        log_path: str,
+        workers: int,
+        no_resume: bool,  # noqa: FBT001
+        worker_command: str,
+        md_api_path: str,
+        timeout: float) -> None:
+    """Publish .zprj workfiles in parallel headless sessions."""
+    from .api.batch_publish import batch_publish
+
+    summary = batch_publish(
+        list(workfiles),
+        log_path,
+        workers=workers,
+        resume=not no_resume,
+        worker_command=worker_command,
+        md_api_path=md_api_path,
+        timeout=timeout,
+    )
+    print(", ".join(  # noqa: T201
+        f"{status}: {count}" for status, count in sorted(summary.items())
+    ))
+
+
+@cli_main.command("read-metadata")
+@click_wrap.argument("paths", nargs=-1, required=True)
+@click_wrap.option(
+    "--workers", type=int, default=8, show_default=True,
+    help="Number of files read at the same time.")
+@click_wrap.option(
+    "--output", "output_path", default=None,
+    help="Write JSONL results to a file instead of standard output.")
+def read_metadata_command(
+        paths: tuple[str],
+        workers: int,
+        output_path: str) -> None:
+    """Read AYON metadata of .zprj files and directories without MD."""
+    import json
+    import sys
+
+    from .api.zprj_metadata import scan_zprj_metadata
+
+    stream = (
+        open(output_path, "w", encoding="utf-8")  # noqa: SIM115
+        if output_path else sys.stdout
+    )
+    try:
+        for result in scan_zprj_metadata(paths, max_workers=workers):
+            metadata = result.pop("metadata") or {}
+            result["instances"] = metadata.get("ayon_instances", {})
+            result["containers"] = metadata.get("ayon_containers", [])
+            result["contextData"] = metadata.get("ayon_context_data", {})
+            stream.write(json.dumps(result) + "\n")
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+@cli_main.command("index-dependencies")
+@click_wrap.argument("paths", nargs=-1, required=True)
+@click_wrap.option(
+    "--db", "db_path", required=True,
+    help="Path to the SQLite dependency index of the project.")
+@click_wrap.option(
+    "--workers", type=int, default=8, show_default=True,
+    help="Number of workfiles read at the same time.")
+def index_dependencies_command(
+        paths: tuple[str],
+        db_path: str,
+        workers: int) -> None:
+    """Index representations loaded in changed .zprj workfiles."""
+    from contextlib import closing
+
+    from .api.dependency_index import DependencyIndex
+
+    with closing(DependencyIndex(db_path)) as index:
+        summary = index.update(paths, max_workers=workers)
+    print(", ".join(  # noqa: T201
+        f"{key}: {count}" for key, count in summary.items()
+    ))
+
+
+@cli_main.command("find-dependents")
+@click_wrap.argument("representation_ids", nargs=-1, required=True)
+@click_wrap.option(
+    "--db", "db_path", required=True,
+    help="Path to the SQLite dependency index of the project.")
+def find_dependents_command(
+        representation_ids: tuple[str],
+        db_path: str) -> None:
+    """List indexed workfiles which loaded the representations."""
+    from contextlib import closing
+
+    from .api.dependency_index import DependencyIndex
+
+    with closing(DependencyIndex(db_path)) as index:
+        workfiles = index.get_workfiles_by_representation(representation_ids)
+    for representation_id, paths in workfiles.items():
+        for path in paths:
+            print(f"{representation_id}\t{path}")  # noqa: T201
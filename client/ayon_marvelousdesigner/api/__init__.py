@@ -1,12 +1,25 @@
 """Marvelous Designer API package.
 
 This package provides the API interface for Marvelous Designer integration.
+Members are imported on first access, so importing a submodule doesn't
+import the host pipeline and its dependencies.
 """
+from __future__ import annotations
 
-from .pipeline import (
-    MarvelousDesignerHost,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pipeline import MarvelousDesignerHost
 
 __all__ = [
     "MarvelousDesignerHost",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name == "MarvelousDesignerHost":
+        from .pipeline import MarvelousDesignerHost
+
+        return MarvelousDesignerHost
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,245 @@
+"""Trim Alembic caches to a frame window before importing them.
+
+Marvelous Designer `ImportAlembicOption` has no frame range options, so
+importing a cache always reads all of its samples. This module writes
+a reduced copy of the cache with only the requested samples of transforms
+and polygon meshes, using PyAlembic when it is available.
+"""
+from __future__ import annotations
+
+import logging
+import math
+
+try:
+    from alembic import Abc, AbcGeom
+except ImportError:
+    Abc = AbcGeom = None
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+# Tolerance when comparing sample times converted to frames
+FRAME_TOLERANCE = 1e-4
+
+
+def is_available() -> bool:
+    """Check whether Alembic caches can be trimmed.
+
+    Returns:
+        bool: True if PyAlembic is available.
+    """
+    return Abc is not None
+
+
+def get_sample_indices(
+        times: list[float], fps: float, frame_window: dict) -> list[int]:
+    """Select indices of samples inside a frame window.
+
+    Frame window keys:
+        frameStart (int): First frame to keep.
+        frameEnd (int): Last frame to keep, 0 keeps all frames after
+            `frameStart`.
+        frameStep (int): Keep every n-th frame.
+        subsamples (int): Number of evenly spaced samples kept per frame,
+            1 keeps only samples on whole frames.
+
+    Args:
+        times (list[float]): Sample times in seconds.
+        fps (float): Frames per second of the cache.
+        frame_window (dict): Frame window to select samples in.
+
+    Returns:
+        list[int]: Indices of the selected samples.
+    """
+    frame_start = frame_window.get("frameStart", 0)
+    frame_end = frame_window.get("frameEnd", 0)
+    frame_step = max(1, frame_window.get("frameStep", 1))
+    subsamples = max(1, frame_window.get("subsamples", 1))
+    indices = []
+    for index, time in enumerate(times):
+        frame = time * fps
+        whole_frame = math.floor(frame + FRAME_TOLERANCE)
+        if whole_frame < frame_start:
+            continue
+        if frame_end and whole_frame > frame_end:
+            break
+        if (whole_frame - frame_start) % frame_step:
+            continue
+        offset = (frame - whole_frame) * subsamples
+        if abs(offset - round(offset)) > FRAME_TOLERANCE * subsamples:
+            continue
+        indices.append(index)
+    return indices
+
+
+def get_time_sampling(
+        times: list[float], cycle: float) -> tuple[tuple[float, ...], float]:
+    """Get cyclic time sampling matching the selected sample times.
+
+    Selected samples repeat every `cycle` seconds with as many samples
+    per cycle as the source really has, which might be fewer than the
+    requested subsamples. When the times don't repeat regularly, e.g.
+    the source has irregular subframe samples, all times are returned
+    as start times of a single cycle longer than the samples, which is
+    equivalent to an acyclic time sampling.
+
+    Args:
+        times (list[float]): Selected sample times in seconds.
+        cycle (float): Expected duration of a cycle in seconds.
+
+    Returns:
+        tuple[tuple[float, ...], float]: Start times of the samples in
+            the first cycle and duration of the cycle.
+    """
+    tolerance = FRAME_TOLERANCE * cycle
+    first = times[0]
+    per_cycle = sum(1 for time in times if time < first + cycle - tolerance)
+    start_times = tuple(times[:per_cycle])
+    is_cyclic = all(
+        abs(
+            time
+            - start_times[index % per_cycle]
+            - (index // per_cycle) * cycle
+        ) <= tolerance
+        for index, time in enumerate(times)
+    )
+    if is_cyclic:
+        return start_times, cycle
+    return tuple(times), times[-1] - first + cycle
+
+
+def trim_alembic(
+        src_path: str,
+        dst_path: str,
+        fps: float,
+        frame_window: dict) -> None:
+    """Write a copy of an Alembic cache reduced to a frame window.
+
+    Only transforms and polygon meshes (positions, topology and UVs) are
+    copied, which is what Marvelous Designer imports from a cache.
+
+    Args:
+        src_path (str): Path to the source Alembic file.
+        dst_path (str): Path to write the trimmed Alembic file to.
+        fps (float): Frames per second of the cache.
+        frame_window (dict): Frame window, see `get_sample_indices`.
+
+    Raises:
+        RuntimeError: If PyAlembic is not available.
+    """
+    if not is_available():
+        msg = "PyAlembic is not available, Alembic cache can't be trimmed."
+        raise RuntimeError(msg)
+
+    trimmer = _AlembicTrimmer(
+        Abc.IArchive(src_path), Abc.OArchive(dst_path), fps, frame_window)
+    trimmer.trim()
+
+
+class _AlembicTrimmer:
+    """Copy selected samples of an Alembic archive into another one."""
+
+    def __init__(
+            self,
+            iarchive: object,
+            oarchive: object,
+            fps: float,
+            frame_window: dict):
+        self._iarchive = iarchive
+        self._oarchive = oarchive
+        self._fps = fps
+        self._frame_window = frame_window
+        self._time_sampling_indices: dict[tuple, int] = {}
+
+    def trim(self) -> None:
+        otop = self._oarchive.getTop()
+        for child in self._iarchive.getTop().children:
+            self._copy_object(child, otop)
+
+    def _copy_object(self, iobject: object, oparent: object) -> None:
+        header = iobject.getHeader()
+        if AbcGeom.IXform.matches(header):
+            oobject = self._copy_xform(iobject, oparent)
+        elif AbcGeom.IPolyMesh.matches(header):
+            oobject = self._copy_poly_mesh(iobject, oparent)
+        else:
+            log.debug(
+                "Skipping unsupported Alembic object '%s'.",
+                iobject.getName()
+            )
+            return
+
+        for child in iobject.children:
+            self._copy_object(child, oobject)
+
+    def _copy_xform(self, iobject: object, oparent: object) -> object:
+        ischema = AbcGeom.IXform(
+            iobject, Abc.WrapExistingFlag.kWrapExisting).getSchema()
+        indices, time_sampling_index = self._select_samples(ischema)
+        oobject = AbcGeom.OXform(
+            oparent, iobject.getName(), time_sampling_index)
+        oschema = oobject.getSchema()
+        for index in indices:
+            oschema.set(ischema.getValue(Abc.ISampleSelector(index)))
+        return oobject
+
+    def _copy_poly_mesh(self, iobject: object, oparent: object) -> object:
+        ischema = AbcGeom.IPolyMesh(
+            iobject, Abc.WrapExistingFlag.kWrapExisting).getSchema()
+        indices, time_sampling_index = self._select_samples(ischema)
+        oobject = AbcGeom.OPolyMesh(
+            oparent, iobject.getName(), time_sampling_index)
+        oschema = oobject.getSchema()
+        uvs_param = ischema.getUVsParam()
+        for index in indices:
+            selector = Abc.ISampleSelector(index)
+            sample = ischema.getValue(selector)
+            osample = AbcGeom.OPolyMeshSchemaSample(
+                sample.getPositions(),
+                sample.getFaceIndices(),
+                sample.getFaceCounts(),
+            )
+            if uvs_param.valid():
+                uvs = uvs_param.getIndexedValue(selector)
+                osample.setUVs(AbcGeom.OV2fGeomParamSample(
+                    uvs.getVals(), uvs.getIndices(), uvs_param.getScope()
+                ))
+            oschema.set(osample)
+        return oobject
+
+    def _select_samples(self, ischema: object) -> tuple[list[int], int]:
+        """Select samples of a schema and get their output time sampling.
+
+        Returns:
+            tuple[list[int], int]: Indices of the selected samples and
+                index of the time sampling in the output archive.
+
+        Raises:
+            ValueError: If the window does not contain any sample.
+        """
+        num_samples = ischema.getNumSamples()
+        if num_samples <= 1:
+            # Static object, keep it with the default time sampling
+            return [0], 0
+        time_sampling = ischema.getTimeSampling()
+        times = [
+            time_sampling.getSampleTime(index)
+            for index in range(num_samples)
+        ]
+        indices = get_sample_indices(times, self._fps, self._frame_window)
+        if not indices:
+            msg = f"No samples in frame window {self._frame_window}."
+            raise ValueError(msg)
+
+        # Selected samples repeat every `frameStep` frames
+        frame_step = max(1, self._frame_window.get("frameStep", 1))
+        start_times, cycle = get_time_sampling(
+            [times[index] for index in indices], frame_step / self._fps)
+        key = (start_times, cycle)
+        if key not in self._time_sampling_indices:
+            sampling_type = AbcGeom.TimeSamplingType(len(start_times), cycle)
+            self._time_sampling_indices[key] = (
+                self._oarchive.addTimeSampling(
+                    AbcGeom.TimeSampling(sampling_type, list(start_times))
+                )
+            )
+        return indices, self._time_sampling_indices[key]
@@ -1,12 +1,19 @@
 """Ayon Marvelous Designer tools dialog module."""
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import utility_api
 from ayon_core import resources, style
 from ayon_core.tools.utils import host_tools
 from ayon_core.tools.utils.lib import qt_app_context
 from qtpy import QtCore, QtGui, QtWidgets
 
+from ayon_marvelousdesigner.api.profiling import ActionProfiler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class MDBtnToolsWidget(QtWidgets.QWidget):
     """Widget containing buttons which are clickable."""
@@ -24,6 +31,11 @@ class MDBtnToolsWidget(QtWidgets.QWidget):
         manage_btn = QtWidgets.QPushButton("Manage...", self)
         publish_btn = QtWidgets.QPushButton("Publish...", self)
         workfile_btn = QtWidgets.QPushButton("Workfile...", self)
+        profile_checkbox = QtWidgets.QCheckBox("Profile next action", self)
+        profile_checkbox.setToolTip(
+            "Profile the next action until it returns and show "
+            "the hottest functions."
+        )
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -31,6 +43,7 @@ class MDBtnToolsWidget(QtWidgets.QWidget):
         layout.addWidget(manage_btn, 0)
         layout.addWidget(publish_btn, 0)
         layout.addWidget(workfile_btn, 0)
+        layout.addWidget(profile_checkbox, 0)
         layout.addStretch(1)
 
         load_btn.clicked.connect(self._on_load)
@@ -38,6 +51,24 @@ class MDBtnToolsWidget(QtWidgets.QWidget):
         publish_btn.clicked.connect(self._on_publish)
         workfile_btn.clicked.connect(self._on_workfile)
 
+        self._profile_checkbox = profile_checkbox
+
+    def is_profile_enabled(self) -> bool:
+        """Check whether the next action should be profiled.
+
+        Returns:
+            bool: True if profiling of the next action is enabled.
+        """
+        return self._profile_checkbox.isChecked()
+
+    def set_profile_enabled(self, enabled: bool) -> None:  # noqa: FBT001
+        """Enable or disable profiling of the next action.
+
+        Args:
+            enabled (bool): Profile the next action.
+        """
+        self._profile_checkbox.setChecked(enabled)
+
     def _on_load(self) -> None:
         self.tool_required.emit("loader")
 
@@ -115,7 +146,74 @@ class MDToolsDialog(QtWidgets.QDialog):
         utility_api.ResetWidgetRegistry()
 
     def _on_tool_require(self, tool_name: str) -> None:
-        host_tools.show_tool_by_name(tool_name, parent=self)
+        if not self._tools_widget.is_profile_enabled():
+            host_tools.show_tool_by_name(tool_name, parent=self)
+            return
+        self._run_profiled(
+            tool_name,
+            lambda: host_tools.show_tool_by_name(tool_name, parent=self),
+        )
+
+    def _run_profiled(self, name: str, callback: Callable[[], None]) -> None:
+        """Run action callback under profiler and show its summary.
+
+        Profiling stops as soon as the callback returns, so idle time of
+        the Qt event loop is not profiled. Only the next action is
+        profiled, the checkbox is unchecked afterwards.
+
+        Args:
+            name (str): Name of the profiled action.
+            callback (Callable[[], None]): Action to run.
+        """
+        profiler = ActionProfiler(name)
+        profiler.start()
+        try:
+            callback()
+        finally:
+            result = profiler.stop()
+            self._tools_widget.set_profile_enabled(False)
+
+        summary_dialog = MDProfileSummaryDialog(
+            result["summary"],
+            [result["prof_path"], result["collapsed_path"]],
+            self,
+        )
+        summary_dialog.show()
+
+
+class MDProfileSummaryDialog(QtWidgets.QDialog):
+    """Dialog showing summary of a profiled action."""
+    def __init__(
+            self,
+            summary: str,
+            filepaths: list[str],
+            parent: QtWidgets.QWidget | None = None):
+        """Profile summary dialog.
+
+        Args:
+            summary (str): Text summary of the hottest functions.
+            filepaths (list[str]): Paths to the saved profile files.
+            parent (QtWidgets.QWidget, optional): Parent widget.
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Ayon profile summary")
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+
+        files_label = QtWidgets.QLabel(
+            "Saved to:\n{}".format("\n".join(filepaths)), self)
+        files_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+
+        summary_view = QtWidgets.QPlainTextEdit(self)
+        summary_view.setReadOnly(True)
+        summary_view.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        summary_view.setFont(
+            QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+        summary_view.setPlainText(summary)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(files_label, 0)
+        layout.addWidget(summary_view, 1)
+        self.resize(900, 600)
 
 
 class WindowCache:
@@ -140,12 +238,16 @@ class WindowCache:
             cls.dialog.activateWindow()
 
 
-def show_tools_dialog() -> None:
+def show_tools_dialog() -> MDToolsDialog:
     """Show the Marvelous Designer tools dialog.
 
     Creates and shows the tools dialog if it doesn't exist or isn't visible.
     The dialog provides access to Ayon tools like loader, publisher, scene
     inventory, and workfiles management.
+
+    Returns:
+        MDToolsDialog: The tools dialog.
     """
     if not WindowCache.dialog or not WindowCache.dialog.isVisible():
         WindowCache.show_dialog()
+    return WindowCache.dialog
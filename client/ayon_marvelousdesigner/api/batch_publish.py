@@ -0,0 +1,291 @@
+"""Batch publishing of Marvelous Designer workfiles.
+
+Each workfile is published in its own headless session started by
+the worker command. By default it is a Python interpreter running
+`deploy/batch_publish_worker.py`, which works with a stand-in Marvelous
+Designer API on `md_api_path`. Sessions of Marvelous Designer itself
+can be used by a worker command running the same script inside it.
+
+Results of workfiles are appended to a JSONL log as soon as they finish,
+so an interrupted batch can be resumed and skips workfiles which were
+already published successfully.
+
+This module must not import Marvelous Designer modules on import, the
+batch is scheduled from the AYON launcher process.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
+
+from ayon_marvelousdesigner import MARVELOUS_DESIGNER_HOST_DIR
+from ayon_marvelousdesigner.addon import HEADLESS_ENV
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+# Environment variables passing the job to the worker session
+WORKFILE_ENV = "AYON_MD_BATCH_WORKFILE"
+RESULT_ENV = "AYON_MD_BATCH_RESULT"
+WORKER_SCRIPT = os.path.join(
+    MARVELOUS_DESIGNER_HOST_DIR, "deploy", "batch_publish_worker.py")
+DEFAULT_WORKER_COMMAND = "{python} {script}"
+
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+STATUS_ERROR = "error"
+
+
+def batch_publish(  # noqa: PLR0913
+        workfiles: list[str],
+        log_path: str,
+        *,
+        workers: int = 2,
+        resume: bool = True,
+        worker_command: Optional[str] = None,
+        md_api_path: Optional[str] = None,
+        timeout: Optional[float] = None) -> dict[str, int]:
+    """Publish workfiles in parallel worker sessions.
+
+    Args:
+        workfiles (list[str]): Paths to .zprj workfiles.
+        log_path (str): Path to JSONL log with result of each workfile.
+        workers (int): Number of sessions running at the same time.
+        resume (bool): Skip workfiles which were published successfully
+            according to the log and were not modified since.
+        worker_command (Optional[str]): Command starting a worker
+            session. `{python}`, `{script}`, `{workfile}` and `{result}`
+            are replaced by the interpreter, the worker script, the
+            workfile and the result file paths.
+        md_api_path (Optional[str]): Directory with Marvelous Designer
+            API modules added to `PYTHONPATH` of the worker, e.g. with
+            stand-in modules.
+        timeout (Optional[float]): Timeout of one workfile in seconds.
+
+    Returns:
+        dict[str, int]: Number of workfiles by status, including
+            `skipped` workfiles.
+    """
+    workfiles = list(dict.fromkeys(
+        os.path.abspath(path) for path in workfiles))
+    done = get_published_workfiles(log_path) if resume else {}
+    pending = []
+    summary = {"skipped": 0}
+    for workfile in workfiles:
+        mtime = _get_mtime(workfile)
+        if mtime is not None and done.get(workfile) == mtime:
+            summary["skipped"] += 1
+            continue
+        pending.append(workfile)
+
+    log.info(
+        "Publishing %d workfile(s) with %d worker(s), %d skipped.",
+        len(pending), workers, summary["skipped"]
+    )
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor, \
+            open(log_path, "a", encoding="utf-8") as log_file:
+        futures = {
+            executor.submit(
+                run_worker,
+                workfile,
+                worker_command=worker_command,
+                md_api_path=md_api_path,
+                timeout=timeout,
+            ): workfile
+            for workfile in pending
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            log_file.write(json.dumps(result) + "\n")
+            log_file.flush()
+            summary[result["status"]] = summary.get(result["status"], 0) + 1
+            log.info(
+                "%s: %s in %.1fs",
+                result["workfile"], result["status"], result["duration"]
+            )
+    return summary
+
+
+def get_published_workfiles(log_path: str) -> dict[str, float]:
+    """Get workfiles published successfully according to a JSONL log.
+
+    Args:
+        log_path (str): Path to JSONL log.
+
+    Returns:
+        dict[str, float]: Modification time of the workfile at the time
+            of the last successful publish by workfile path.
+    """
+    published = {}
+    if not os.path.exists(log_path):
+        return published
+    with open(log_path, encoding="utf-8") as log_file:
+        for line in log_file:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                # Last line might be incomplete after a crash
+                continue
+            if result.get("status") == STATUS_SUCCESS:
+                published[result["workfile"]] = result.get("mtime")
+            else:
+                published.pop(result.get("workfile"), None)
+    return published
+
+
+def run_worker(
+        workfile: str,
+        *,
+        worker_command: Optional[str] = None,
+        md_api_path: Optional[str] = None,
+        timeout: Optional[float] = None) -> dict:
+    """Publish a workfile in a worker session and get its result.
+
+    Args:
+        workfile (str): Path to the workfile.
+        worker_command (Optional[str]): Command starting the session,
+            see `batch_publish`.
+        md_api_path (Optional[str]): Directory with Marvelous Designer
+            API modules added to `PYTHONPATH` of the worker.
+        timeout (Optional[float]): Timeout in seconds.
+
+    Returns:
+        dict: Result of the workfile.
+    """
+    fd, result_path = tempfile.mkstemp(
+        prefix="ayon_md_batch_", suffix=".json")
+    os.close(fd)
+
+    env = dict(os.environ)
+    pythonpath = [os.path.dirname(MARVELOUS_DESIGNER_HOST_DIR)]
+    if md_api_path:
+        pythonpath.insert(0, md_api_path)
+    if env.get("PYTHONPATH"):
+        pythonpath.append(env["PYTHONPATH"])
+    env.update({
+        "PYTHONPATH": os.pathsep.join(pythonpath),
+        HEADLESS_ENV: "1",
+        WORKFILE_ENV: workfile,
+        RESULT_ENV: result_path,
+    })
+    placeholders = {
+        "{python}": sys.executable,
+        "{script}": WORKER_SCRIPT,
+        "{workfile}": workfile,  # noqa: RUF027
+        "{result}": result_path,
+    }
+    args = []
+    for arg in shlex.split(worker_command or DEFAULT_WORKER_COMMAND):
+        for placeholder, value in placeholders.items():
+            arg = arg.replace(placeholder, value)  # noqa: PLW2901
+        args.append(arg)
+
+    start = time.time()
+    result = {"workfile": workfile}
+    try:
+        process = subprocess.run(
+            args,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            check=False,
+        )
+        result.update(_read_result(result_path))
+        result["returncode"] = process.returncode
+        if process.returncode and result.get("status") == STATUS_SUCCESS:
+            result["status"] = STATUS_ERROR
+        if result.get("status") != STATUS_SUCCESS:
+            result["output"] = process.stdout[-4000:] + process.stderr[-4000:]
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        result.update({"status": STATUS_ERROR, "error": str(exc)})
+    finally:
+        if os.path.exists(result_path):
+            os.remove(result_path)
+    result.setdefault("status", STATUS_ERROR)
+    # Publish might save the workfile, resume compares the saved state
+    result["mtime"] = _get_mtime(workfile)
+    result["duration"] = time.time() - start
+    result["finishedAt"] = time.time()
+    return result
+
+
+def publish_workfile(workfile: str) -> dict:
+    """Open and publish a workfile in the current headless session.
+
+    Called in the worker session, imports Marvelous Designer and pyblish
+    modules.
+
+    Args:
+        workfile (str): Path to the workfile.
+
+    Returns:
+        dict: Status, published instances and errors of the publish.
+    """
+    import pyblish.api
+    import pyblish.util
+    from ayon_core.pipeline import install_host
+    from ayon_core.pipeline.create import CreateContext
+
+    from ayon_marvelousdesigner.api.pipeline import MarvelousDesignerHost
+
+    result = {"workfile": workfile, "status": STATUS_ERROR, "errors": []}
+    try:
+        host = MarvelousDesignerHost(headless=True)
+        install_host(host)
+        host.open_workfile(workfile)
+
+        create_context = CreateContext(host, headless=True)
+        context = pyblish.api.Context()
+        context.data["create_context"] = create_context
+        for plugin_result in pyblish.util.publish_iter(
+                context, create_context.publish_plugins):
+            error = plugin_result.get("error")
+            if error is None:
+                continue
+            instance = plugin_result.get("instance")
+            result["errors"].append({
+                "plugin": plugin_result["plugin"].__name__,
+                "instance": instance.name if instance is not None else None,
+                "message": str(error),
+            })
+
+        result["instances"] = [
+            {
+                "name": instance.name,
+                "productType": instance.data.get("productType"),
+                "publish": instance.data.get("publish", True),
+            }
+            for instance in context
+        ]
+        result["status"] = (
+            STATUS_FAILED if result["errors"] else STATUS_SUCCESS)
+    except Exception:  # noqa: BLE001
+        result["errors"].append({"message": traceback.format_exc()})
+    return result
+
+
+def _read_result(result_path: str) -> dict:
+    try:
+        with open(result_path, encoding="utf-8") as result_file:
+            return json.load(result_file)
+    except (OSError, json.JSONDecodeError):
+        return {
+            "status": STATUS_ERROR,
+            "error": "Worker session did not write a result.",
+        }
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
@@ -0,0 +1,304 @@
+"""Local index of representations loaded in Marvelous Designer workfiles.
+
+Containers stored in AYON metadata of scanned .zprj workfiles are kept in
+a SQLite database, so workfiles using a representation are found without
+opening them. The index is updated incrementally, only workfiles whose
+size or modification time changed since the last scan, or which failed
+to be read, are read again.
+
+This module must not import Marvelous Designer modules, it is used
+outside of Marvelous Designer.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
+
+from ayon_marvelousdesigner.api.zprj_metadata import (
+    SCAN_WORKERS,
+    find_zprj_files,
+    read_zprj_metadata,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+# Bump when the tables change, the index is rebuilt then
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workfiles (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    indexed_at REAL NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS dependencies (
+    workfile TEXT NOT NULL
+        REFERENCES workfiles(path) ON DELETE CASCADE,
+    representation_id TEXT NOT NULL,
+    project_name TEXT,
+    loader TEXT,
+    object_name TEXT
+);
+CREATE INDEX IF NOT EXISTS dependencies_representation
+    ON dependencies(representation_id);
+CREATE INDEX IF NOT EXISTS dependencies_workfile
+    ON dependencies(workfile);
+"""
+
+
+class DependencyIndex:
+    """SQLite index mapping workfiles to loaded representations and back."""
+
+    def __init__(self, db_path: str):
+        """Open the index, creating the database when it does not exist.
+
+        There is no default location, an index shared by unrelated
+        projects would report their workfiles as dependents.
+
+        Args:
+            db_path (str): Path to the SQLite database.
+        """
+        self.db_path = db_path
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+        self._connection = sqlite3.connect(db_path)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._ensure_schema()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def update(
+            self,
+            paths: Iterable[str],
+            max_workers: int = SCAN_WORKERS,
+            *,
+            prune: bool = True) -> dict[str, int]:
+        """Index .zprj workfiles which changed since the last update.
+
+        Args:
+            paths (Iterable[str]): Paths to .zprj files or directories
+                searched recursively.
+            max_workers (int): Number of workfiles read at the same time.
+            prune (bool): Remove indexed workfiles which no longer exist
+                in the scanned directories.
+
+        Returns:
+            dict[str, int]: Number of `scanned`, `updated`, `unchanged`,
+                `removed` and `failed` workfiles.
+        """
+        paths = [os.path.abspath(path) for path in paths]
+        # Workfiles which failed to be read are read again on every update
+        indexed = {
+            row["path"]: (row["mtime"], row["size"])
+            for row in self._connection.execute(
+                "SELECT path, mtime, size FROM workfiles"
+                " WHERE error IS NULL")
+        }
+        filepaths = [os.path.abspath(path) for path in find_zprj_files(paths)]
+        changed = []
+        for filepath in filepaths:
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                continue
+            signature = (stat.st_mtime, stat.st_size)
+            if indexed.get(filepath) != signature:
+                changed.append((filepath, signature))
+
+        summary = {
+            "scanned": len(filepaths),
+            "updated": 0,
+            "unchanged": len(filepaths) - len(changed),
+            "removed": 0,
+            "failed": 0,
+        }
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = executor.map(
+                _read_containers, [filepath for filepath, _ in changed])
+            with self._connection:
+                for (filepath, signature), (containers, error) in zip(
+                        changed, results):
+                    self._store(filepath, signature, containers, error)
+                    summary["failed" if error else "updated"] += 1
+
+        if prune:
+            summary["removed"] = self._prune(paths, set(filepaths))
+        log.debug("Dependency index update: %s", summary)
+        return summary
+
+    def get_workfiles(
+            self,
+            representation_id: str,
+            project_name: Optional[str] = None) -> list[dict]:
+        """Get workfiles which loaded a representation.
+
+        Args:
+            representation_id (str): Id of the representation.
+            project_name (Optional[str]): Limit results to a project.
+
+        Returns:
+            list[dict]: `workfile`, `loader` and `objectName` of each
+                container of the representation.
+        """
+        query = (
+            "SELECT workfile, loader, object_name FROM dependencies"
+            " WHERE representation_id = ?"
+        )
+        params = [representation_id]
+        if project_name:
+            query += " AND project_name = ?"
+            params.append(project_name)
+        query += " ORDER BY workfile"
+        return [
+            {
+                "workfile": row["workfile"],
+                "loader": row["loader"],
+                "objectName": row["object_name"],
+            }
+            for row in self._connection.execute(query, params)
+        ]
+
+    def get_workfiles_by_representation(
+            self, representation_ids: Iterable[str]) -> dict[str, list[str]]:
+        """Get workfiles which loaded any of representations.
+
+        Args:
+            representation_ids (Iterable[str]): Ids of representations.
+
+        Returns:
+            dict[str, list[str]]: Workfile paths by representation id.
+        """
+        representation_ids = list(set(representation_ids))
+        output = {repre_id: [] for repre_id in representation_ids}
+        for row in self._execute_in(
+                "SELECT DISTINCT representation_id, workfile"
+                " FROM dependencies WHERE representation_id IN ({})"
+                " ORDER BY workfile",
+                representation_ids):
+            output[row["representation_id"]].append(row["workfile"])
+        return output
+
+    def get_representations(self, workfile: str) -> list[dict]:
+        """Get representations loaded in a workfile.
+
+        Args:
+            workfile (str): Path to the workfile.
+
+        Returns:
+            list[dict]: `representation`, `project_name`, `loader` and
+                `objectName` of each container in the workfile.
+        """
+        return [
+            {
+                "representation": row["representation_id"],
+                "project_name": row["project_name"],
+                "loader": row["loader"],
+                "objectName": row["object_name"],
+            }
+            for row in self._connection.execute(
+                "SELECT representation_id, project_name, loader, object_name"
+                " FROM dependencies WHERE workfile = ?",
+                (os.path.abspath(workfile),))
+        ]
+
+    def _ensure_schema(self) -> None:
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        with self._connection:
+            if version != SCHEMA_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS dependencies")
+                self._connection.execute("DROP TABLE IF EXISTS workfiles")
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _store(
+            self,
+            filepath: str,
+            signature: tuple[float, int],
+            containers: list[dict],
+            error: Optional[str]) -> None:
+        mtime, size = signature
+        self._connection.execute(
+            "DELETE FROM dependencies WHERE workfile = ?", (filepath,))
+        self._connection.execute(
+            "INSERT OR REPLACE INTO workfiles"
+            " (path, mtime, size, indexed_at, error) VALUES (?, ?, ?, ?, ?)",
+            (filepath, mtime, size, time.time(), error))
+        self._connection.executemany(
+            "INSERT INTO dependencies (workfile, representation_id,"
+            " project_name, loader, object_name) VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    filepath,
+                    container["representation"],
+                    container.get("project_name"),
+                    container.get("loader"),
+                    container.get("objectName"),
+                )
+                for container in containers
+                if container.get("representation")
+            ],
+        )
+
+    def _prune(self, paths: list[str], found: set[str]) -> int:
+        roots = tuple(
+            os.path.join(path, "") for path in paths if os.path.isdir(path))
+        removed = [
+            row["path"]
+            for row in self._connection.execute("SELECT path FROM workfiles")
+            if row["path"] not in found
+            and (row["path"].startswith(roots) or row["path"] in paths)
+            and not os.path.exists(row["path"])
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM workfiles WHERE path = ?",
+                [(path,) for path in removed])
+        return len(removed)
+
+    def _execute_in(
+            self, query: str, values: list[str]) -> list[sqlite3.Row]:
+        # Stay below SQLite limit of variables in one statement
+        rows = []
+        for start in range(0, len(values), 500):
+            chunk = values[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows.extend(self._connection.execute(
+                query.format(placeholders), chunk))
+        return rows
+
+
+def _read_containers(filepath: str) -> tuple[list[dict], Optional[str]]:
+    """Read containers of a workfile.
+
+    Returns:
+        tuple[list[dict], Optional[str]]: Containers and error message if
+            the workfile couldn't be read.
+    """
+    try:
+        metadata = read_zprj_metadata(filepath) or {}
+    except Exception as exc:  # noqa: BLE001
+        log.warning("Failed to read metadata of %s: %s", filepath, exc)
+        return [], str(exc)
+    containers = (
+        metadata.get("ayon_containers") if isinstance(metadata, dict)
+        else None
+    )
+    if not isinstance(containers, list):
+        return [], None
+    return [
+        container for container in containers
+        if isinstance(container, dict)
+    ], None
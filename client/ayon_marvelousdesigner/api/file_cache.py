@@ -0,0 +1,442 @@
+"""Local read-through cache for published representation files.
+
+Marvelous Designer reads imported files on its UI thread, so importing
+large caches straight from network storage blocks the application.
+Files are copied once to a local cache directory and imported from there.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Optional
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+# Marker file written once an entry is fully copied. Its modification
+# time is the last access time used for LRU eviction.
+COMPLETE_MARKER = ".complete"
+# Buffer size used when copying a chunk
+COPY_BUFFER_SIZE = 1024 * 1024
+# Suffix of the file storing content digest next to a cached copy
+DIGEST_SUFFIX = ".sha256"
+
+
+class LocalFileCache:
+    """Size-bounded local cache of published files with LRU eviction.
+
+    Entries are keyed by representation id and a signature of the source
+    file, so a republished file never returns a stale copy. Published
+    files are immutable, which makes file size and modification time
+    a sufficient content signature without reading the file over network.
+
+    Each entry lives in its own directory and is marked complete only
+    after the copy finished, so multiple Marvelous Designer sessions can
+    share one cache directory.
+    """
+
+    def __init__(
+            self,
+            cache_dir: str,
+            max_size: int,
+            copy_workers: int = 4,
+            chunk_size: int = 64 * 1024 * 1024):
+        """Initialize the cache.
+
+        Args:
+            cache_dir (str): Root directory of the cache.
+            max_size (int): Size quota of the cache in bytes.
+            copy_workers (int): Number of threads copying chunks of a file.
+            chunk_size (int): Size of a chunk copied by one thread in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.copy_workers = max(1, copy_workers)
+        self.chunk_size = max(COPY_BUFFER_SIZE, chunk_size)
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "bytes_saved": 0,
+            "bytes_copied": 0,
+        }
+
+    def get(self, file_path: str, representation_id: str) -> str:
+        """Get local copy of a file, copying it into the cache on a miss.
+
+        Args:
+            file_path (str): Path to the published file.
+            representation_id (str): Id of the representation of the file.
+
+        Returns:
+            str: Path to the local copy of the file.
+        """
+        return self._get(file_path, representation_id, evict=True)
+
+    def _get(
+            self,
+            file_path: str,
+            representation_id: str,
+            *,
+            evict: bool) -> str:
+        stat = os.stat(file_path)
+        local_path, hit = self._get_entry(
+            self.get_key(representation_id, stat),
+            file_path,
+            lambda src, dst: self._copy_file(src, dst, stat.st_size),
+            evict=evict,
+        )
+        if hit:
+            self._add_stats(hits=1, bytes_saved=stat.st_size)
+        else:
+            self._add_stats(misses=1, bytes_copied=stat.st_size)
+        return local_path
+
+    def get_derived(
+            self,
+            file_path: str,
+            representation_id: str,
+            variant: str,
+            producer: Callable[[str, str], None]) -> str:
+        """Get a file derived from a published file, producing it on a miss.
+
+        Derived files, like a trimmed copy of a cache, are stored next to
+        the plain copies and are evicted the same way.
+
+        Args:
+            file_path (str): Path to the source file.
+            representation_id (str): Id of the representation of the file.
+            variant (str): Identifier of the derivation, e.g. its options.
+            producer (Callable[[str, str], None]): Function writing the
+                derived file from the source path to the destination path.
+
+        Returns:
+            str: Path to the derived file.
+        """
+        stat = os.stat(file_path)
+        local_path, hit = self._get_entry(
+            self.get_key(f"{representation_id}:{variant}", stat),
+            file_path,
+            producer,
+            evict=True,
+        )
+        self._add_stats(**({"hits": 1} if hit else {"misses": 1}))
+        return local_path
+
+    def get_many(
+            self,
+            items: list[tuple[str, str]],
+            max_workers: int = 4) -> dict[str, str]:
+        """Get local copies of multiple files concurrently.
+
+        Files which cannot be cached are mapped to their original path.
+        The cache is evicted once all files are fetched, keeping all of
+        them, so a file fetched by one thread is never removed by
+        eviction in another one before it is imported.
+
+        Args:
+            items (list[tuple[str, str]]): Pairs of file path and
+                representation id.
+            max_workers (int): Number of files fetched at the same time.
+
+        Returns:
+            dict[str, str]: Local file paths mapped by original paths.
+        """
+        unique_items = dict(items)
+        local_paths = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(
+                    self._get, file_path, representation_id, evict=False
+                ): file_path
+                for file_path, representation_id in unique_items.items()
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    local_paths[file_path] = future.result()
+                except OSError:
+                    log.warning(
+                        "Failed to cache %s, using the original path.",
+                        file_path, exc_info=True
+                    )
+                    local_paths[file_path] = file_path
+        self.evict(keep={
+            os.path.dirname(local_path)
+            for file_path, local_path in local_paths.items()
+            if local_path != file_path
+        })
+        return local_paths
+
+    def get_digest(self, local_path: str) -> Optional[str]:
+        """Get content digest stored next to a cached copy.
+
+        Args:
+            local_path (str): Path to the cached copy.
+
+        Returns:
+            Optional[str]: Stored digest, None if the file is not in the
+                cache or has no digest yet.
+        """
+        digest_path = self._get_digest_path(local_path)
+        if digest_path is None:
+            return None
+        try:
+            digest = Path(digest_path).read_text(encoding="utf-8")
+        except OSError:
+            return None
+        return digest.strip() or None
+
+    def set_digest(self, local_path: str, digest: str) -> None:
+        """Store content digest next to a cached copy.
+
+        Entries are immutable, so the digest is valid for the lifetime of
+        the entry and is evicted together with it.
+
+        Args:
+            local_path (str): Path to the cached copy.
+            digest (str): Digest of the file content.
+        """
+        digest_path = self._get_digest_path(local_path)
+        if digest_path is None:
+            return
+        tmp_path = f"{digest_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            Path(tmp_path).write_text(digest, encoding="utf-8")
+            os.replace(tmp_path, digest_path)
+        except OSError:
+            log.debug("Failed to store digest of %s.", local_path)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _get_digest_path(self, local_path: str) -> Optional[str]:
+        entry_dir = os.path.dirname(os.path.abspath(local_path))
+        if os.path.dirname(entry_dir) != os.path.abspath(self.cache_dir):
+            return None
+        return f"{os.path.abspath(local_path)}{DIGEST_SUFFIX}"
+
+    def evict(self, keep: Optional[set] = None) -> None:
+        """Remove least recently used entries until the quota is met.
+
+        Args:
+            keep (Optional[set]): Entry directories which must not be
+                removed.
+        """
+        keep = keep or set()
+        with self._evict_lock:
+            self._evict(keep)
+
+    def _evict(self, keep: set) -> None:
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.is_dir():
+                continue
+            marker = os.path.join(entry.path, COMPLETE_MARKER)
+            try:
+                last_access = os.path.getmtime(marker)
+            except OSError:
+                # Entry is being copied by another session
+                continue
+            size = sum(
+                item.stat().st_size
+                for item in os.scandir(entry.path)
+                if item.is_file()
+            )
+            total_size += size
+            entries.append((last_access, size, entry.path))
+
+        entries.sort()
+        for _, size, entry_dir in entries:
+            if total_size <= self.max_size:
+                break
+            if entry_dir in keep:
+                continue
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+            log.debug("Evicted %s from local cache.", entry_dir)
+
+    def get_stats(self) -> dict:
+        """Get cache statistics.
+
+        Returns:
+            dict: Hits, misses, hit rate, bytes saved and bytes copied.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        requests = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / requests if requests else 0.0
+        return stats
+
+    def log_stats(self, logger: logging.Logger) -> None:
+        """Log cache statistics.
+
+        Args:
+            logger (logging.Logger): Logger to report to.
+        """
+        stats = self.get_stats()
+        logger.info(
+            "Local cache: %d hit(s), %d miss(es), hit rate %.0f%%, "
+            "%.1f MB saved, %.1f MB copied.",
+            stats["hits"],
+            stats["misses"],
+            stats["hit_rate"] * 100,
+            stats["bytes_saved"] / (1024 * 1024),
+            stats["bytes_copied"] / (1024 * 1024),
+        )
+
+    @staticmethod
+    def get_key(representation_id: str, stat: os.stat_result) -> str:
+        """Get cache key of a file.
+
+        Args:
+            representation_id (str): Id of the representation of the file.
+            stat (os.stat_result): Stat of the source file.
+
+        Returns:
+            str: Cache key.
+        """
+        signature = f"{representation_id}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.sha1(
+            signature.encode(), usedforsecurity=False).hexdigest()
+
+    def _get_entry(
+            self,
+            key: str,
+            file_path: str,
+            producer: Callable[[str, str], None],
+            *,
+            evict: bool) -> tuple[str, bool]:
+        """Get path of a cache entry, producing it when missing.
+
+        The entry is produced into a temporary file which is renamed into
+        place, so a partially written file is never returned.
+
+        Args:
+            key (str): Cache key of the entry.
+            file_path (str): Path to the source file.
+            producer (Callable[[str, str], None]): Function writing the
+                entry file from the source path to the destination path.
+            evict (bool): Evict the cache after a new entry was added.
+
+        Returns:
+            tuple[str, bool]: Path to the entry file and whether it
+                already existed.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        local_path = os.path.join(entry_dir, os.path.basename(file_path))
+        marker = os.path.join(entry_dir, COMPLETE_MARKER)
+
+        if os.path.exists(marker) and os.path.exists(local_path):
+            os.utime(marker)
+            return local_path, True
+
+        os.makedirs(entry_dir, exist_ok=True)
+        root, ext = os.path.splitext(local_path)
+        tmp_path = f"{root}.{uuid.uuid4().hex}.tmp{ext}"
+        try:
+            producer(file_path, tmp_path)
+            os.replace(tmp_path, local_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        with open(marker, "w", encoding="utf-8"):
+            pass
+
+        if evict:
+            self.evict(keep={entry_dir})
+        return local_path, False
+
+    def _copy_file(self, src_path: str, dst_path: str, size: int) -> None:
+        """Copy file in chunks using multiple threads.
+
+        Args:
+            src_path (str): Source file path.
+            dst_path (str): Destination file path.
+            size (int): Size of the source file in bytes.
+        """
+        with open(dst_path, "wb") as dst_file:
+            dst_file.truncate(size)
+
+        offsets = range(0, size, self.chunk_size)
+        if len(offsets) <= 1 or self.copy_workers == 1:
+            for offset in offsets:
+                _copy_chunk(src_path, dst_path, offset, self.chunk_size)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.copy_workers) as executor:
+            futures = [
+                executor.submit(
+                    _copy_chunk, src_path, dst_path, offset, self.chunk_size)
+                for offset in offsets
+            ]
+            for future in futures:
+                future.result()
+
+    def _add_stats(self, **values: int) -> None:
+        with self._lock:
+            for key, value in values.items():
+                self._stats[key] += value
+
+
+def _copy_chunk(
+        src_path: str, dst_path: str, offset: int, length: int) -> None:
+    """Copy a byte range of a file into the same range of another file.
+
+    Args:
+        src_path (str): Source file path.
+        dst_path (str): Destination file path.
+        offset (int): Start of the range.
+        length (int): Length of the range.
+    """
+    with open(src_path, "rb") as src_file, open(dst_path, "r+b") as dst_file:
+        src_file.seek(offset)
+        dst_file.seek(offset)
+        remaining = length
+        while remaining > 0:
+            data = src_file.read(min(COPY_BUFFER_SIZE, remaining))
+            if not data:
+                break
+            dst_file.write(data)
+            remaining -= len(data)
+
+
+_CACHES: dict[str, LocalFileCache] = {}
+
+
+def get_file_cache(cache_settings: dict) -> Optional[LocalFileCache]:
+    """Get shared local file cache configured by project settings.
+
+    Args:
+        cache_settings (dict): `load/local_cache` project settings.
+
+    Returns:
+        Optional[LocalFileCache]: Cache or None if caching is disabled.
+    """
+    if not cache_settings.get("enabled"):
+        return None
+
+    cache_dir = cache_settings.get("cache_dir") or os.path.join(
+        tempfile.gettempdir(), "ayon_marvelousdesigner_cache")
+    cache_dir = os.path.normpath(os.path.expandvars(cache_dir))
+    cache = _CACHES.get(cache_dir)
+    if cache is None:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache = LocalFileCache(cache_dir, 0)
+        _CACHES[cache_dir] = cache
+
+    # Apply current settings to the shared instance
+    cache.max_size = int(cache_settings.get("max_size_gb", 20) * 1024 ** 3)
+    cache.copy_workers = max(1, cache_settings.get("copy_workers", 4))
+    cache.chunk_size = max(
+        COPY_BUFFER_SIZE,
+        int(cache_settings.get("chunk_size_mb", 64) * 1024 * 1024)
+    )
+    return cache
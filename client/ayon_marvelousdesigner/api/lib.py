@@ -0,0 +1,646 @@
+"""Library functions for Marvelous Designer integration."""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Optional
+
+# Marvelous Designer modules
+import avatar_api
+import fabric_api
+from ayon_core.pipeline import registered_host
+
+from ayon_marvelousdesigner.api.file_cache import LocalFileCache
+from ayon_marvelousdesigner.api.pipeline import (
+    AYON_CONTAINERS,
+    get_unique_object_name,
+    ls,
+    set_metadata,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import pyblish.api
+    from ayon_core.host import HostBase
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+# Read files in 1 MiB chunks when hashing
+HASH_CHUNK_SIZE = 1024 * 1024
+# Default number of threads copying files to local storage
+PREFETCH_WORKERS = 4
+
+# Content hashes of published files by their local file cache key
+_published_file_hashes: dict[str, str] = {}
+
+
+def get_file_hash(filepath: str) -> str:
+    """Get SHA-256 hash of file content.
+
+    Args:
+        filepath (str): Path to the file.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    file_hash = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_published_file_hash(
+        file_path: str,
+        local_path: str,
+        representation_id: str,
+        file_cache: Optional[LocalFileCache]) -> str:
+    """Get SHA-256 hash of a published file, reading it at most once.
+
+    Published files are immutable, so the hash is memoized by the local
+    file cache key of the published file, built from representation id,
+    file size and modification time. When the local copy is in the file
+    cache, the hash is also stored next to it and reused by other
+    sessions.
+
+    Args:
+        file_path (str): Path to the published file.
+        local_path (str): Path to the local copy of the file to hash.
+        representation_id (str): Id of the representation of the file.
+        file_cache (Optional[LocalFileCache]): Local file cache or None
+            if caching is disabled.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    key = LocalFileCache.get_key(representation_id, os.stat(file_path))
+    file_hash = _published_file_hashes.get(key)
+    if file_hash is not None:
+        return file_hash
+
+    if file_cache is not None:
+        file_hash = file_cache.get_digest(local_path)
+    if file_hash is None:
+        file_hash = get_file_hash(local_path)
+        if file_cache is not None:
+            file_cache.set_digest(local_path, file_hash)
+    _published_file_hashes[key] = file_hash
+    return file_hash
+
+
+def prefetch_files(
+        file_paths: list[str],
+        staging_dir: str,
+        max_workers: int = PREFETCH_WORKERS) -> dict[str, str]:
+    """Copy files concurrently to local storage.
+
+    Files which fail to copy are mapped to their original path, so the
+    caller can still import them directly.
+
+    Args:
+        file_paths (list[str]): Paths of the files to copy.
+        staging_dir (str): Directory to copy the files to, owned by
+            the caller.
+        max_workers (int): Maximum number of concurrent copies.
+
+    Returns:
+        dict[str, str]: Local file paths mapped by the original paths.
+    """
+    unique_paths = list(dict.fromkeys(file_paths))
+    if not unique_paths:
+        return {}
+
+    def _copy(src_path: str) -> str:
+        # Keep files with the same name from different folders apart
+        subdir = hashlib.sha1(
+            src_path.encode(), usedforsecurity=False).hexdigest()[:8]
+        dst_dir = os.path.join(staging_dir, subdir)
+        os.makedirs(dst_dir, exist_ok=True)
+        dst_path = os.path.join(dst_dir, os.path.basename(src_path))
+        shutil.copyfile(src_path, dst_path)
+        return dst_path
+
+    local_paths = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_copy, file_path): file_path
+            for file_path in unique_paths
+        }
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                local_paths[file_path] = future.result()
+            except OSError:
+                log.warning(
+                    "Failed to prefetch %s, using the original path.",
+                    file_path, exc_info=True
+                )
+                local_paths[file_path] = file_path
+    return local_paths
+
+
+def get_local_file(
+        file_path: str,
+        representation_id: str,
+        file_cache: Optional[LocalFileCache]) -> str:
+    """Get local copy of a published file to import.
+
+    Args:
+        file_path (str): Path to the published file.
+        representation_id (str): Id of the representation of the file.
+        file_cache (Optional[LocalFileCache]): Local file cache or None
+            if caching is disabled.
+
+    Returns:
+        str: Path to the local copy, or the original path if the file
+            is not cached.
+    """
+    if file_cache is None:
+        return file_path
+    try:
+        return file_cache.get(file_path, representation_id)
+    except OSError:
+        log.warning(
+            "Failed to cache %s, using the original path.",
+            file_path, exc_info=True
+        )
+        return file_path
+
+
+@contextlib.contextmanager
+def local_files(
+        items: list[tuple[str, str]],
+        file_cache: Optional[LocalFileCache]) -> Iterator[dict[str, str]]:
+    """Get local copies of multiple published files concurrently.
+
+    Files are fetched through the local file cache when enabled, otherwise
+    they are prefetched to a temporary directory which is removed when
+    the block exits, so files must be imported inside of it.
+
+    Args:
+        items (list[tuple[str, str]]): Pairs of file path and
+            representation id.
+        file_cache (Optional[LocalFileCache]): Local file cache or None
+            if caching is disabled.
+
+    Yields:
+        dict[str, str]: Local file paths mapped by original paths.
+    """
+    if file_cache is not None:
+        yield file_cache.get_many(items)
+        return
+
+    staging_dir = tempfile.mkdtemp(prefix="ayon_md_prefetch_")
+    try:
+        yield prefetch_files(
+            [file_path for file_path, _ in items], staging_dir)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def get_avatar_names() -> list[str]:
+    """Get names of all avatars in the current scene.
+
+    Returns:
+        list[str]: Avatar names ordered by avatar index.
+    """
+    return [
+        avatar_api.GetAvatarName(index)
+        for index in range(avatar_api.GetAvatarCount())
+    ]
+
+
+def delete_avatars(avatar_names: list[str]) -> list[str]:
+    """Delete avatars with the given names from the current scene.
+
+    Avatar indices shift after each deletion, so the index of every
+    avatar is looked up right before it is deleted.
+
+    Args:
+        avatar_names (list[str]): Names of the avatars to delete.
+
+    Returns:
+        list[str]: Names of avatars which could not be deleted.
+    """
+    delete_avatar = getattr(avatar_api, "DeleteAvatar", None)
+    if delete_avatar is None:
+        log.warning(
+            "Deleting avatars is not supported by this version of "
+            "Marvelous Designer."
+        )
+        return list(avatar_names)
+
+    not_deleted = []
+    for avatar_name in avatar_names:
+        current_names = get_avatar_names()
+        if avatar_name not in current_names:
+            not_deleted.append(avatar_name)
+            continue
+        delete_avatar(current_names.index(avatar_name))
+    return not_deleted
+
+
+def get_fabric_fingerprint(name: str, occurrence: int = 0) -> str:
+    """Get a cheap fingerprint identifying a fabric in the scene.
+
+    The fingerprint does not depend on the fabric index, so it stays the
+    same when fabrics are added or removed before it.
+
+    Args:
+        name (str): Fabric name.
+        occurrence (int): How many fabrics with the same name precede
+            this one in the fabric list.
+
+    Returns:
+        str: Fabric fingerprint.
+    """
+    key = f"{name}:{occurrence}".encode()
+    return hashlib.sha1(key, usedforsecurity=False).hexdigest()[:12]
+
+
+def get_fabrics() -> list[dict]:
+    """Enumerate all fabrics in the current scene in a single pass.
+
+    Returns:
+        list[dict]: Fabric entries with `index`, `name` and `fingerprint`
+            keys ordered by fabric index.
+    """
+    fabrics = []
+    name_counts: dict[str, int] = {}
+    for index in range(fabric_api.GetFabricCount()):
+        name = fabric_api.GetFabricName(index)
+        occurrence = name_counts.get(name, 0)
+        name_counts[name] = occurrence + 1
+        fabrics.append({
+            "index": index,
+            "name": name,
+            "fingerprint": get_fabric_fingerprint(name, occurrence),
+        })
+    return fabrics
+
+
+def get_fabric_by_index(
+        fabrics: list[dict], fabric_index: int) -> Optional[dict]:
+    """Find fabric entry with the given index in a fabric snapshot.
+
+    Args:
+        fabrics (list[dict]): Fabric entries from `get_fabrics`.
+        fabric_index (int): Fabric index to look for.
+
+    Returns:
+        Optional[dict]: Fabric entry or None if the index is not in
+            the snapshot.
+    """
+    if 0 <= fabric_index < len(fabrics):
+        fabric = fabrics[fabric_index]
+        if fabric["index"] == fabric_index:
+            return fabric
+    return next(
+        (fabric for fabric in fabrics if fabric["index"] == fabric_index),
+        None
+    )
+
+
+def get_context_fabrics(context: pyblish.api.Context) -> list[dict]:
+    """Get fabric list of the scene snapshot of the publish context.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        list[dict]: Fabric entries from `get_fabrics`.
+    """
+    return get_context_snapshot(context)["fabrics"]
+
+
+# Getters of scene snapshot values which are queried from the host
+_SNAPSHOT_GETTERS: dict[str, Callable[[HostBase], object]] = {
+    "currentFile": lambda host: host.get_current_workfile(),
+    "hasUnsavedChanges": lambda host: host.workfile_has_unsaved_changes(),
+    "fabrics": lambda _host: get_fabrics(),
+}
+# Snapshot values derived from the current file
+_SNAPSHOT_FILE_KEYS = ("fileSize", "fileMtime")
+
+
+def get_scene_snapshot(keys: Optional[Iterable[str]] = None) -> dict:
+    """Query state of the scene from the host.
+
+    Snapshot keys:
+        currentFile (str): Path of the current workfile.
+        hasUnsavedChanges (bool): Whether the scene has unsaved changes.
+        fabrics (list[dict]): Fabric entries from `get_fabrics`.
+        fileSize (Optional[int]): Size of the workfile on disk in bytes.
+        fileMtime (Optional[float]): Modification time of the workfile.
+
+    Args:
+        keys (Optional[Iterable[str]]): Keys to query, all when not set.
+            File size and modification time are queried together with
+            the current file.
+
+    Returns:
+        dict: Snapshot values by key.
+    """
+    keys = set(_SNAPSHOT_GETTERS) if keys is None else set(keys)
+    if keys.intersection(_SNAPSHOT_FILE_KEYS):
+        keys.add("currentFile")
+
+    host = registered_host()
+    snapshot = {
+        key: getter(host)
+        for key, getter in _SNAPSHOT_GETTERS.items()
+        if key in keys
+    }
+    if "currentFile" in snapshot:
+        try:
+            stat = os.stat(snapshot["currentFile"])
+        except (OSError, TypeError):
+            snapshot.update(dict.fromkeys(_SNAPSHOT_FILE_KEYS))
+        else:
+            snapshot["fileSize"] = stat.st_size
+            snapshot["fileMtime"] = stat.st_mtime
+    return snapshot
+
+
+def get_context_snapshot(context: pyblish.api.Context) -> dict:
+    """Get scene snapshot collected into the publish context.
+
+    Falls back to querying the host when the snapshot was not collected
+    yet and stores the result for the following plugins.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        dict: Scene snapshot, see `get_scene_snapshot`.
+    """
+    snapshot = context.data.get("sceneSnapshot")
+    if snapshot is None:
+        snapshot = get_scene_snapshot()
+        context.data["sceneSnapshot"] = snapshot
+    return snapshot
+
+
+def invalidate_context_snapshot(
+        context: pyblish.api.Context, keys: Iterable[str]) -> dict:
+    """Query selected values of the context scene snapshot again.
+
+    Used after a plugin changed the scene or the workfile, so only the
+    affected values are queried from the host.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+        keys (Iterable[str]): Snapshot keys to query again.
+
+    Returns:
+        dict: Updated scene snapshot.
+    """
+    snapshot = get_context_snapshot(context)
+    snapshot.update(get_scene_snapshot(keys))
+    return snapshot
+
+
+class FabricRegistry:
+    """Registry of fabrics loaded into the scene by AYON containers.
+
+    Maps container `objectName` to the fabric name and file hash it was
+    loaded with. `fabric_api.DeleteFabric` shifts indices of all following
+    fabrics, so stored `fabricIndex` values can drift. The registry
+    re-resolves them with one enumeration of the scene fabrics and
+    writes all containers back in a single metadata write.
+    """
+
+    def __init__(self, containers: list[dict]):
+        """Initialize the registry.
+
+        Args:
+            containers (list[dict]): All AYON containers of the scene.
+        """
+        self._containers = containers
+        self._changed = False
+
+    @classmethod
+    def from_scene(cls) -> FabricRegistry:
+        """Create registry from containers stored in the current scene.
+
+        Returns:
+            FabricRegistry: Registry with the scene containers.
+        """
+        return cls(ls())
+
+    @property
+    def containers(self) -> list[dict]:
+        """All containers tracked by the registry."""
+        return self._containers
+
+    def get_fabric_containers(self) -> list[dict]:
+        """Get containers which loaded a fabric.
+
+        Returns:
+            list[dict]: Containers with a `fabricIndex`.
+        """
+        return [
+            container for container in self._containers
+            if container.get("fabricIndex") is not None
+        ]
+
+    def get(self, object_name: str) -> Optional[dict]:
+        """Get container by its object name.
+
+        Args:
+            object_name (str): Container object name.
+
+        Returns:
+            Optional[dict]: Container data or None if not found.
+        """
+        return next(
+            (
+                container for container in self._containers
+                if container.get("objectName") == object_name
+            ),
+            None
+        )
+
+    def add(self, container: dict) -> dict:
+        """Add a new container to the registry.
+
+        Args:
+            container (dict): Container data built by `get_container_data`.
+
+        Returns:
+            dict: Added container with a unique object name.
+        """
+        existing_names = {
+            existing.get("objectName") for existing in self._containers
+        }
+        container["objectName"] = get_unique_object_name(
+            container["objectName"], existing_names)
+        self._containers.append(container)
+        self._changed = True
+        return container
+
+    def update(self, object_name: str, data: dict) -> None:
+        """Update data of a container.
+
+        Args:
+            object_name (str): Container object name.
+            data (dict): Data to update the container with.
+        """
+        container = self.get(object_name)
+        if container is None:
+            log.warning(
+                "No container found for object %s to imprint data.",
+                object_name
+            )
+            return
+        container.update(data)
+        self._changed = True
+
+    def get_references(self, fabric_index: int) -> list[dict]:
+        """Get containers referencing the fabric with the given index.
+
+        Args:
+            fabric_index (int): Fabric index.
+
+        Returns:
+            list[dict]: Containers which use the fabric.
+        """
+        return [
+            container for container in self.get_fabric_containers()
+            if container["fabricIndex"] == fabric_index
+        ]
+
+    def find_loaded(
+            self,
+            representation_id: Optional[str] = None,
+            file_hash: Optional[str] = None) -> Optional[dict]:
+        """Find a container which already loaded the same fabric.
+
+        Containers are matched by representation id first and by the
+        content hash of the loaded file second.
+
+        Args:
+            representation_id (Optional[str]): Representation id.
+            file_hash (Optional[str]): Hash of the fabric file.
+
+        Returns:
+            Optional[dict]: Matching container or None.
+        """
+        by_representation = {}
+        by_hash = {}
+        for container in self.get_fabric_containers():
+            by_representation.setdefault(
+                container.get("representation"), container)
+            if container.get("fabricHash"):
+                by_hash.setdefault(container["fabricHash"], container)
+
+        if representation_id and representation_id in by_representation:
+            return by_representation[representation_id]
+        if file_hash:
+            return by_hash.get(file_hash)
+        return None
+
+    def remove(self, object_name: str, *, fabric_deleted: bool = True) -> None:
+        """Remove container from the registry.
+
+        Args:
+            object_name (str): Container object name.
+            fabric_deleted (bool): Whether the fabric of the container was
+                deleted from the scene, shifting indices of the following
+                fabrics.
+        """
+        container = self.get(object_name)
+        if container is None:
+            return
+        self._containers.remove(container)
+        self._changed = True
+
+        deleted_index = container.get("fabricIndex")
+        if not fabric_deleted or deleted_index is None:
+            return
+        for other in self.get_fabric_containers():
+            if other["fabricIndex"] > deleted_index:
+                other["fabricIndex"] -= 1
+
+    def resolve(self, fabrics: Optional[list[dict]] = None) -> list[dict]:
+        """Re-resolve fabric indices of containers by fabric name.
+
+        Containers whose stored index still points to a fabric with the
+        expected name are kept. The others are grouped by their stored
+        index and fabric name, so containers sharing a fabric stay on one
+        fabric, and each group is matched to the nearest fabric with the
+        same name not claimed by another group.
+
+        Args:
+            fabrics (Optional[list[dict]]): Fabric snapshot from
+                `get_fabrics`. Scene fabrics are enumerated if not passed.
+
+        Returns:
+            list[dict]: Containers whose fabric index was changed.
+        """
+        fabric_containers = [
+            container for container in self.get_fabric_containers()
+            if container.get("fabricName")
+        ]
+        if not fabric_containers:
+            return []
+
+        if fabrics is None:
+            fabrics = get_fabrics()
+
+        indices_by_name: dict[str, list[int]] = {}
+        for fabric in fabrics:
+            indices_by_name.setdefault(fabric["name"], []).append(
+                fabric["index"])
+
+        # Containers sharing a fabric are resolved together to one index
+        claimed = set()
+        unresolved: dict[tuple[int, str], list[dict]] = {}
+        for container in fabric_containers:
+            fabric = get_fabric_by_index(fabrics, container["fabricIndex"])
+            fabric_name = container["fabricName"]
+            if fabric is not None and fabric["name"] == fabric_name:
+                claimed.add(fabric["index"])
+            else:
+                unresolved.setdefault(
+                    (container["fabricIndex"], fabric_name), []
+                ).append(container)
+
+        changed = []
+        for (old_index, fabric_name), containers in unresolved.items():
+            candidates = [
+                index
+                for index in indices_by_name.get(fabric_name, [])
+                if index not in claimed
+            ]
+            if not candidates:
+                log.warning(
+                    "Fabric '%s' of container(s) %s not found in the scene.",
+                    fabric_name,
+                    ", ".join(
+                        container["objectName"] for container in containers)
+                )
+                continue
+            new_index = min(
+                candidates, key=lambda index: abs(index - old_index))
+            claimed.add(new_index)
+            for container in containers:
+                container["fabricIndex"] = new_index
+            changed.extend(containers)
+
+        if changed:
+            self._changed = True
+        return changed
+
+    def write(self) -> None:
+        """Write containers to the scene metadata if anything changed."""
+        if not self._changed:
+            return
+        set_metadata(AYON_CONTAINERS, self._containers)
+        self._changed = False
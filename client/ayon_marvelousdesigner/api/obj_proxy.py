@@ -0,0 +1,202 @@
+"""Decimated OBJ proxies for fast preview loading.
+
+Proxies are produced by vertex clustering: vertices are snapped to a
+uniform grid, all vertices in a grid cell are merged into their centroid
+and faces collapsing to less than three vertices are dropped. The OBJ file
+is read in chunks of lines, so memory use depends on the number of
+vertices and not on the size of the file.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+from typing import Iterator, TextIO
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+# Number of lines parsed at once
+CHUNK_LINES = 100_000
+
+
+def is_available() -> bool:
+    """Check whether OBJ proxies can be created.
+
+    Returns:
+        bool: True if NumPy is available.
+    """
+    return np is not None
+
+
+def decimate_obj(src_path: str, dst_path: str, grid_resolution: int) -> dict:
+    """Write a decimated copy of an OBJ file.
+
+    Only vertex positions, faces and object and group names are kept,
+    texture coordinates and normals are dropped.
+
+    Args:
+        src_path (str): Path to the source OBJ file.
+        dst_path (str): Path to write the proxy OBJ file to.
+        grid_resolution (int): Number of grid cells along the longest side
+            of the bounding box.
+
+    Returns:
+        dict: Vertex and face counts of the source and the proxy and
+            the decimation ratio of vertices.
+
+    Raises:
+        RuntimeError: If NumPy is not available.
+    """
+    if not is_available():
+        msg = "NumPy is not available, OBJ proxy can't be created."
+        raise RuntimeError(msg)
+
+    bbox_min, bbox_max = _get_bounding_box(src_path)
+    cell_size = float((bbox_max - bbox_min).max()) / max(1, grid_resolution)
+    if cell_size <= 0.0:
+        cell_size = 1.0
+    grid_size = (
+        np.floor((bbox_max - bbox_min) / cell_size).astype(np.int64) + 1)
+
+    # Assign vertices to grid cells and merge each cell into its centroid
+    cells = np.concatenate([
+        _get_cells(positions, bbox_min, cell_size, grid_size)
+        for positions in _iter_positions(src_path)
+    ] or [np.empty(0, dtype=np.int64)])
+    _, vertex_clusters = np.unique(cells, return_inverse=True)
+    vertex_clusters = vertex_clusters.ravel()
+    cluster_count = int(vertex_clusters.max()) + 1 if len(cells) else 0
+    centroids = np.zeros((cluster_count, 3))
+    offset = 0
+    for positions in _iter_positions(src_path):
+        clusters = vertex_clusters[offset:offset + len(positions)]
+        for axis in range(3):
+            centroids[:, axis] += np.bincount(
+                clusters, weights=positions[:, axis], minlength=cluster_count)
+        offset += len(positions)
+    centroids /= np.bincount(
+        vertex_clusters, minlength=cluster_count)[:, np.newaxis]
+
+    with open(dst_path, "w", encoding="utf-8") as dst_file:
+        dst_file.write(
+            f"# Proxy of {os.path.basename(src_path)}, "
+            f"grid resolution {grid_resolution}\n")
+        np.savetxt(dst_file, centroids, fmt="v %.6g %.6g %.6g")
+        face_count, proxy_face_count = _write_faces(
+            src_path, dst_file, vertex_clusters)
+
+    vertex_count = len(cells)
+    return {
+        "vertexCount": vertex_count,
+        "proxyVertexCount": cluster_count,
+        "faceCount": face_count,
+        "proxyFaceCount": proxy_face_count,
+        "ratio": cluster_count / vertex_count if vertex_count else 1.0,
+        "gridResolution": grid_resolution,
+    }
+
+
+def _iter_line_chunks(src_path: str) -> Iterator[list[str]]:
+    with open(src_path, encoding="utf-8", errors="replace") as src_file:
+        while True:
+            lines = list(itertools.islice(src_file, CHUNK_LINES))
+            if not lines:
+                return
+            yield lines
+
+
+def _iter_positions(src_path: str) -> Iterator[np.ndarray]:
+    """Iterate over vertex positions of an OBJ file in chunks.
+
+    Yields:
+        np.ndarray: Positions of a chunk of vertices with shape (n, 3).
+    """
+    for lines in _iter_line_chunks(src_path):
+        values = [
+            line.split()[1:4] for line in lines if line.startswith("v ")
+        ]
+        if values:
+            yield np.array(values, dtype=np.float64)
+
+
+def _get_bounding_box(src_path: str) -> tuple[np.ndarray, np.ndarray]:
+    bbox_min = np.full(3, np.inf)
+    bbox_max = np.full(3, -np.inf)
+    for positions in _iter_positions(src_path):
+        bbox_min = np.minimum(bbox_min, positions.min(axis=0))
+        bbox_max = np.maximum(bbox_max, positions.max(axis=0))
+    if not np.isfinite(bbox_min).all():
+        return np.zeros(3), np.zeros(3)
+    return bbox_min, bbox_max
+
+
+def _get_cells(
+        positions: np.ndarray,
+        bbox_min: np.ndarray,
+        cell_size: float,
+        grid_size: np.ndarray) -> np.ndarray:
+    """Get flat grid cell index of each vertex.
+
+    Returns:
+        np.ndarray: Cell index of each vertex.
+    """
+    coords = np.floor((positions - bbox_min) / cell_size).astype(np.int64)
+    coords = np.clip(coords, 0, grid_size - 1)
+    return (
+        coords[:, 0] * grid_size[1] + coords[:, 1]
+    ) * grid_size[2] + coords[:, 2]
+
+
+def _write_faces(
+        src_path: str,
+        dst_file: TextIO,
+        vertex_clusters: np.ndarray) -> tuple[int, int]:
+    """Write faces of the source file remapped to vertex clusters.
+
+    Returns:
+        tuple[int, int]: Number of source faces and number of written
+            faces.
+    """
+    face_count = 0
+    proxy_face_count = 0
+    vertex_count = 0
+    for lines in _iter_line_chunks(src_path):
+        output = []
+        for line in lines:
+            if line.startswith("v "):
+                vertex_count += 1
+            elif line.startswith(("o ", "g ")):
+                output.append(line)
+            elif line.startswith("f "):
+                face_count += 1
+                face = _remap_face(line, vertex_clusters, vertex_count)
+                if face:
+                    output.append(face)
+                    proxy_face_count += 1
+        dst_file.writelines(output)
+    return face_count, proxy_face_count
+
+
+def _remap_face(
+        line: str, vertex_clusters: np.ndarray, vertex_count: int) -> str:
+    """Remap face vertices to clusters, dropping collapsed vertices.
+
+    Returns:
+        str: Face line or empty string if the face collapsed.
+    """
+    indices = []
+    for item in line.split()[1:]:
+        index = int(item.split("/", 1)[0])
+        # Negative indices are relative to the last read vertex
+        index = index - 1 if index > 0 else vertex_count + index
+        cluster = int(vertex_clusters[index]) + 1
+        if cluster not in indices:
+            indices.append(cluster)
+    if len(indices) < 3:  # noqa: PLR2004
+        return ""
+    return "f {}\n".format(" ".join(map(str, indices)))
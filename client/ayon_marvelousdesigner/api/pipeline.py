@@ -1,15 +1,15 @@
 """Pipeline tools for Ayon Substance Designer integration."""
 from __future__ import annotations
 
+import contextlib
+import copy
 import json
 import logging
 import os
-from typing import Union
+import sys
+from typing import Iterator, Optional, Union
 
 # Marvelous Designer modules
-import ApiTypes
-import export_api
-import import_api
 import pyblish.api
 import utility_api
 
@@ -18,13 +18,14 @@ from ayon_core.host import HostBase, ILoadHost, IPublishHost, IWorkfileHost
 from ayon_core.pipeline import (
     AYON_CONTAINER_ID,
     register_creator_plugin_path,
+    register_inventory_action_path,
     register_loader_plugin_path,
     registered_host,
 )
 
 # Ayon Marvelous Designer modules
 from ayon_marvelousdesigner import MARVELOUS_DESIGNER_HOST_DIR
-from ayon_marvelousdesigner.api.ayon_dialog import show_tools_dialog
+from ayon_marvelousdesigner.addon import HEADLESS_ENV, SEEDED_METADATA_ENV
 
 log = logging.getLogger("ayon_marvelousdesigner")
 
@@ -32,6 +33,10 @@ PLUGINS_DIR = os.path.join(MARVELOUS_DESIGNER_HOST_DIR, "plugins")
 PUBLISH_PATH = os.path.join(PLUGINS_DIR, "publish")
 LOAD_PATH = os.path.join(PLUGINS_DIR, "load")
 CREATE_PATH = os.path.join(PLUGINS_DIR, "create")
+INVENTORY_PATH = os.path.join(PLUGINS_DIR, "inventory")
+
+# Format of console log in headless mode
+HEADLESS_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
 
 # AYON metadata keys
 AYON_ATTRIBUTE = "ayon"
@@ -50,30 +55,56 @@ class MarvelousDesignerHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         name (str): The host name identifier.
         _has_been_setup (bool): Flag indicating if the host has been
         initialized.
+        headless (bool): Run without Qt and AYON tools, logging to
+        the console.
         callbacks (list): List of registered callbacks.
         shelves (list): List of UI shelves.
     """
     name = "marvelousdesigner"
 
-    def __init__(self):
-        """Initialize the Marvelous Designer host with default settings."""
+    def __init__(self, *, headless: Optional[bool] = None):
+        """Initialize the Marvelous Designer host with default settings.
+
+        Args:
+            headless (Optional[bool]): Run without Qt and AYON tools.
+                Defaults to `AYON_MD_HEADLESS` environment variable.
+        """
         super().__init__()
         self._has_been_setup = False
         self.callbacks = []
         self.shelves = []
+        self.headless = is_headless() if headless is None else headless
 
-    @staticmethod
-    def show_tools_dialog() -> None:
-        """Show tools dialog with actions leading to show other tools."""
-        show_tools_dialog()
+    def show_tools_dialog(self) -> Optional[object]:
+        """Show tools dialog with actions leading to show other tools.
+
+        Qt and AYON tools are imported on first use, so installing
+        the host doesn't pay for them. Nothing is shown in headless mode.
+
+        Returns:
+            Optional[object]: The tools dialog, None in headless mode.
+        """
+        if self.headless:
+            log.warning("Tools dialog is not available in headless mode.")
+            return None
+
+        from ayon_marvelousdesigner.api.ayon_dialog import show_tools_dialog
+
+        return show_tools_dialog()
 
     def install(self) -> None:
         """Install and register the MD host with Ayon pipeline."""
+        if self.headless:
+            # Let plugins and child processes know about headless mode
+            os.environ[HEADLESS_ENV] = "1"
+            _install_console_logging()
+
         pyblish.api.register_host("marvelousdesigner")
 
         pyblish.api.register_plugin_path(str(PUBLISH_PATH))
         register_loader_plugin_path(str(LOAD_PATH))
         register_creator_plugin_path(str(CREATE_PATH))
+        register_inventory_action_path(str(INVENTORY_PATH))
 
         self._has_been_setup = True
 
@@ -83,8 +114,12 @@ class MarvelousDesignerHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         Returns:
             bool: True if there are unsaved changes, False otherwise.
         """
-        # API not supported for the check
-        return utility_api.CheckZPRJForUnsavedChanges()
+        # Seeded metadata is not in the file until it is saved, so a new
+        #   workfile is saved by its first publish even when seeded
+        return (
+            utility_api.CheckZPRJForUnsavedChanges()
+            or has_pending_seeded_metadata()
+        )
 
     def get_workfile_extensions(self) -> list[str]:  # noqa: PLR6301
         """Get the list of supported workfile extensions.
@@ -144,14 +179,39 @@ class MarvelousDesignerHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         return metadata.get(AYON_CONTEXT_DATA, {})
 
 
-def containerise(
+def is_headless() -> bool:
+    """Check whether headless mode is enabled by environment.
+
+    Returns:
+        bool: True if `AYON_MD_HEADLESS` is set to a truthy value.
+    """
+    return os.getenv(HEADLESS_ENV, "").lower() in {"1", "true", "yes"}
+
+
+def _install_console_logging() -> None:
+    """Log records of all loggers to the console.
+
+    Headless sessions have no publisher or tools UI to show logs in.
+    """
+    root_logger = logging.getLogger()
+    if any(
+        getattr(handler, "ayon_md_console", False)
+        for handler in root_logger.handlers
+    ):
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter(HEADLESS_LOG_FORMAT))
+    handler.ayon_md_console = True
+    root_logger.addHandler(handler)
+    if root_logger.level > logging.INFO or root_logger.level == 0:
+        root_logger.setLevel(logging.INFO)
+
+
+def get_container_data(
         name: str, namespace: str,
         context: dict, loader: object,
-        options: dict | None = None) -> None:
-    """Imprint a loaded container with metadata.
-
-    Containerisation enables a tracking of version, author and origin
-    for loaded assets.
+        options: dict | None = None) -> dict:
+    """Build container metadata for a loaded representation.
 
     Arguments:
         name (str): Name of resulting assembly
@@ -160,6 +220,9 @@ def containerise(
         loader (load.LoaderPlugin): loader instance used to produce container.
         options (dict): options
 
+    Returns:
+        dict: Container metadata.
+
     """
     data = {
         "schema": "ayon:container-3.0",
@@ -171,15 +234,74 @@ def containerise(
         "project_name": context["project"]["name"],
         "objectName": name,
     }
-    if options:
-        fabric_index = options.get("fabricIndex")
-        data["fabricIndex"] = fabric_index
-        data["objectName"] = f"{name}_fabric_{fabric_index}"
-    else:
-        data["objectName"] = name
+    options = options or {}
+    if "fabricIndex" in options:
+        data["objectName"] = f"{name}_fabric_{options['fabricIndex']}"
+    # Store loader specific data like fabric index or imported objects
+    data.update(options)
+    return data
+
+
+def get_unique_object_name(object_name: str, existing_names: set) -> str:
+    """Get object name which is not used by any other container.
+
+    Fabrics can be shared by multiple containers, so the object name
+    derived from the fabric index is not unique on its own.
+
+    Args:
+        object_name (str): Preferred object name.
+        existing_names (set): Object names already used by containers.
+
+    Returns:
+        str: Unique object name.
+    """
+    unique_name = object_name
+    suffix = 1
+    while unique_name in existing_names:
+        unique_name = f"{object_name}_{suffix}"
+        suffix += 1
+    return unique_name
+
+
+def containerise(
+        name: str, namespace: str,
+        context: dict, loader: object,
+        options: dict | None = None) -> None:
+    """Imprint a loaded container with metadata.
+
+    Containerisation enables a tracking of version, author and origin
+    for loaded assets.
+
+    Arguments:
+        name (str): Name of resulting assembly
+        namespace (str): Namespace under which to host container
+        context (dict): Asset information
+        loader (load.LoaderPlugin): loader instance used to produce container.
+        options (dict): options
+
+    """
+    containerise_many([
+        get_container_data(name, namespace, context, loader, options)
+    ])
+
+
+def containerise_many(containers: list[dict]) -> None:
+    """Store multiple containers with a single metadata write.
+
+    Args:
+        containers (list[dict]): Container metadata built by
+            `get_container_data`.
+    """
     # save the main_data in a temp folder
     container_data = ls() or []
-    container_data.append(data)
+    existing_names = {
+        container.get("objectName") for container in container_data
+    }
+    for data in containers:
+        data["objectName"] = get_unique_object_name(
+            data["objectName"], existing_names)
+        existing_names.add(data["objectName"])
+        container_data.append(data)
     set_metadata(AYON_CONTAINERS, container_data)
 
 
@@ -190,17 +312,30 @@ def imprint(object_name: str, data: dict) -> None:
         object_name (str): Name of the object to imprint metadata on.
         data (dict): Metadata to imprint.
     """
+    imprint_many({object_name: data})
+
+
+def imprint_many(data_by_object_name: dict[str, dict]) -> None:
+    """Imprint metadata onto multiple objects with a single metadata write.
+
+    Args:
+        data_by_object_name (dict[str, dict]): Metadata to imprint mapped
+            by object name.
+    """
     # Retrieve existing containers
     container_data = ls()
-    # Find the container for the specified object
+    remaining = dict(data_by_object_name)
+    # Find the containers for the specified objects
     for container in container_data:
-        if container.get("objectName") == object_name:
+        data = remaining.pop(container.get("objectName"), None)
+        if data is not None:
             container.update(data)
-            break
-    else:
+
+    for object_name in remaining:
         log.warning(
             "No container found for object %s to imprint data.", object_name
         )
+    if len(remaining) == len(data_by_object_name):
         return
     # Update the metadata
     set_metadata(AYON_CONTAINERS, container_data)
@@ -233,15 +368,114 @@ def get_current_workfile() -> str:
     return host.get_current_workfile()
 
 
+class _MetadataBatch:
+    """State of deferred metadata writes."""
+    depth = 0
+    metadata: Optional[dict] = None
+    changed = False
+
+
+@contextlib.contextmanager
+def metadata_batch() -> Iterator[None]:
+    """Defer metadata writes to a single write at the end of the block.
+
+    Metadata is read once when entering the block and all reads and
+    writes inside it are served from memory. Nested blocks are written
+    with the outermost one.
+
+    Yields:
+        None
+    """
+    if _MetadataBatch.depth == 0:
+        _MetadataBatch.metadata = _read_ayon_metadata()
+        _MetadataBatch.changed = False
+    _MetadataBatch.depth += 1
+    try:
+        yield
+    finally:
+        _MetadataBatch.depth -= 1
+        if _MetadataBatch.depth == 0:
+            metadata = _MetadataBatch.metadata
+            changed = _MetadataBatch.changed
+            _MetadataBatch.metadata = None
+            _MetadataBatch.changed = False
+            if changed:
+                _write_ayon_metadata(metadata)
+
+
+def get_seeded_metadata() -> dict:
+    """Get AYON metadata seeded for the current workfile by the launcher.
+
+    `CreateTempZprjFile` prelaunch hook passes the context data and
+    the workfile instance of a new workfile in the environment, the file
+    itself is not modified. They are used until the metadata is written
+    into the scene, at the latest when the workfile is saved. This only
+    avoids writing the metadata on startup, the workfile still has to be
+    saved once to store it, see `has_pending_seeded_metadata`.
+
+    Returns:
+        dict: Seeded metadata, empty if the current workfile is not
+            the seeded one.
+    """
+    payload = os.getenv(SEEDED_METADATA_ENV)
+    if not payload:
+        return {}
+    try:
+        seeded = json.loads(payload)
+    except ValueError:
+        log.warning("Invalid seeded AYON metadata in environment.")
+        return {}
+    current_path = utility_api.GetProjectFilePath()
+    seeded_path = seeded.get("workfile")
+    if not current_path or not seeded_path or (
+        os.path.normcase(os.path.abspath(current_path))
+        != os.path.normcase(os.path.abspath(seeded_path))
+    ):
+        return {}
+    return seeded.get("metadata") or {}
+
+
+def has_pending_seeded_metadata() -> bool:
+    """Check whether seeded metadata is not written in the scene yet.
+
+    The seeded metadata exists only in the environment of this session,
+    so a scene using it counts as having unsaved changes and the first
+    publish of a new workfile still saves it.
+
+    Returns:
+        bool: True if the scene has no metadata of its own and the
+            seeded metadata is used instead.
+    """
+    if json.loads(utility_api.GetMetaDataForCurrentGarment()):
+        return False
+    return bool(get_seeded_metadata())
+
+
+def _read_ayon_metadata() -> dict:
+    # need to convert string to dict
+    metadata_str = utility_api.GetMetaDataForCurrentGarment()
+    metadata = json.loads(metadata_str)
+    if not metadata:
+        # Nothing was written in this session, use seeded metadata
+        metadata = get_seeded_metadata()
+    return metadata
+
+
+def _write_ayon_metadata(ayon_metadata: dict) -> None:
+    # Serialize with optional formatting
+    json_to_str_data = f"{json.dumps(ayon_metadata)}"
+    utility_api.SetMetaDataForCurrentGarment(json_to_str_data)
+
+
 def get_ayon_metadata() -> dict:
     """Get AYON relevant metadata from current file.
 
     Returns:
         dict: AYON metadata as a dictionary.
     """
-    # need to convert string to dict
-    metadata_str = utility_api.GetMetaDataForCurrentGarment()
-    return json.loads(metadata_str)
+    if _MetadataBatch.depth:
+        return copy.deepcopy(_MetadataBatch.metadata)
+    return _read_ayon_metadata()
 
 
 def get_instances() -> dict:
@@ -275,12 +509,21 @@ def ls() -> list:
 
 
 def set_metadata(data_type: str, data: Union[dict, list]) -> None:
-    """Set instance data into the current file metadata."""
+    """Set instance data into the current file metadata.
+
+    Metadata is not written when the data didn't change, each write
+    marks the scene as modified.
+    """
+    if _MetadataBatch.depth:
+        if _MetadataBatch.metadata.get(data_type) != data:
+            _MetadataBatch.metadata[data_type] = copy.deepcopy(data)
+            _MetadataBatch.changed = True
+        return
     ayon_metadata = get_ayon_metadata()
+    if ayon_metadata.get(data_type) == data:
+        return
     ayon_metadata[data_type] = data
-    # Serialize with optional formatting
-    json_to_str_data = f"{json.dumps(ayon_metadata)}"
-    utility_api.SetMetaDataForCurrentGarment(json_to_str_data)
+    _write_ayon_metadata(ayon_metadata)
 
 
 def set_instance(
@@ -316,12 +559,23 @@ def remove_instance(instance_id: str) -> None:
 
 
 def save_workfile(filepath: str) -> None:
-    """Save the current workfile to the specified file path."""
+    """Save the current workfile to the specified file path.
+
+    Metadata seeded by the launcher is written into the scene first,
+    it exists only in the environment of this session.
+    """
+    import export_api
+
+    if has_pending_seeded_metadata():
+        _write_ayon_metadata(get_seeded_metadata())
     export_api.ExportZPrj(filepath)
     open_workfile(filepath)
 
 
 def open_workfile(filepath: str) -> None:
     """Open a workfile from the specified file path."""
+    import ApiTypes
+    import import_api
+
     import_options = ApiTypes.ImportZPRJOption()
     import_api.ImportZprj(filepath, import_options)
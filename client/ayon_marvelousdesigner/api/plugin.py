@@ -1,4 +1,6 @@
 """Creator plugin for Marvelous Designer."""
+from __future__ import annotations
+
 from ayon_core.pipeline import CreatedInstance, Creator
 
 from ayon_marvelousdesigner.api.pipeline import (
@@ -8,6 +10,27 @@ from ayon_marvelousdesigner.api.pipeline import (
     set_instances,
 )
 
+# Key of instance data cached in shared data of creators
+CACHED_INSTANCES_KEY = "marvelousdesigner_cached_instances"
+
+
+def cache_instance_data(shared_data: dict) -> dict:
+    """Cache instance data stored in the scene for all creators.
+
+    Each creator collects its instances from the scene metadata. The
+    metadata is read once per collection and shared through
+    `collection_shared_data` of the create context.
+
+    Args:
+        shared_data (dict): Collection shared data of the create context.
+
+    Returns:
+        dict: Shared data with instance data under `CACHED_INSTANCES_KEY`.
+    """
+    if shared_data.get(CACHED_INSTANCES_KEY) is None:
+        shared_data[CACHED_INSTANCES_KEY] = get_instances_values()
+    return shared_data
+
 
 class MDCreator(Creator):
     """Marvelous Designer Creator."""
@@ -35,7 +58,8 @@ class MDCreator(Creator):
         identifier or product type and creates context instances from the
         existing data.
         """
-        for instance in get_instances_values():
+        cache_instance_data(self.collection_shared_data)
+        for instance in self.collection_shared_data[CACHED_INSTANCES_KEY]:
             if (
                 instance.get("creator_identifier") == self.identifier
                 # Backwards compatibility
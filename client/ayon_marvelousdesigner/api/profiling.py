@@ -0,0 +1,173 @@
+"""Profiling of AYON actions inside Marvelous Designer.
+
+`ActionProfiler` combines deterministic profiling with `cProfile` and
+a lightweight stack sampler running in a background thread. Results are
+saved to the temp directory as a `.prof` file, which can be opened with
+`pstats` or snakeviz, and a collapsed-stack text file which can be
+rendered by flamegraph tools.
+"""
+from __future__ import annotations
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+# Default interval between stack samples in seconds
+SAMPLE_INTERVAL = 0.005
+# Number of functions listed in the summary
+SUMMARY_ROWS = 15
+
+
+class StackSampler:
+    """Sample call stacks of a thread in regular intervals.
+
+    Stacks are stored in collapsed form, frames from the outermost to
+    the innermost joined by semicolons, with the number of samples.
+    """
+
+    def __init__(
+            self,
+            thread_id: Optional[int] = None,
+            interval: float = SAMPLE_INTERVAL):
+        """Initialize the sampler.
+
+        Args:
+            thread_id (Optional[int]): Identifier of the sampled thread,
+                current thread when not set.
+            interval (float): Interval between samples in seconds.
+        """
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="AYONStackSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def write_collapsed(self, filepath: str) -> None:
+        """Write sampled stacks in collapsed-stack format.
+
+        Args:
+            filepath (str): Path to the output text file.
+        """
+        with open(filepath, "w", encoding="utf-8") as stream:
+            stream.writelines(
+                f"{stack} {count}\n"
+                for stack, count in self.stacks.most_common()
+            )
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)  # noqa: SLF001
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                filename = os.path.basename(code.co_filename)
+                names.append(
+                    f"{code.co_name} ({filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+
+
+class ActionProfiler:
+    """Profile an action with `cProfile` and a stack sampler."""
+
+    def __init__(self, name: str, output_dir: Optional[str] = None):
+        """Initialize the profiler.
+
+        Args:
+            name (str): Name of the profiled action, used in file names.
+            output_dir (Optional[str]): Directory to save results to,
+                temp directory when not set.
+        """
+        self.name = name
+        self.output_dir = output_dir or tempfile.gettempdir()
+        self._profile = cProfile.Profile()
+        self._sampler = StackSampler()
+        self._start_time: Optional[float] = None
+        self.duration = 0.0
+
+    def start(self) -> None:
+        """Start profiling of the current thread."""
+        self._start_time = time.perf_counter()
+        self._sampler.start()
+        self._profile.enable()
+
+    def stop(self) -> dict:
+        """Stop profiling and save the results.
+
+        Returns:
+            dict: Paths to the `.prof` and collapsed-stack files and
+                text summary of the hottest functions.
+        """
+        self._profile.disable()
+        self._sampler.stop()
+        if self._start_time is not None:
+            self.duration = time.perf_counter() - self._start_time
+
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        basename = os.path.join(
+            self.output_dir, f"ayon_md_profile_{self.name}_{timestamp}")
+        prof_path = f"{basename}.prof"
+        collapsed_path = f"{basename}.collapsed.txt"
+        self._profile.dump_stats(prof_path)
+        self._sampler.write_collapsed(collapsed_path)
+        return {
+            "prof_path": prof_path,
+            "collapsed_path": collapsed_path,
+            "summary": self.get_summary(),
+        }
+
+    def get_summary(self, rows: int = SUMMARY_ROWS) -> str:
+        """Get text summary of the hottest functions.
+
+        Args:
+            rows (int): Number of listed functions.
+
+        Returns:
+            str: Functions sorted by their own time and the number of
+                samples in which they were on top of the stack.
+        """
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(rows)
+
+        top_frames: Counter[str] = Counter()
+        for stack, count in self._sampler.stacks.items():
+            top_frames[stack.rsplit(";", 1)[-1]] += count
+        total_samples = sum(top_frames.values())
+        lines = [
+            (
+                f"Profiled '{self.name}' for {self.duration:.2f}s, "
+                f"{total_samples} stack sample(s)."
+            ),
+            "",
+            "Hottest functions by samples:",
+        ]
+        lines.extend(
+            f"{count / total_samples:6.1%}  {frame}"
+            for frame, count in top_frames.most_common(rows)
+        )
+        lines.extend(["", stream.getvalue().strip()])
+        return "\n".join(lines)
@@ -0,0 +1,286 @@
+"""Per-plugin timing and memory report of Marvelous Designer publishing.
+
+`CollectPublishReport` starts the report and memory tracing, each
+Marvelous Designer publish plugin records its measurements through
+the `report_process` decorator and `IntegratePublishReport` writes
+the report to the report directory and logs a summary.
+
+Memory tracing slows down all allocations, it is stopped when a plugin
+fails, as the publish doesn't reach `IntegratePublishReport` then, and
+tracing left running by an unfinished report is stopped by the next one.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import operator
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+import pyblish.api
+
+if TYPE_CHECKING:
+    import logging
+
+# Context data key of the report
+PUBLISH_REPORT_KEY = "mdPublishReport"
+# Number of slowest plugins listed in the log summary
+SUMMARY_ROWS = 10
+# Directory of reports when no directory is set
+DEFAULT_REPORT_DIR = os.path.join(
+    tempfile.gettempdir(), "ayon_marvelousdesigner_publish_reports")
+
+_local = threading.local()
+
+
+class _Tracing:
+    """Memory tracing started by a publish report."""
+    started = False
+
+
+def start_publish_report(
+        context: pyblish.api.Context, report_dir: str = "") -> None:
+    """Start publish report and memory tracing.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+        report_dir (str): Directory to write the report to, defaults to
+            `DEFAULT_REPORT_DIR`.
+    """
+    # Previous publish failed before its report was finished
+    _stop_tracing()
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _Tracing.started = True
+    context.data[PUBLISH_REPORT_KEY] = {
+        "startedAt": time.time(),
+        "startTime": time.perf_counter(),
+        "reportDir": report_dir or DEFAULT_REPORT_DIR,
+        "plugins": [],
+    }
+
+
+def report_process(process: Callable) -> Callable:
+    """Decorate `process` of a publish plugin to record its measurements.
+
+    Wall time, CPU time, peak of memory allocated by Python and bytes
+    written to the staging directory of the instance (or to the workfile
+    for context plugins) are recorded when the report was started.
+    Calls of the decorated `process` from a subclass are measured once.
+
+    Args:
+        process (Callable): `process` method of a publish plugin.
+
+    Returns:
+        Callable: Wrapped method.
+    """
+    @functools.wraps(process)
+    def wrapper(
+            plugin: pyblish.api.Plugin,
+            item: Union[pyblish.api.Context, pyblish.api.Instance]) -> None:
+        if isinstance(item, pyblish.api.Instance):
+            context = item.context
+            instance = item
+        else:
+            context = item
+            instance = None
+        report = context.data.get(PUBLISH_REPORT_KEY)
+        if report is None or getattr(_local, "measuring", False):
+            process(plugin, item)
+            return
+
+        output_before = _get_output_state(context, instance)
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        _local.measuring = True
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        try:
+            process(plugin, item)
+        except Exception:
+            # Publish stops, the report won't be finished
+            _stop_tracing()
+            raise
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            _local.measuring = False
+            peak_memory = (
+                tracemalloc.get_traced_memory()[1]
+                if tracemalloc.is_tracing() else None
+            )
+            report["plugins"].append({
+                "plugin": type(plugin).__name__,
+                "label": getattr(plugin, "label", None),
+                "instance": instance.name if instance is not None else None,
+                "wallTime": wall_time,
+                "cpuTime": cpu_time,
+                "peakMemory": peak_memory,
+                "outputBytes": _get_output_bytes(
+                    output_before, _get_output_state(context, instance)),
+            })
+
+    return wrapper
+
+
+def finish_publish_report(context: pyblish.api.Context) -> Optional[dict]:
+    """Finish publish report, stopping memory tracing started by it.
+
+    Durations of all plugins, including integration plugins of other
+    addons, are added from pyblish results.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        Optional[dict]: Finished report or None if it was not started.
+    """
+    report = context.data.pop(PUBLISH_REPORT_KEY, None)
+    if report is None:
+        return None
+    _stop_tracing()
+
+    report["workfile"] = context.data.get("currentFile")
+    report["totalTime"] = time.perf_counter() - report.pop("startTime")
+    report["results"] = [
+        {
+            "plugin": result["plugin"].__name__,
+            "instance": (
+                result["instance"].name if result.get("instance") else None
+            ),
+            "duration": result.get("duration", 0.0) / 1000.0,
+            "success": result.get("success", True),
+        }
+        for result in context.data.get("results", [])
+    ]
+    return report
+
+
+def write_publish_report(report: dict) -> Optional[str]:
+    """Write report as JSON to the report directory.
+
+    Reports are named by the workfile and the publish start time, so
+    the work directory of the artist is never written to.
+
+    Args:
+        report (dict): Finished publish report.
+
+    Returns:
+        Optional[str]: Path to the report or None if the workfile is
+            not saved.
+    """
+    workfile = report.get("workfile")
+    if not workfile:
+        return None
+    report_dir = report.get("reportDir") or DEFAULT_REPORT_DIR
+    os.makedirs(report_dir, exist_ok=True)
+    name, _ = os.path.splitext(os.path.basename(workfile))
+    timestamp = time.strftime(
+        "%Y%m%d_%H%M%S", time.localtime(report["startedAt"]))
+    report_path = os.path.join(
+        report_dir, f"{name}_{timestamp}_publish_report.json")
+    with open(report_path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=4)
+    return report_path
+
+
+def log_publish_report(report: dict, logger: logging.Logger) -> None:
+    """Log summary of the slowest plugins.
+
+    Args:
+        report (dict): Finished publish report.
+        logger (logging.Logger): Logger to report to.
+    """
+    measured_time = sum(item["wallTime"] for item in report["plugins"])
+    logger.info(
+        "Publish took %.2fs, %.2fs in Marvelous Designer plugins.",
+        report["totalTime"], measured_time
+    )
+    rows = sorted(
+        report["plugins"], key=operator.itemgetter("wallTime"), reverse=True)
+    for item in rows[:SUMMARY_ROWS]:
+        logger.info(
+            "  %-30s %-24s wall %7.3fs  cpu %7.3fs  peak %8.1f MB  "
+            "output %8.1f MB",
+            item["plugin"],
+            item["instance"] or "<context>",
+            item["wallTime"],
+            item["cpuTime"],
+            (item["peakMemory"] or 0) / (1024 * 1024),
+            item["outputBytes"] / (1024 * 1024),
+        )
+
+    measured_plugins = {item["plugin"] for item in rows}
+    other_results = [
+        result for result in report["results"]
+        if result["plugin"] not in measured_plugins
+    ]
+    other_time = sum(result["duration"] for result in other_results)
+    if other_results:
+        logger.info(
+            "  Other plugins (including integration): %.2fs in %d "
+            "call(s).", other_time, len(other_results)
+        )
+
+
+def _stop_tracing() -> None:
+    """Stop memory tracing if it was started by a publish report."""
+    if _Tracing.started:
+        _Tracing.started = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def _get_output_state(
+        context: pyblish.api.Context,
+        instance: Optional[pyblish.api.Instance]) -> dict[str, tuple]:
+    """Get size and modification time of files written by plugins.
+
+    Returns:
+        dict[str, tuple]: Size and modification time by file path.
+    """
+    if instance is None:
+        # Workfile might be saved under a new path, e.g. on version up
+        paths = [
+            context.data.get("currentFile"),
+            context.data.get("sceneSnapshot", {}).get("currentFile"),
+        ]
+    else:
+        staging_dir = instance.data.get("stagingDir")
+        paths = _list_files(staging_dir) if staging_dir else []
+
+    state = {}
+    for path in paths:
+        if not path or path in state:
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        state[path] = (stat.st_size, stat.st_mtime_ns)
+    return state
+
+
+def _list_files(directory: str) -> list[str]:
+    try:
+        return [
+            entry.path for entry in os.scandir(directory) if entry.is_file()
+        ]
+    except OSError:
+        return []
+
+
+def _get_output_bytes(before: dict, after: dict) -> int:
+    """Get bytes of files which were created or changed.
+
+    Returns:
+        int: Total size of new or modified files.
+    """
+    return sum(
+        size for path, (size, mtime) in after.items()
+        if before.get(path) != (size, mtime)
+    )
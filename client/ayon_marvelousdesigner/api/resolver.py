@@ -0,0 +1,162 @@
+"""Memoized resolution of representation file paths for loaders."""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from ayon_core.pipeline.load import get_representation_path_from_context
+from ayon_core.pipeline.traits import (
+    FileLocation,
+    Representation,
+)
+
+# Maximum number of resolved paths kept in memory
+RESOLVER_MAX_SIZE = 1024
+
+
+class RepresentationPathResolver:
+    """Bounded LRU cache of resolved representation file paths.
+
+    Resolving a path from representation traits parses the trait payload
+    and builds a `Representation` object. Scene inventory updates resolve
+    the same representations repeatedly, so resolved paths are cached by
+    representation id and a hash of the trait payload.
+    """
+
+    def __init__(self, max_size: int = RESOLVER_MAX_SIZE):
+        """Initialize the resolver.
+
+        Args:
+            max_size (int): Maximum number of cached paths.
+        """
+        self.max_size = max_size
+        self._paths: OrderedDict[tuple, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def resolve(self, context: dict) -> str:
+        """Get file path of a representation context.
+
+        Args:
+            context (dict): Representation context.
+
+        Returns:
+            str: File path of the representation.
+        """
+        key = self.get_key(context["representation"])
+        with self._lock:
+            file_path = self._paths.get(key)
+            if file_path is not None:
+                self._paths.move_to_end(key)
+                self._hits += 1
+                return file_path
+            self._misses += 1
+
+        file_path = self._resolve(context)
+        with self._lock:
+            self._paths[key] = file_path
+            self._paths.move_to_end(key)
+            while len(self._paths) > self.max_size:
+                self._paths.popitem(last=False)
+        return file_path
+
+    def clear(self) -> None:
+        """Clear cached paths and counters."""
+        with self._lock:
+            self._paths.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> dict:
+        """Get resolver statistics.
+
+        Returns:
+            dict: Hits, misses, hit rate and number of cached paths.
+        """
+        with self._lock:
+            hits = self._hits
+            misses = self._misses
+            size = len(self._paths)
+        requests = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / requests if requests else 0.0,
+            "size": size,
+        }
+
+    @staticmethod
+    def get_key(representation: dict) -> tuple:
+        """Get cache key of a representation.
+
+        Args:
+            representation (dict): Representation entity.
+
+        Returns:
+            tuple: Representation id and hash of its trait payload.
+        """
+        traits_raw = representation.get("traits")
+        traits_hash: Optional[str] = None
+        if traits_raw is not None:
+            if not isinstance(traits_raw, str):
+                traits_raw = json.dumps(traits_raw, sort_keys=True)
+            traits_hash = hashlib.sha1(
+                traits_raw.encode(), usedforsecurity=False).hexdigest()
+        return representation["id"], traits_hash
+
+    @staticmethod
+    def _resolve(context: dict) -> str:
+        """Resolve file path with either representation trait or context data.
+
+        Context data are used for backward compatibility only.
+
+        Args:
+            context (dict): Representation context.
+
+        Returns:
+            str: File path of the representation.
+        """
+        traits_raw = context["representation"].get("traits")
+        if traits_raw is not None:
+            if isinstance(traits_raw, str):
+                traits_raw = json.loads(traits_raw)
+            # construct Representation object from the context
+            representation = Representation.from_dict(
+                name=context["representation"]["name"],
+                representation_id=context["representation"]["id"],
+                trait_data=traits_raw,
+            )
+            file_path: Path = representation.get_trait(FileLocation).file_path
+        else:
+            file_path = Path(get_representation_path_from_context(context))
+
+        return file_path.as_posix()
+
+
+_RESOLVER = RepresentationPathResolver()
+
+
+def get_representation_filepath(context: dict) -> str:
+    """Get file path of a representation context using the shared resolver.
+
+    Args:
+        context (dict): Representation context.
+
+    Returns:
+        str: File path of the representation.
+    """
+    return _RESOLVER.resolve(context)
+
+
+def get_resolver_stats() -> dict:
+    """Get statistics of the shared representation path resolver.
+
+    Returns:
+        dict: Hits, misses, hit rate and number of cached paths.
+    """
+    return _RESOLVER.get_stats()
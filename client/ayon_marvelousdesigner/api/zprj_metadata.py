@@ -0,0 +1,264 @@
+"""Read AYON metadata from saved .zprj files without Marvelous Designer.
+
+A .zprj file is a binary header with thumbnails followed by a ZIP archive
+of the project data. The AYON metadata stored by
+`SetMetaDataForCurrentGarment` is a JSON object with `ayon_*` keys saved
+in one of the archive members. Members are decompressed as streams in
+chunks and reading stops as soon as the metadata is found, so large
+members like avatars and simulation caches are usually never inflated.
+
+This module must not import Marvelous Designer modules, it is used
+outside of Marvelous Designer.
+"""
+from __future__ import annotations
+
+import html
+import json
+import logging
+import os
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+# Top level keys of AYON metadata, see `ayon_marvelousdesigner.api.pipeline`
+AYON_METADATA_KEYS = ("ayon_instances", "ayon_containers", "ayon_context_data")
+ZPRJ_EXTENSION = ".zprj"
+# Size of chunks read from decompressed members
+READ_CHUNK_SIZE = 1024 * 1024
+# Maximum size of the metadata JSON
+MAX_METADATA_SIZE = 16 * 1024 * 1024
+# Bytes kept from the previous chunk, so the start of the metadata object
+# is found even if it is split between chunks
+TAIL_SIZE = 64 * 1024
+# Default number of files read at the same time
+SCAN_WORKERS = 8
+
+
+class _Marker(NamedTuple):
+    """Encoded start of an AYON metadata key."""
+    pattern: bytes
+    encoding: str
+    escaped: bool
+
+
+_MARKERS = (
+    _Marker(b'"ayon_', "utf-8", escaped=False),
+    _Marker(b"&quot;ayon_", "utf-8", escaped=True),
+    # Qt serializes strings as UTF-16
+    _Marker('"ayon_'.encode("utf-16-le"), "utf-16-le", escaped=False),
+    _Marker('"ayon_'.encode("utf-16-be"), "utf-16-be", escaped=False),
+)
+
+
+def read_zprj_metadata(filepath: str) -> Optional[dict]:
+    """Read AYON metadata from a .zprj file.
+
+    Args:
+        filepath (str): Path to the .zprj file.
+
+    Returns:
+        Optional[dict]: AYON metadata with `ayon_instances`,
+            `ayon_containers` and `ayon_context_data` keys, or None if
+            the file contains no AYON metadata.
+    """
+    with open(filepath, "rb") as stream:
+        try:
+            archive = zipfile.ZipFile(stream)
+        except zipfile.BadZipFile:
+            log.debug("%s is not a ZIP based project, scanning raw.", filepath)
+            stream.seek(0)
+            return _find_metadata(stream)
+
+        with archive:
+            members = archive.infolist()
+            # Header in front of the archive
+            header_size = min(
+                (info.header_offset for info in members), default=0)
+            stream.seek(0)
+            metadata = _find_metadata(_LimitedReader(stream, header_size))
+            if metadata is not None:
+                return metadata
+
+            for info in sorted(members, key=_get_member_priority):
+                if info.is_dir():
+                    continue
+                with archive.open(info) as member_stream:
+                    metadata = _find_metadata(member_stream)
+                if metadata is not None:
+                    log.debug(
+                        "Found AYON metadata of %s in '%s'.",
+                        filepath, info.filename
+                    )
+                    return metadata
+    return None
+
+
+def find_zprj_files(paths: Iterable[str]) -> list[str]:
+    """Find .zprj files in files and directories.
+
+    Args:
+        paths (Iterable[str]): Paths to .zprj files or directories
+            searched recursively.
+
+    Returns:
+        list[str]: Paths to .zprj files.
+    """
+    filepaths = []
+    for path in paths:
+        if os.path.isfile(path):
+            filepaths.append(path)
+            continue
+        for root, _dirs, filenames in os.walk(path):
+            filepaths.extend(
+                os.path.join(root, filename)
+                for filename in sorted(filenames)
+                if filename.lower().endswith(ZPRJ_EXTENSION)
+            )
+    return filepaths
+
+
+def scan_zprj_metadata(
+        paths: Iterable[str],
+        max_workers: int = SCAN_WORKERS) -> Iterator[dict]:
+    """Read AYON metadata of .zprj files in parallel.
+
+    Args:
+        paths (Iterable[str]): Paths to .zprj files or directories
+            searched recursively.
+        max_workers (int): Number of files read at the same time.
+
+    Yields:
+        dict: Result with `workfile` path, `metadata` (None if there is
+            none) and `error` message if the file couldn't be read,
+            in order of the files.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        yield from executor.map(_read_result, find_zprj_files(paths))
+
+
+def _read_result(filepath: str) -> dict:
+    result = {"workfile": filepath, "metadata": None, "error": None}
+    try:
+        result["metadata"] = read_zprj_metadata(filepath)
+    except (OSError, zipfile.BadZipFile, zlib.error, EOFError) as exc:
+        result["error"] = str(exc)
+    return result
+
+
+def _get_member_priority(info: zipfile.ZipInfo) -> tuple[int, int]:
+    """Get sort key reading likely metadata holders first.
+
+    Returns:
+        tuple[int, int]: Priority of the member type and its size.
+    """
+    name = info.filename.lower()
+    if "meta" in name or name.endswith((".json", ".xml")):
+        priority = 0
+    elif name.endswith((".png", ".jpg", ".jpeg", ".abc", ".obj", ".fbx")):
+        priority = 2
+    else:
+        priority = 1
+    return priority, info.file_size
+
+
+def _find_metadata(stream: IO[bytes]) -> Optional[dict]:
+    """Find AYON metadata JSON in a stream.
+
+    Returns:
+        Optional[dict]: AYON metadata or None if not found.
+    """
+    data = b""
+    search_from = 0
+    eof = False
+    while True:
+        if not eof:
+            chunk = stream.read(READ_CHUNK_SIZE)
+            eof = not chunk
+            data += chunk
+
+        match = _find_marker(data, search_from)
+        if match is None:
+            if eof:
+                return None
+            # Keep only the tail which might hold a part of the metadata
+            offset = max(0, len(data) - TAIL_SIZE)
+            data = data[offset:]
+            search_from = max(0, len(data) - TAIL_SIZE)
+            continue
+
+        index, marker = match
+        metadata = _decode_metadata(data, index, marker)
+        if metadata is not None:
+            return metadata
+        if eof or len(data) - index > MAX_METADATA_SIZE:
+            # Not a metadata object, continue after the marker
+            search_from = index + 1
+
+
+def _find_marker(
+        data: bytes, start: int) -> Optional[tuple[int, _Marker]]:
+    """Find the first marker of AYON metadata key.
+
+    Returns:
+        Optional[tuple[int, _Marker]]: Index and the found marker.
+    """
+    found = None
+    for marker in _MARKERS:
+        index = data.find(marker.pattern, start)
+        if index >= 0 and (found is None or index < found[0]):
+            found = (index, marker)
+    return found
+
+
+def _decode_metadata(
+        data: bytes, index: int, marker: _Marker) -> Optional[dict]:
+    """Decode metadata object containing a marker.
+
+    Opening braces in front of the marker are tried from the closest
+    one, the metadata object starts at one of them.
+
+    Returns:
+        Optional[dict]: AYON metadata or None if no object containing
+            AYON keys could be decoded, e.g. because the data are not
+            complete yet.
+    """
+    brace = "{".encode(marker.encoding)
+    char_size = len(brace)
+    decoder = json.JSONDecoder()
+    window_start = max(0, index - TAIL_SIZE)
+    position = index
+    while True:
+        position = data.rfind(brace, window_start, position)
+        if position < 0:
+            return None
+        if (index - position) % char_size:
+            continue
+        text = data[position:].decode(marker.encoding, errors="ignore")
+        if marker.escaped:
+            text = html.unescape(text)
+        try:
+            obj, _ = decoder.raw_decode(text)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(obj, dict) and any(
+                key in obj for key in AYON_METADATA_KEYS):
+            return obj
+
+
+class _LimitedReader:
+    """Read at most `size` bytes of a stream."""
+
+    def __init__(self, stream: IO[bytes], size: int):
+        self._stream = stream
+        self._remaining = size
+
+    def read(self, size: int) -> bytes:
+        data = self._stream.read(min(size, self._remaining))
+        self._remaining -= len(data)
+        return data
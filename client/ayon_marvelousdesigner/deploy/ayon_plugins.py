@@ -1,25 +1,165 @@
 """Deployed script with Ayon integration for Marvelous Designer.
  User needs to manually add this script into Marvelous Designer
 Plugins -> Plug-in Managers.
+
+Set `AYON_MD_HEADLESS=1` to install the host without Qt and AYON tools,
+widgets are not registered and logs are printed to the console.
+
+When PySide6 is installed in background by the prelaunch hook, startup
+doesn't wait for it. A background thread waits for the installation and
+the tools dialog is shown on the main thread once it finished. Qt can't
+be imported while its files are being written, so the marker is not
+polled by a Qt timer. The script has to be run again only when there is
+no Qt application to show the dialog on.
+
+The tools dialog module, which imports Qt widgets and AYON tools, is not
+imported while the script runs. The dialog is created once control
+returns to the Qt event loop, or right away when there is no running Qt
+application to schedule it on.
 """  # noqa: D205
 
 # -*- coding: utf-8 -*-
 import os
 import sys
+import threading
+from pathlib import Path
+from typing import Callable
 
 import utility_api
 
-utility_api.DeleteWidgets()
 # We need to add PYTHONPATH to sys.path to ensure Ayon modules are found
 for path in os.environ["PYTHONPATH"].split(os.pathsep):
     if path and path not in sys.path:
         sys.path.append(path)
 
-from ayon_core.pipeline import install_host  # noqa: E402
+from ayon_core.pipeline import install_host, registered_host  # noqa: E402
 from ayon_marvelousdesigner.api import MarvelousDesignerHost  # noqa: E402
+from ayon_marvelousdesigner.qt_binding import (  # noqa: E402
+    READY_MARKER_ENV,
+    READY_TIMEOUT_ENV,
+    STATUS_PENDING,
+    STATUS_READY,
+    read_ready_marker,
+    wait_for_ready_marker,
+)
+
+# Objects queuing calls to the main thread until they are delivered
+_main_thread_calls = []
+
+
+def is_qt_ready() -> bool:
+    """Check PySide6 installed in background by the prelaunch hook.
+
+    The readiness marker is read once, the main thread is never blocked.
+    While the installation runs, a background thread waits for it and
+    shows the tools dialog when it finished.
+
+    Returns:
+        bool: True if PySide6 is available.
+    """
+    marker_path = os.environ.get(READY_MARKER_ENV)
+    if not marker_path:
+        return True
+    marker = read_ready_marker(Path(marker_path))
+    if marker.get("status") == STATUS_READY:
+        return True
+    if marker.get("status") == STATUS_PENDING:
+        print(  # noqa: T201
+            "AYON tools will be available once PySide6 installation"
+            " finishes."
+        )
+        threading.Thread(
+            target=_report_qt_ready,
+            args=(Path(marker_path),),
+            daemon=True,
+        ).start()
+    else:
+        _print_qt_failure(marker)
+    return False
+
+
+def _report_qt_ready(marker_path: Path) -> None:
+    timeout = float(os.environ.get(READY_TIMEOUT_ENV) or 600)
+    marker = wait_for_ready_marker(marker_path, timeout)
+    if marker.get("status") != STATUS_READY:
+        _print_qt_failure(marker, timeout)
+    elif not _call_in_main_thread(schedule_tools_dialog):
+        print(  # noqa: T201
+            "PySide6 is installed, run the AYON plug-in again to show"
+            " AYON tools."
+        )
+
+
+def _call_in_main_thread(callback: Callable[[], None]) -> bool:
+    """Call function on the thread of the running Qt application.
+
+    The call is queued through a signal of an object moved to the thread
+    of the application, Qt objects can't be used from other threads.
+
+    Args:
+        callback (Callable[[], None]): Function to call.
+
+    Returns:
+        bool: False if there is no Qt application to call it on.
+    """
+    from qtpy import QtCore
+
+    app = QtCore.QCoreApplication.instance()
+    if app is None:
+        return False
+
+    class MainThreadCall(QtCore.QObject):
+        called = QtCore.Signal()
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.called.connect(self._on_called, QtCore.Qt.QueuedConnection)
+
+        @QtCore.Slot()
+        def _on_called(self) -> None:
+            _main_thread_calls.remove(self)
+            callback()
+
+    call = MainThreadCall()
+    call.moveToThread(app.thread())
+    # Keep the object alive until the call is delivered
+    _main_thread_calls.append(call)
+    call.called.emit()
+    return True
+
+
+def _print_qt_failure(marker: dict, timeout: float = 0) -> None:
+    if marker.get("error"):
+        reason = f"failed: {marker['error']}"
+    else:
+        reason = f"did not finish in {timeout:.0f}s."
+    print(  # noqa: T201
+        f"AYON tools are not available, PySide6 installation {reason}"
+        " Restart Marvelous Designer to try again."
+    )
+
+
+def show_tools_dialog() -> None:
+    """Show AYON tools dialog and register it in Marvelous Designer."""
+    utility_api.DeleteWidgets()
+    dialog = host.show_tools_dialog()
+    widget_address = id(dialog)
+    utility_api.RegisterWidget(widget_address)
+
+
+def schedule_tools_dialog() -> None:
+    """Show AYON tools dialog once the Qt event loop gets control."""
+    from qtpy import QtCore
+
+    if QtCore.QCoreApplication.instance() is None:
+        show_tools_dialog()
+        return
+    QtCore.QTimer.singleShot(0, show_tools_dialog)
+
 
-host = MarvelousDesignerHost()
-install_host(host)
-dialog = host.show_tools_dialog()
-widget_address = id(dialog)
-utility_api.RegisterWidget(widget_address)
+host = registered_host()
+if host is None:
+    host = MarvelousDesignerHost()
+    install_host(host)
+if not host.headless and is_qt_ready():
+    schedule_tools_dialog()
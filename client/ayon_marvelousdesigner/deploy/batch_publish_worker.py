@@ -0,0 +1,46 @@
+"""Worker script publishing one workfile for batch publishing.
+
+Runs in a headless session, either a Python interpreter with Marvelous
+Designer API modules (or stand-ins) on `PYTHONPATH` or Marvelous Designer
+itself. Workfile and result paths are passed by `AYON_MD_BATCH_WORKFILE`
+and `AYON_MD_BATCH_RESULT` environment variables, or as arguments.
+"""
+import json
+import os
+import sys
+
+# We need to add PYTHONPATH to sys.path to ensure Ayon modules are found
+for path in os.environ.get("PYTHONPATH", "").split(os.pathsep):
+    if path and path not in sys.path:
+        sys.path.append(path)
+
+from ayon_marvelousdesigner.addon import HEADLESS_ENV  # noqa: E402
+
+os.environ[HEADLESS_ENV] = "1"
+
+from ayon_marvelousdesigner.api.batch_publish import (  # noqa: E402
+    RESULT_ENV,
+    STATUS_SUCCESS,
+    WORKFILE_ENV,
+    publish_workfile,
+)
+
+
+def main() -> int:
+    """Publish the workfile and write its result.
+
+    Returns:
+        int: Exit code, 0 if the workfile was published successfully.
+    """
+    args = sys.argv[1:]
+    workfile = args[0] if args else os.environ[WORKFILE_ENV]
+    result_path = args[1] if len(args) > 1 else os.environ[RESULT_ENV]
+
+    result = publish_workfile(workfile)
+    with open(result_path, "w", encoding="utf-8") as result_file:
+        json.dump(result, result_file)
+    return 0 if result["status"] == STATUS_SUCCESS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
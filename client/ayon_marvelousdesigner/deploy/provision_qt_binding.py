@@ -0,0 +1,74 @@
+"""Install PySide6 for Marvelous Designer in a detached process.
+
+Started by `InstallQtBinding` prelaunch hook with background install
+enabled, so Marvelous Designer launches without waiting for downloads.
+The result is written to the readiness marker in the Qt binding
+directory, which the deployed plugin script waits for.
+
+Usage:
+    provision_qt_binding.py <qt_binding_dir> <settings_json> <fingerprint>
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Make the addon importable when run by a bare interpreter
+CLIENT_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if CLIENT_DIR not in sys.path:
+    sys.path.append(CLIENT_DIR)
+
+from ayon_marvelousdesigner.prelaunch import LaunchStamp  # noqa: E402
+from ayon_marvelousdesigner.qt_binding import (  # noqa: E402
+    READY_MARKER_NAME,
+    STATUS_FAILED,
+    STATUS_READY,
+    get_dist_info_paths,
+    install_qt_binding,
+    write_ready_marker,
+)
+
+LOG_PATH = os.path.join(tempfile.gettempdir(), "ayon_pyside6_provision.log")
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+
+def main() -> int:
+    """Install PySide6 and write the readiness marker.
+
+    Returns:
+        int: Exit code, 0 if PySide6 is installed.
+    """
+    logging.basicConfig(
+        filename=LOG_PATH,
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    qt_binding_dir = Path(sys.argv[1])
+    prelaunch_settings = json.loads(sys.argv[2])
+    fingerprint = sys.argv[3]
+    marker_path = qt_binding_dir / READY_MARKER_NAME
+
+    try:
+        install_qt_binding(qt_binding_dir, prelaunch_settings)
+    except Exception as error:
+        log.exception("Failed to install PySide6.")
+        write_ready_marker(marker_path, STATUS_FAILED, str(error))
+        return 1
+
+    write_ready_marker(marker_path, STATUS_READY)
+    dist_info_paths = get_dist_info_paths(qt_binding_dir)
+    LaunchStamp().mark_done(
+        "InstallQtBinding",
+        fingerprint,
+        paths=[path.as_posix() for path in dist_info_paths],
+    )
+    log.info("PySide6 is ready in %s", qt_binding_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,8 +11,11 @@ from pathlib import Path
 from typing import ClassVar
 
 from ayon_applications import LaunchTypes, PreLaunchHook
-from ayon_marvelousdesigner import (
-    MARVELOUS_DESIGNER_HOST_DIR,
+from ayon_marvelousdesigner.prelaunch import (
+    DEPLOYED_SCRIPT_PATH,
+    LaunchStamp,
+    get_hook_fingerprint,
+    log_duration,
 )
 
 
@@ -23,6 +26,7 @@ class InstallAyonPlugins(PreLaunchHook):
     order = 12
     launch_types: ClassVar = {LaunchTypes.local}
 
+    @log_duration
     def execute(self) -> None:
         """Execute the pre-launch hook to install AYON plugins."""
         md_setting = self.data["project_settings"]["marvelous_designer"]
@@ -33,14 +37,23 @@ class InstallAyonPlugins(PreLaunchHook):
             self.log.warning("Plugins directory not found: %s", plugins_dir)
             return
         plugins_json = plugins_dir / "pluginSettings.json"
-        deployed_script = (
-            Path(MARVELOUS_DESIGNER_HOST_DIR)
-            / "deploy" / "ayon_plugins.py"
-        )
+        fingerprint = get_hook_fingerprint(self)
+        stamp = LaunchStamp()
+        if stamp.is_done(self.__class__.__name__, fingerprint):
+            self.log.info("AYON plugin is already registered, skipping.")
+            return
+
+        deployed_script = Path(DEPLOYED_SCRIPT_PATH)
         self._write_plugins_json(
             plugins_json.as_posix(),
             deployed_script.as_posix()
         )
+        # MD might rewrite the file, the stamp is valid only until then
+        stamp.mark_done(
+            self.__class__.__name__,
+            fingerprint,
+            paths=[plugins_json.as_posix()],
+        )
 
     @staticmethod
     def _write_plugins_json(plugins_json: str, deployed_script: str) -> None:
@@ -7,27 +7,33 @@ InstallQtBinding: Pre-launch hook that installs PySide6 to MD's
 from __future__ import annotations
 
 import json
-import platform
-import shutil
+import os
 import subprocess
-import sys
-import tempfile
-import urllib.request
-import zipfile
 from pathlib import Path
 from typing import ClassVar, Union
 
 from ayon_applications import LaunchTypes, PreLaunchHook
-
-# PySide6 packages to download from PyPI.
-# Must stay in dependency order: shiboken6 first, then PySide6 core.
-_PYSIDE6_VERSION = "6.10.1"
-_PYSIDE6_PACKAGES = [
-    "shiboken6",
-    "PySide6",
-    "PySide6-Essentials",
-    "PySide6-Addons",
-]
+from ayon_core.lib import get_ayon_launcher_args, run_detached_process
+from ayon_marvelousdesigner import MARVELOUS_DESIGNER_HOST_DIR
+from ayon_marvelousdesigner.addon import HEADLESS_ENV
+from ayon_marvelousdesigner.prelaunch import (
+    LaunchStamp,
+    get_hook_fingerprint,
+    log_duration,
+)
+from ayon_marvelousdesigner.qt_binding import (
+    PYSIDE6_VERSION,
+    READY_MARKER_ENV,
+    READY_MARKER_NAME,
+    READY_TIMEOUT_ENV,
+    STATUS_PENDING,
+    get_dist_info_paths,
+    install_qt_binding,
+    write_ready_marker,
+)
+
+PROVISION_SCRIPT = os.path.join(
+    MARVELOUS_DESIGNER_HOST_DIR, "deploy", "provision_qt_binding.py")
 
 
 class InstallQtBinding(PreLaunchHook):
@@ -37,8 +43,15 @@ class InstallQtBinding(PreLaunchHook):
     order = 11
     launch_types: ClassVar = {LaunchTypes.local}
 
+    @log_duration
     def execute(self) -> None:
         """Execute the pre-launch hook to install PySide6."""
+        if self.launch_context.env.get(HEADLESS_ENV, "").lower() in {
+            "1", "true", "yes"
+        }:
+            self.log.info("Headless launch, skipping Qt binding install.")
+            return
+
         md_setting = self.data["project_settings"]["marvelous_designer"]
         qt_binding_dir = md_setting["prelaunch_settings"].get(
             "qt_binding_dir", "")
@@ -49,15 +62,66 @@ class InstallQtBinding(PreLaunchHook):
             )
             return
 
+        fingerprint = get_hook_fingerprint(self)
+        stamp = LaunchStamp()
+        if stamp.is_done(self.__class__.__name__, fingerprint):
+            self.log.info("PySide6 install is up to date, skipping.")
+            self._set_qt_env(qt_binding_dir)
+            return
+
+        prelaunch_settings = md_setting["prelaunch_settings"]
+        if prelaunch_settings.get("background_install"):
+            self._start_background_install(
+                qt_binding_dir, prelaunch_settings, fingerprint)
+            self._set_qt_env(qt_binding_dir)
+            return
+
         return_code = self.extract_wheels(qt_binding_dir)
         if return_code:
             self.log.info("PySide6 installed successfully.")
-            self.launch_context.env["QtDir"] = qt_binding_dir.as_posix()
-            plugin_dir = qt_binding_dir / "PySide6" / "plugins"
-            self.launch_context.env["QT_PLUGIN_PATH"] = (
-                plugin_dir.as_posix()
+            self._set_qt_env(qt_binding_dir)
+            stamp.mark_done(
+                self.__class__.__name__,
+                fingerprint,
+                paths=[
+                    path.as_posix()
+                    for path in get_dist_info_paths(qt_binding_dir)
+                ],
             )
 
+    def _start_background_install(
+            self,
+            qt_binding_dir: Path,
+            prelaunch_settings: dict,
+            fingerprint: str) -> None:
+        """Install PySide6 in a detached process, not blocking the launch.
+
+        The deployed plugin script waits for the readiness marker before
+        it shows the tools dialog.
+        """
+        marker_path = qt_binding_dir / READY_MARKER_NAME
+        write_ready_marker(marker_path, STATUS_PENDING)
+        args = get_ayon_launcher_args(
+            "run",
+            PROVISION_SCRIPT,
+            qt_binding_dir.as_posix(),
+            json.dumps(prelaunch_settings),
+            fingerprint,
+        )
+        self.log.info("Installing PySide6 in background process.")
+        run_detached_process(args)
+        self.launch_context.env[READY_MARKER_ENV] = marker_path.as_posix()
+        self.launch_context.env[READY_TIMEOUT_ENV] = str(
+            prelaunch_settings.get("qt_wait_timeout", 600))
+
+    def _set_qt_env(self, qt_binding_dir: Path) -> None:
+        """Point Marvelous Designer to the extracted Qt binding."""
+        self.launch_context.env["QtDir"] = qt_binding_dir.as_posix()
+        plugin_dir = qt_binding_dir / "PySide6" / "plugins"
+        self.launch_context.env["QT_PLUGIN_PATH"] = (
+            plugin_dir.as_posix()
+        )
+
     def install_pyside(
             self, python_executable: str,
             qt_binding_dir: Path) -> Union[int, None]:
@@ -86,7 +150,7 @@ class InstallQtBinding(PreLaunchHook):
             "install",
             # we need to specify exact version of PySide6 to make sure
             # it is binary compatible with Marvelous Designer's python version
-            f"PySide6=={_PYSIDE6_VERSION}",
+            f"PySide6=={PYSIDE6_VERSION}",
             "--target",
             qt_binding_dir.as_posix(),
             "--ignore-installed",
@@ -132,7 +196,12 @@ class InstallQtBinding(PreLaunchHook):
         return None
 
     def extract_wheels(self, qt_binding_dir: Path) -> bool:
-        """Download PySide6 wheels from PyPI to a temp dir and extract them.
+        """Download PySide6 wheels from PyPI and extract them.
+
+        Wheels are taken from the wheelhouse when configured, otherwise
+        they are downloaded in parallel to the wheelhouse or a persistent
+        download directory, so interrupted downloads are resumed by the
+        next launch. Concurrent launches wait for a single extraction.
 
         Args:
             qt_binding_dir (Path): The directory to extract wheel contents
@@ -143,167 +212,15 @@ class InstallQtBinding(PreLaunchHook):
                 successfully, False otherwise.
 
         """
-        tmp_dir = Path(tempfile.mkdtemp(prefix="ayon_pyside6_"))
+        prelaunch_settings = (
+            self.data["project_settings"]["marvelous_designer"]
+            ["prelaunch_settings"]
+        )
         try:
-            for package in _PYSIDE6_PACKAGES:
-                if self._is_package_extracted(
-                    qt_binding_dir, package, _PYSIDE6_VERSION
-                ):
-                    self.log.info(
-                        "%s==%s already extracted, skipping.",
-                        package,
-                        _PYSIDE6_VERSION,
-                    )
-                    continue
-
-                self.log.info("Resolving compatible wheel for %s ...", package)
-                wheel_path, wheel_filename = self._download_wheel_from_pypi(
-                    package, _PYSIDE6_VERSION, tmp_dir
-                )
-                with zipfile.ZipFile(wheel_path, "r") as zip_ref:
-                    zip_ref.extractall(qt_binding_dir)
-                self.log.info("Extracted %s", wheel_filename)
+            install_qt_binding(qt_binding_dir, prelaunch_settings)
         except Exception as error:
             self.log.warning(
                 'Failed to download/extract wheels: "%s".', error,
                 exc_info=True)
             return False
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
         return True
-
-    @staticmethod
-    def _is_package_extracted(
-            qt_binding_dir: Path, package: str, version: str) -> bool:
-        """Return whether a package/version appears to already be extracted.
-
-        Args:
-            qt_binding_dir(Path): Directory where the package is extracted.
-            package (str): PyPI package name.
-            version (str): Exact version string.
-
-        Returns:
-            bool: True if the package appears to be already extracted,
-                False otherwise.
-        """
-        normalized = package.lower().replace("-", "_")
-        dist_info_name = f"{normalized}-{version}.dist-info"
-
-        for path in qt_binding_dir.glob("*.dist-info"):
-            if path.name.lower() == dist_info_name:
-                return True
-
-        return False
-
-    @staticmethod
-    def _download_wheel_from_pypi(
-            package: str, version: str,
-            dest_dir: Path) -> tuple[Path, str]:
-        """Download a compatible wheel from PyPI using the JSON API.
-
-        Args:
-            package (str): PyPI package name.
-            version: Exact version string.
-            dest_dir: Directory to save the downloaded wheel.
-
-        Returns:
-            tuple[Path, str]: Downloaded wheel path and wheel filename.
-
-        """
-        api_url = f"https://pypi.org/pypi/{package}/{version}/json"
-        with urllib.request.urlopen(api_url, timeout=60) as resp:
-            data = json.loads(resp.read())
-        wheel_url_info = InstallQtBinding._select_compatible_wheel_url(
-            package, version, data.get("urls", [])
-        )
-        wheel_filename = wheel_url_info["filename"]
-        dest = dest_dir / wheel_filename
-        urllib.request.urlretrieve(wheel_url_info["url"], dest)  # noqa: S310
-        return dest, wheel_filename
-
-    @staticmethod
-    def _select_compatible_wheel_url(
-            package: str, version: str, urls: list[dict]) -> dict:
-        """Pick the best matching wheel entry for the current OS/arch.
-
-        Args:
-            package: PyPI package name.
-            version: Exact version string.
-            urls: List of URL info dicts from PyPI JSON API.
-
-        Returns:
-            dict: The URL info dict for the best matching wheel.
-
-        Raises:
-            FileNotFoundError: If no compatible wheel is found.
-        """
-        normalized_package = package.lower().replace("-", "_")
-        prefix = f"{normalized_package}-{version}-cp39-abi3-"
-
-        candidates = [
-            url_info
-            for url_info in urls
-            if url_info.get("packagetype") == "bdist_wheel"
-            and url_info.get("filename", "").lower().startswith(prefix)
-        ]
-
-        if not candidates:
-            msg = (
-                f"No cp39-abi3 wheel candidates found for "
-                f"{package}=={version} on PyPI"
-            )
-            raise FileNotFoundError(msg)
-
-        platform_key = sys.platform
-        machine = platform.machine().lower()
-
-        preferred_tags = InstallQtBinding._preferred_tags(
-            platform_key, machine
-        )
-
-        def _score(filename: str) -> int:
-            lowered = filename.lower()
-            score = 0
-            for tag in preferred_tags:
-                if tag in lowered:
-                    score += 1
-            return score
-
-        best = max(
-            candidates,
-            key=lambda url_info: _score(url_info["filename"]),
-        )
-        if _score(best["filename"]) == 0:
-            available = ", ".join(
-                url_info["filename"] for url_info in candidates
-            )
-            msg = (
-                f"No compatible wheel found for {package}=={version} on "
-                f"platform={platform_key}, arch={machine}. "
-                f"Available: {available}"
-            )
-            raise FileNotFoundError(msg)
-
-        return best
-
-    @staticmethod
-    def _preferred_tags(platform_key: str, machine: str) -> list[str]:
-        """Return tag preferences for selecting a platform-specific wheel.
-
-        Raises:
-            RuntimeError: If the platform is unsupported.
-
-        """
-        if platform_key.startswith("win"):
-            return ["win_amd64"]
-        if platform_key.startswith("linux"):
-            if machine in {"aarch64", "arm64"}:
-                return ["manylinux", "aarch64", "arm64"]
-            return ["manylinux", "x86_64", "amd64"]
-        if platform_key == "darwin":
-            if machine in {"arm64", "aarch64"}:
-                return ["macosx", "universal2", "arm64"]
-            return ["macosx", "universal2", "x86_64"]
-
-        msg = f"Unsupported platform for wheel selection: {platform_key}"
-        raise RuntimeError(msg)
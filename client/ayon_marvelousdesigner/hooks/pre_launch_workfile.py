@@ -4,20 +4,41 @@ This module provides a hook that creates a temporary Zprj file for MD
 when no last workfile exists or when not starting from the last workfile.
 """
 
+from __future__ import annotations
+
+import json
 import os
-import shutil
-from typing import ClassVar
+import uuid
+from typing import ClassVar, Optional
 
 from ayon_applications import LaunchTypes, PreLaunchHook
-from ayon_core.pipeline import tempdir
-from ayon_marvelousdesigner import MARVELOUS_DESIGNER_HOST_DIR
+from ayon_core.lib import StringTemplate, TemplateUnsolved, filter_profiles
+from ayon_core.pipeline import AYON_INSTANCE_ID, tempdir
+from ayon_core.pipeline.create import get_product_name
+from ayon_marvelousdesigner.addon import SEEDED_METADATA_ENV
+from ayon_marvelousdesigner.prelaunch import (
+    DEFAULT_TEMPLATE_PATH,
+    log_duration,
+)
+from ayon_marvelousdesigner.template_cache import TemplateCache
+
+# Workfile instance as created by `CreateWorkfile`
+WORKFILE_CREATOR_IDENTIFIER = "io.ayon.creators.marvelousdesigner.workfile"
+WORKFILE_PRODUCT_TYPE = "workfile"
+WORKFILE_VARIANT = "Main"
 
 
 class CreateTempZprjFile(PreLaunchHook):
     """Create Temp Zprj File to Marvelous Designer.
 
     The temp zprj file would be created in Marvelous Designer prior to
-    the launch of the software if there is no last workfile
+    the launch of the software if there is no last workfile. It is
+    created from the workfile template profile matching the task, or
+    the bundled template, through the local template cache. AYON context
+    data and the workfile instance of the new workfile can be seeded in
+    the environment, so they are not written into the scene on startup.
+    They are stored with the first save, which still happens at the
+    latest on the first publish.
 
     Hook `GlobalHostDataHook` must be executed before this hook.
     """
@@ -25,6 +46,7 @@ class CreateTempZprjFile(PreLaunchHook):
     order = 12
     launch_types: ClassVar = {LaunchTypes.local}
 
+    @log_duration
     def execute(self) -> None:
         """Execute the pre-launch hook to create temp zprj file."""
         last_workfile = self.data.get("last_workfile_path")
@@ -33,16 +55,142 @@ class CreateTempZprjFile(PreLaunchHook):
                 and os.path.exists(last_workfile):
             self.log.info("It is set to start last workfile on start.")
         else:
-            source_template_file = os.path.join(
-                MARVELOUS_DESIGNER_HOST_DIR, "default_zprj", "Untitled_MD.zprj"
+            prelaunch_settings = (
+                self.data["project_settings"]["marvelous_designer"]
+                ["prelaunch_settings"]
             )
+            source_template_file = self._get_template_path(
+                prelaunch_settings)
             staging_dir = tempdir.get_temp_dir(
                 self.data["project_name"],
                 use_local_temp=True
             )
             spm_filename = os.path.basename(source_template_file)
             last_workfile = os.path.join(staging_dir, spm_filename)
-            shutil.copyfile(source_template_file, last_workfile)
+            method = TemplateCache().materialize(
+                source_template_file,
+                last_workfile,
+                allow_hardlink=prelaunch_settings.get(
+                    "template_hardlinks", False),
+            )
+            self.log.info(
+                "Created %s from %s (%s).",
+                last_workfile, source_template_file, method
+            )
             self.launch_context.env["AYON_TEMP_DIR"] = staging_dir
+            # Seeding must never write into the materialized workfile.
+            # A reflink would lose the blocks shared with the cache and
+            # a hardlink would modify the read-only cached template used
+            # by other launches. The metadata is passed in
+            # the environment and written with the first save instead.
+            if prelaunch_settings.get("seed_workfile_metadata", False):
+                self._seed_metadata(last_workfile)
 
         self.launch_context.launch_args.append(last_workfile)
+
+    def _seed_metadata(self, workfile_path: str) -> None:
+        """Seed AYON metadata of the new workfile in the environment.
+
+        The workfile is not modified, Marvelous Designer doesn't see
+        the metadata until the host writes it into the scene.
+        """
+        instance_data = self._get_workfile_instance_data()
+        metadata = {
+            "ayon_context_data": {"publish_attributes": {}},
+            "ayon_instances": {},
+            "ayon_containers": [],
+        }
+        if instance_data is not None:
+            metadata["ayon_instances"][instance_data["instance_id"]] = (
+                instance_data
+            )
+        self.launch_context.env[SEEDED_METADATA_ENV] = json.dumps(
+            {"workfile": workfile_path, "metadata": metadata})
+
+    def _get_workfile_instance_data(self) -> Optional[dict]:
+        """Get data of the workfile instance to seed.
+
+        Returns:
+            Optional[dict]: Instance data as stored by `CreateWorkfile`,
+                or None if there is no task context.
+        """
+        folder_entity = self.data.get("folder_entity")
+        task_entity = self.data.get("task_entity")
+        if not folder_entity or not task_entity:
+            return None
+
+        try:
+            product_name = get_product_name(
+                project_name=self.data["project_name"],
+                task_name=task_entity["name"],
+                task_type=task_entity["taskType"],
+                host_name=self.application.host_name,
+                product_type=WORKFILE_PRODUCT_TYPE,
+                variant=WORKFILE_VARIANT,
+                project_settings=self.data["project_settings"],
+                project_entity=self.data.get("project_entity"),
+            )
+        except Exception:
+            self.log.warning(
+                "Failed to get workfile product name, the workfile "
+                "instance is created in Marvelous Designer.", exc_info=True
+            )
+            return None
+
+        return {
+            "id": AYON_INSTANCE_ID,
+            "instance_id": str(uuid.uuid4()),
+            "creator_identifier": WORKFILE_CREATOR_IDENTIFIER,
+            "productBaseType": WORKFILE_PRODUCT_TYPE,
+            "productType": WORKFILE_PRODUCT_TYPE,
+            "productName": product_name,
+            "folderPath": folder_entity["path"],
+            "task": task_entity["name"],
+            "variant": WORKFILE_VARIANT,
+            "active": True,
+            "creator_attributes": {},
+            "publish_attributes": {},
+        }
+
+    def _get_template_path(self, prelaunch_settings: dict) -> str:
+        """Get template of the workfile for the current task.
+
+        Returns:
+            str: Path to the template from the matching profile, or the
+                bundled template.
+        """
+        task_entity = self.data.get("task_entity") or {}
+        task_type = task_entity.get("taskType")
+        task_name = self.data.get("task_name")
+        profile = filter_profiles(
+            prelaunch_settings.get("workfile_templates", []),
+            {"task_types": task_type, "task_names": task_name},
+            logger=self.log,
+        )
+        if not profile or not profile.get("path"):
+            return DEFAULT_TEMPLATE_PATH
+
+        try:
+            template_path = StringTemplate.format_strict_template(
+                profile["path"],
+                {
+                    "root": self.data["anatomy"].roots,
+                    "project": {"name": self.data["project_name"]},
+                    "task": {"name": task_name, "type": task_type},
+                },
+            )
+        except TemplateUnsolved:
+            self.log.warning(
+                "Failed to fill workfile template path '%s'.",
+                profile["path"], exc_info=True
+            )
+            return DEFAULT_TEMPLATE_PATH
+
+        template_path = os.path.normpath(os.path.expandvars(template_path))
+        if not os.path.isfile(template_path):
+            self.log.warning(
+                "Workfile template '%s' does not exist, using default.",
+                template_path
+            )
+            return DEFAULT_TEMPLATE_PATH
+        return template_path
@@ -1,10 +1,13 @@
 """Creator plugin for creating workfiles."""
 from ayon_core.pipeline import AutoCreator, CreatedInstance
 from ayon_marvelousdesigner.api.pipeline import (
-    get_instances_values,
     set_instance,
     set_instances,
 )
+from ayon_marvelousdesigner.api.plugin import (
+    CACHED_INSTANCES_KEY,
+    cache_instance_data,
+)
 
 
 class CreateWorkfile(AutoCreator):
@@ -43,6 +46,8 @@ class CreateWorkfile(AutoCreator):
         if current_instance is not None:
             current_folder_path = current_instance["folderPath"]
 
+        # Instance seeded by the launcher or stored in the scene is written
+        # only when changed, so opening a workfile doesn't write metadata
         if current_instance is None:
             self.log.info("Auto-creating workfile instance...")
             product_name = self.get_product_name(
@@ -78,6 +83,8 @@ class CreateWorkfile(AutoCreator):
             current_instance["folderPath"] = folder_path
             current_instance["task"] = task_name
             current_instance["productName"] = product_name
+        else:
+            return
         set_instance(
             instance_id=current_instance.get("instance_id"),
             instance_data=current_instance.data_to_store()
@@ -85,7 +92,8 @@ class CreateWorkfile(AutoCreator):
 
     def collect_instances(self) -> None:
         """Collect existing instances from MD and add them to the context."""
-        for instance in get_instances_values():
+        cache_instance_data(self.collection_shared_data)
+        for instance in self.collection_shared_data[CACHED_INSTANCES_KEY]:
             if (
                 instance.get("creator_identifier") == self.identifier
                 # Backwards compatibility
@@ -0,0 +1,236 @@
+"""Scene inventory action updating containers to latest versions in bulk.
+
+Updating containers one by one replaces the data in Marvelous Designer and
+rewrites the whole scene metadata for every container. This action
+resolves all latest representations at once, performs the replacements
+back-to-back and writes the metadata of all containers in a single write.
+One container is updated through the per-container path first, so both
+paths are measured and logged on the same scene.
+"""
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from typing import Optional
+
+import ayon_api
+from ayon_core.pipeline import get_current_project_name
+from ayon_core.pipeline.load import (
+    InventoryAction,
+    discover_loader_plugins,
+    get_representation_contexts_by_ids,
+)
+from ayon_marvelousdesigner.api.pipeline import metadata_batch
+
+
+class UpdateAllContainers(InventoryAction):
+    """Update selected containers to their latest versions in bulk."""
+
+    label = "Update to Latest (Bulk)"
+    icon = "angle-double-up"
+    color = "#bbdd00"
+    order = 1
+
+    @staticmethod
+    def is_compatible(container: dict) -> bool:
+        """Check whether the container can be updated.
+
+        Returns:
+            bool: True if the container has a representation.
+        """
+        return bool(container.get("representation"))
+
+    def process(self, containers: list[dict]) -> bool:
+        """Update outdated containers to their latest versions.
+
+        Args:
+            containers (list[dict]): Selected containers.
+
+        Returns:
+            bool: True to refresh the scene inventory.
+        """
+        project_name = get_current_project_name()
+        loaders_by_name = {
+            loader.__name__: loader
+            for loader in discover_loader_plugins(project_name)
+        }
+
+        start = time.perf_counter()
+        items_by_loader = self._get_update_items(project_name, containers)
+        resolved = time.perf_counter()
+        if not items_by_loader:
+            self.log.info("All selected containers are up to date.")
+            return False
+
+        updates = []
+        for loader_name, items in items_by_loader.items():
+            loader_cls = loaders_by_name.get(loader_name)
+            if loader_cls is None:
+                self.log.warning(
+                    "Loader '%s' not found, skipping %d container(s).",
+                    loader_name, len(items)
+                )
+                continue
+            updates.append((loader_cls(), items))
+        count = sum(len(items) for _, items in updates)
+        if not count:
+            return False
+
+        # Update one container through the per-container path to measure
+        #   its cost next to the bulk update of the others
+        sample_time = None
+        if count > 1:
+            loader, items = updates[0]
+            container, context = items.pop(0)
+            sample_start = time.perf_counter()
+            loader.update(container, context)
+            sample_time = time.perf_counter() - sample_start
+
+        read_start = time.perf_counter()
+        with metadata_batch():
+            batch_start = time.perf_counter()
+            for loader, items in updates:
+                if not items:
+                    continue
+                if hasattr(loader, "update_many"):
+                    loader.update_many(items)
+                else:
+                    for container, context in items:
+                        loader.update(container, context)
+            batch_end = time.perf_counter()
+        flushed = time.perf_counter()
+
+        self._log_timing(
+            count,
+            resolve_time=resolved - start,
+            read_time=batch_start - read_start,
+            update_time=batch_end - batch_start,
+            write_time=flushed - batch_end,
+            sample_time=sample_time,
+        )
+        return True
+
+    @staticmethod
+    def _get_update_items(
+            project_name: str,
+            containers: list[dict]) -> dict[str, list[tuple[dict, dict]]]:
+        """Resolve latest representation contexts of outdated containers.
+
+        Args:
+            project_name (str): Project name.
+            containers (list[dict]): Containers to update.
+
+        Returns:
+            dict[str, list[tuple[dict, dict]]]: Pairs of container and
+                context of the latest representation mapped by loader name.
+        """
+        repre_ids = {
+            container["representation"] for container in containers
+        }
+        repre_entities = {
+            repre_entity["id"]: repre_entity
+            for repre_entity in ayon_api.get_representations(
+                project_name,
+                representation_ids=repre_ids,
+                fields={"id", "name", "versionId"},
+            )
+        }
+        version_entities = {
+            version_entity["id"]: version_entity
+            for version_entity in ayon_api.get_versions(
+                project_name,
+                version_ids={
+                    repre_entity["versionId"]
+                    for repre_entity in repre_entities.values()
+                },
+                fields={"id", "productId", "version"},
+            )
+        }
+        last_versions = ayon_api.get_last_versions(
+            project_name,
+            product_ids={
+                version_entity["productId"]
+                for version_entity in version_entities.values()
+            },
+            fields={"id", "productId", "version"},
+        )
+
+        # Find outdated containers and latest version to update to
+        outdated = []
+        for container in containers:
+            repre_entity = repre_entities.get(container["representation"])
+            if repre_entity is None:
+                continue
+            version_entity = version_entities[repre_entity["versionId"]]
+            last_version = last_versions.get(version_entity["productId"])
+            if (
+                last_version is None
+                or last_version["id"] == version_entity["id"]
+            ):
+                continue
+            outdated.append((container, repre_entity["name"], last_version))
+
+        new_repre_ids_by_key = {
+            (repre_entity["versionId"], repre_entity["name"]):
+                repre_entity["id"]
+            for repre_entity in ayon_api.get_representations(
+                project_name,
+                version_ids={
+                    last_version["id"] for _, _, last_version in outdated
+                },
+                representation_names={
+                    repre_name for _, repre_name, _ in outdated
+                },
+                fields={"id", "name", "versionId"},
+            )
+        } if outdated else {}
+        contexts_by_id = get_representation_contexts_by_ids(
+            project_name, set(new_repre_ids_by_key.values())
+        ) if new_repre_ids_by_key else {}
+
+        items_by_loader = defaultdict(list)
+        for container, repre_name, last_version in outdated:
+            new_repre_id = new_repre_ids_by_key.get(
+                (last_version["id"], repre_name))
+            context = contexts_by_id.get(new_repre_id)
+            if context is None:
+                continue
+            items_by_loader[container["loader"]].append((container, context))
+        return items_by_loader
+
+    def _log_timing(  # noqa: PLR0913
+            self,
+            count: int,
+            *,
+            resolve_time: float,
+            read_time: float,
+            update_time: float,
+            write_time: float,
+            sample_time: Optional[float] = None) -> None:
+        """Log timing of the bulk update and of the per-container sample.
+
+        Args:
+            count (int): Number of updated containers, including the one
+                updated through the per-container path.
+            resolve_time (float): Time resolving latest representations.
+            read_time (float): Time of the single metadata read.
+            update_time (float): Time of the replacements in MD.
+            write_time (float): Time of the single metadata write.
+            sample_time (Optional[float]): Time of the container updated
+                through the per-container path, None if all containers
+                were updated in bulk.
+        """
+        bulk_count = count if sample_time is None else count - 1
+        bulk_time = read_time + update_time + write_time
+        self.log.info(
+            "Updated %d container(s) in %.2fs (resolve %.2fs, "
+            "metadata read %.3fs, MD replace %.2fs, metadata write %.3fs).",
+            count, resolve_time + bulk_time + (sample_time or 0.0),
+            resolve_time, read_time, update_time, write_time,
+        )
+        if sample_time is not None:
+            self.log.info(
+                "Per-container update took %.3fs, bulk update took %.3fs "
+                "per container for %d container(s).",
+                sample_time, bulk_time / bulk_count, bulk_count,
+            )
@@ -5,34 +5,61 @@ formats (ABC, FBX, OBJ) into Marvelous Designer through the AYON pipeline.
 """
 from __future__ import annotations
 
-import json
+import contextlib
 import os
-from pathlib import Path
-from typing import ClassVar, Optional, Union
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, ClassVar, Optional, Union
 
 import ApiTypes
+import ayon_api
 import import_api
-from ayon_core.pipeline import load
+from ayon_core.lib import BoolDef, NumberDef, UILabelDef
+from ayon_core.pipeline import get_current_project_name, load
 from ayon_core.pipeline.load import LoadError
-from ayon_core.pipeline.traits import (
-    FileLocation,
-    Representation,
+from ayon_marvelousdesigner.api import alembic_trim
+from ayon_marvelousdesigner.api.file_cache import (
+    LocalFileCache,
+    get_file_cache,
 )
-from ayon_marvelousdesigner.api.pipeline import containerise
+from ayon_marvelousdesigner.api.lib import (
+    delete_avatars,
+    get_avatar_names,
+    get_local_file,
+    get_published_file_hash,
+    local_files,
+)
+from ayon_marvelousdesigner.api.pipeline import (
+    containerise,
+    containerise_many,
+    get_container_data,
+    imprint,
+    imprint_many,
+    remove_container_data,
+)
+from ayon_marvelousdesigner.api.resolver import (
+    get_representation_filepath,
+    get_resolver_stats,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class LoadPointCache(load.LoaderPlugin):
     """Load Pointcache for project."""
     product_base_types: ClassVar[set[str]] = {"*"}
     product_types: ClassVar[set[str]] = product_base_types
-    representations: ClassVar[set[str]] = {"abc", "fbx", "obj"}
+    representations: ClassVar[set[str]] = {"abc", "fbx", "obj", "proxy"}
 
     label = "Load Pointcache"
     order = -10
     icon = "code-fork"
     color = "orange"
+    is_multiple_contexts_compatible = True
     # Settings
     scale = 1.0
+    file_cache: Optional[LocalFileCache] = None
 
     @classmethod
     def apply_settings(cls, project_settings: dict) -> None:
@@ -43,34 +70,521 @@ class LoadPointCache(load.LoaderPlugin):
                             ["LoadPointCache"]
         )
         cls.scale = md_load_setting.get("scale", cls.scale)
+        cls.file_cache = get_file_cache(
+            project_settings["marvelous_designer"]["load"].get(
+                "local_cache", {})
+        )
+
+    @classmethod
+    def get_options(cls, contexts: list) -> list:  # noqa: ARG003
+        """Get load options for the loader.
+
+        Frame options apply to Alembic caches only. The cache is trimmed
+        to a reduced local copy before import when any of them is set.
+
+        Returns:
+            list: List of attribute definitions for loading.
+        """
+        return [
+            BoolDef(
+                "use_proxy",
+                label="Prefer Proxy",
+                default=False,
+                tooltip=(
+                    "Load decimated 'proxy' representation of the version "
+                    "instead when it exists."
+                ),
+            ),
+            UILabelDef("Alembic Frame Window"),
+            NumberDef(
+                "frame_start",
+                label="Frame Start",
+                default=0,
+                decimals=0,
+                minimum=0,
+                maximum=999999,
+            ),
+            NumberDef(
+                "frame_end",
+                label="Frame End",
+                default=0,
+                decimals=0,
+                minimum=0,
+                maximum=999999,
+                tooltip="Last frame to load, 0 loads until the end.",
+            ),
+            NumberDef(
+                "frame_step",
+                label="Frame Step",
+                default=1,
+                decimals=0,
+                minimum=1,
+                maximum=1000,
+                tooltip="Load every n-th frame.",
+            ),
+            NumberDef(
+                "subsamples",
+                label="Samples per Frame",
+                default=1,
+                decimals=0,
+                minimum=1,
+                maximum=100,
+                tooltip=(
+                    "Number of evenly spaced samples kept per frame, "
+                    "1 keeps only samples on whole frames."
+                ),
+            ),
+        ]
 
     def load(self,
-             context: dict,
+             context: Union[dict, list[dict]],
              name: Optional[str] = None,
              namespace: Optional[str] = None,
              options: Optional[dict] = None) -> None:
-        """Load pointcache into the scene."""
-        file_path = self._get_filepath(context)
-        extension = os.path.splitext(file_path)[-1].lower()
-        loaded_options = self.load_options(extension)
-        self.load_pointcache(file_path, extension, loaded_options)
+        """Load pointcache into the scene.
+
+        A list of contexts, passed when multiple representations are
+        loaded at once, is loaded in one batch.
+        """
+        if isinstance(context, list):
+            self.load_many(context, options)
+            return
+
+        use_proxy = bool((options or {}).get("use_proxy"))
+        source_context = self._get_source_context(context, use_proxy=use_proxy)
+        file_path = get_local_file(
+            get_representation_filepath(source_context),
+            source_context["representation"]["id"],
+            self.file_cache,
+        )
+        data = self._import_pointcache(
+            source_context, file_path, self._get_frame_window(options))
+        data["useProxy"] = use_proxy
         containerise(
             name=name,
             namespace=namespace,
             context=context,
-            loader=self
+            loader=self,
+            options=data,
+        )
+        self._log_cache_stats()
+
+    def load_many(
+            self,
+            contexts: list[dict],
+            options: Optional[dict] = None) -> None:
+        """Load multiple pointcaches in one batch.
+
+        All file paths are resolved first and the files are prefetched
+        concurrently to local storage. Pointcaches are then imported
+        back-to-back and all containers are written with a single
+        metadata write.
+
+        Args:
+            contexts (list[dict]): Representation contexts to load.
+            options (dict): Additional options for loading.
+
+        """
+        use_proxy = bool((options or {}).get("use_proxy"))
+        source_contexts = self._get_source_contexts(
+            contexts, use_proxy=use_proxy)
+        file_paths = [
+            get_representation_filepath(context)
+            for context in source_contexts
+        ]
+        frame_window = self._get_frame_window(options)
+        containers = []
+        with local_files(
+            [
+                (file_path, context["representation"]["id"])
+                for file_path, context in zip(file_paths, source_contexts)
+            ],
+            self.file_cache,
+        ) as local_paths:
+            for context, source_context, file_path in zip(
+                    contexts, source_contexts, file_paths):
+                data = self._import_pointcache(
+                    source_context, local_paths[file_path], frame_window)
+                data["useProxy"] = use_proxy
+                containers.append(get_container_data(
+                    name=context["product"]["name"],
+                    namespace=None,
+                    context=context,
+                    loader=self,
+                    options=data,
+                ))
+        containerise_many(containers)
+        self._log_cache_stats()
+
+    def update(self, container: dict, context: dict) -> None:
+        """Update loaded pointcache in the scene.
+
+        Pointcache is re-imported only when the content of the new file
+        differs from the loaded one, otherwise only the representation
+        of the container is updated. Containers loaded with proxy load
+        the proxy of the new version when it exists.
+
+        Args:
+            container (dict): Container data.
+            context (dict): Context dictionary with representation info.
+
+        """
+        source_context = self._get_source_context(
+            context, use_proxy=container.get("useProxy", False))
+        file_path = get_local_file(
+            get_representation_filepath(source_context),
+            source_context["representation"]["id"],
+            self.file_cache,
+        )
+        imprint(
+            container["objectName"],
+            self._update_pointcache(
+                container, context, source_context, file_path)
+        )
+        self._log_cache_stats()
+
+    def update_many(self, items: list[tuple[dict, dict]]) -> None:
+        """Update multiple loaded pointcaches in one batch.
+
+        All file paths are resolved and prefetched first, pointcaches are
+        then re-imported back-to-back and all containers are written with
+        a single metadata write.
+
+        Args:
+            items (list[tuple[dict, dict]]): Pairs of container data and
+                context with the new representation.
+
+        """
+        proxy_contexts = self._get_source_contexts(
+            [
+                context for container, context in items
+                if container.get("useProxy")
+            ],
+            use_proxy=True,
         )
+        source_contexts = [
+            proxy_contexts.pop(0) if container.get("useProxy") else context
+            for container, context in items
+        ]
+        file_paths = [
+            get_representation_filepath(context)
+            for context in source_contexts
+        ]
+        with local_files(
+            [
+                (file_path, context["representation"]["id"])
+                for file_path, context in zip(file_paths, source_contexts)
+            ],
+            self.file_cache,
+        ) as local_paths:
+            imprint_many({
+                container["objectName"]: self._update_pointcache(
+                    container, context, source_context,
+                    local_paths[file_path])
+                for (container, context), source_context, file_path in zip(
+                    items, source_contexts, file_paths)
+            })
+        self._log_cache_stats()
+
+    def remove(self, container: dict) -> None:
+        """Remove loaded pointcache from the scene.
+
+        Args:
+            container (dict): Container data.
+
+        """
+        not_deleted = delete_avatars(container.get("importedObjects", []))
+        if not_deleted:
+            self.log.warning(
+                "Could not delete imported object(s): %s",
+                ", ".join(not_deleted)
+            )
+        remove_container_data(container["objectName"])
+
+    def _import_pointcache(
+            self,
+            context: dict,
+            file_path: str,
+            frame_window: Optional[dict] = None,
+            file_hash: Optional[str] = None) -> dict:
+        """Import pointcache and get data of its container.
+
+        Args:
+            context (dict): Context dictionary with representation info.
+            file_path (str): Path to pointcache file.
+            frame_window (Optional[dict]): Frame window to trim Alembic
+                cache to before import.
+            file_hash (Optional[str]): Hash of the file if already known.
+
+        Returns:
+            dict: Imported objects, file hash and frame window to store
+                in container.
+
+        """
+        existing_objects = set(get_avatar_names())
+        with self._trimmed_filepath(
+                context, file_path, frame_window) as import_path:
+            extension = os.path.splitext(import_path)[-1].lower()
+            loaded_options = self.load_options(extension)
+            self.load_pointcache(import_path, extension, loaded_options)
+        data = {
+            "importedObjects": [
+                object_name for object_name in get_avatar_names()
+                if object_name not in existing_objects
+            ],
+            "fileHash": file_hash or self._get_file_hash(context, file_path),
+        }
+        if frame_window:
+            data["frameWindow"] = frame_window
+        return data
+
+    def _update_pointcache(
+            self,
+            container: dict,
+            context: dict,
+            source_context: dict,
+            file_path: str) -> dict:
+        """Re-import pointcache of a container if its content changed.
+
+        Marvelous Designer import API has no way to replace animation data
+        of already imported objects, so the objects are deleted and the
+        new file is imported again with the frame window of the container.
+
+        Args:
+            container (dict): Container data.
+            context (dict): Context dictionary with representation info.
+            source_context (dict): Context of the representation whose
+                file is imported, the proxy or the context itself.
+            file_path (str): Path to the new pointcache file.
+
+        Returns:
+            dict: Data to imprint to the container.
+
+        """
+        data = {"representation": context["representation"]["id"]}
+        file_hash = self._get_file_hash(source_context, file_path)
+        if file_hash == container.get("fileHash"):
+            self.log.info(
+                "Content of %s is unchanged, skipping re-import.", file_path)
+            return data
+
+        not_deleted = delete_avatars(container.get("importedObjects", []))
+        if not_deleted:
+            self.log.warning(
+                "Could not delete previously imported object(s): %s",
+                ", ".join(not_deleted)
+            )
+        data.update(self._import_pointcache(
+            source_context,
+            file_path,
+            container.get("frameWindow"),
+            file_hash,
+        ))
+        return data
+
+    def _get_file_hash(self, context: dict, file_path: str) -> str:
+        """Get content hash of the published file of a representation.
+
+        Args:
+            context (dict): Context dictionary with representation info.
+            file_path (str): Path to the local copy of the file.
+
+        Returns:
+            str: Hex digest of the file content.
+
+        """
+        return get_published_file_hash(
+            get_representation_filepath(context),
+            file_path,
+            context["representation"]["id"],
+            self.file_cache,
+        )
+
+    def _get_source_context(
+            self, context: dict, *, use_proxy: bool) -> dict:
+        """Get context of the representation to import.
+
+        Args:
+            context (dict): Context dictionary with representation info.
+            use_proxy (bool): Prefer proxy representation of the version.
+
+        Returns:
+            dict: Context of the proxy representation if requested and
+                available, otherwise the context itself.
+
+        """
+        return self._get_source_contexts([context], use_proxy=use_proxy)[0]
+
+    def _get_source_contexts(
+            self, contexts: list[dict], *, use_proxy: bool) -> list[dict]:
+        """Get contexts of the representations to import.
+
+        Proxy representations of all versions are queried at once.
+
+        Args:
+            contexts (list[dict]): Representation contexts.
+            use_proxy (bool): Prefer proxy representations of the versions.
+
+        Returns:
+            list[dict]: Contexts with representations replaced by their
+                proxies where available.
+
+        """
+        if not use_proxy or not contexts:
+            return contexts
+
+        version_ids = {
+            context["representation"]["versionId"] for context in contexts
+            if context["representation"]["name"] != "proxy"
+        }
+        proxies_by_version_id = {
+            repre_entity["versionId"]: repre_entity
+            for repre_entity in ayon_api.get_representations(
+                get_current_project_name(),
+                version_ids=version_ids,
+                representation_names={"proxy"},
+            )
+        } if version_ids else {}
+
+        source_contexts = []
+        for context in contexts:
+            proxy = proxies_by_version_id.get(
+                context["representation"]["versionId"])
+            if proxy is None:
+                if context["representation"]["name"] != "proxy":
+                    self.log.info(
+                        "No proxy published for %s, loading full "
+                        "resolution.", context["product"]["name"]
+                    )
+                source_contexts.append(context)
+                continue
+            source_contexts.append({**context, "representation": proxy})
+        return source_contexts
+
+    @staticmethod
+    def _get_frame_window(options: Optional[dict]) -> Optional[dict]:
+        """Get frame window from load options.
+
+        Args:
+            options (Optional[dict]): Load options.
+
+        Returns:
+            Optional[dict]: Frame window or None if the whole cache
+                should be loaded.
+
+        """
+        options = options or {}
+        frame_window = {
+            "frameStart": int(options.get("frame_start", 0)),
+            "frameEnd": int(options.get("frame_end", 0)),
+            "frameStep": max(1, int(options.get("frame_step", 1))),
+            "subsamples": max(1, int(options.get("subsamples", 1))),
+        }
+        if (
+            not frame_window["frameStart"]
+            and not frame_window["frameEnd"]
+            and frame_window["frameStep"] == 1
+            and frame_window["subsamples"] == 1
+        ):
+            return None
+        return frame_window
+
+    @contextlib.contextmanager
+    def _trimmed_filepath(
+            self,
+            context: dict,
+            file_path: str,
+            frame_window: Optional[dict]) -> Iterator[str]:
+        """Get path to Alembic cache trimmed to the frame window.
+
+        Trimmed copies are kept in the local file cache keyed by
+        representation and frame window, so loading the same window again
+        doesn't trim the cache again. Without the cache the copy is
+        trimmed to a temporary directory which is removed when the block
+        exits, so the file must be imported inside of it.
+
+        Args:
+            context (dict): Context dictionary with representation info.
+            file_path (str): Path to pointcache file.
+            frame_window (Optional[dict]): Frame window to trim to.
+
+        Yields:
+            str: Path to the trimmed copy, or the original path if
+                the cache can't be trimmed.
+
+        """
+        extension = os.path.splitext(file_path)[-1].lower()
+        if not frame_window or extension != ".abc":
+            yield file_path
+            return
+        if not alembic_trim.is_available():
+            self.log.warning(
+                "PyAlembic is not available, loading the whole cache "
+                "instead of frame window."
+            )
+            yield file_path
+            return
+
+        fps = self._get_fps(context)
+
+        def _trim(src_path: str, dst_path: str) -> None:
+            alembic_trim.trim_alembic(src_path, dst_path, fps, frame_window)
+
+        variant = "frames_{frameStart}_{frameEnd}_{frameStep}_{subsamples}"
+        staging_dir = None
+        try:
+            if self.file_cache is not None:
+                trimmed_path = self.file_cache.get_derived(
+                    file_path,
+                    context["representation"]["id"],
+                    variant.format(**frame_window),
+                    _trim,
+                )
+            else:
+                staging_dir = tempfile.mkdtemp(prefix="ayon_md_trim_")
+                trimmed_path = os.path.join(
+                    staging_dir, os.path.basename(file_path))
+                _trim(file_path, trimmed_path)
+        except (RuntimeError, ValueError, OSError):
+            self.log.warning(
+                "Failed to trim %s, loading the whole cache.",
+                file_path, exc_info=True
+            )
+            trimmed_path = file_path
+
+        try:
+            yield trimmed_path
+        finally:
+            if staging_dir is not None:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+    @staticmethod
+    def _get_fps(context: dict) -> float:
+        """Get frames per second of the loaded representation.
+
+        Args:
+            context (dict): Context dictionary with representation info.
+
+        Returns:
+            float: Frames per second.
+
+        """
+        for entity_type in ("version", "folder", "project"):
+            fps = context.get(entity_type, {}).get("attrib", {}).get("fps")
+            if fps:
+                return float(fps)
+        return 25.0
 
     @staticmethod
     def load_pointcache(
-        file_path: Path,
+        file_path: str,
         extension: str,
         options: Union[ApiTypes.ImportAlembicOption,
                        ApiTypes.ImportExportOption]) -> None:
         """Actual loading logic for pointcache.
 
         Args:
-            file_path (Path): Path to pointcache file.
+            file_path (str): Path to pointcache file.
             extension (str): Extension of pointcache file.
             options (ApiTypes.ImportExportOption): Options for loading.
 
@@ -117,30 +631,7 @@ class LoadPointCache(load.LoaderPlugin):
         msg = f"Unsupported pointcache format: {extension}"
         raise LoadError(msg)
 
-    def _get_filepath(self, context: dict) -> str:
-        """Gets filepath with either representation trait or context data.
-
-        For backward compatibility only.
-
-        Args:
-            context (dict): Context dictionary.
-
-        Returns:
-            str: File path to load.
-
-        """
-        traits_raw = context["representation"].get("traits")
-        if traits_raw is not None:
-            # construct Representation object from the context
-            representation = Representation.from_dict(
-                name=context["representation"]["name"],
-                representation_id=context["representation"]["id"],
-                trait_data=json.loads(traits_raw),
-            )
-
-            file_path: Path = representation.get_trait(FileLocation).file_path
-        else:
-            filepath = self.filepath_from_context(context)
-            file_path = Path(filepath)
-
-        return file_path.as_posix()
+    def _log_cache_stats(self) -> None:
+        if self.file_cache is not None:
+            self.file_cache.log_stats(self.log)
+        self.log.debug("Path resolver: %s", get_resolver_stats())
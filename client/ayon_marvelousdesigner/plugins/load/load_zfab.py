@@ -1,20 +1,25 @@
 """Plugin to load ZFab files into Marvelous Designer."""
 from __future__ import annotations
 
-import json
-from pathlib import Path
-from typing import ClassVar, Optional
+from typing import ClassVar, Optional, Union
 
 import fabric_api
+from ayon_core.lib import BoolDef
 from ayon_core.pipeline import load
-from ayon_core.pipeline.traits import (
-    FileLocation,
-    Representation,
+from ayon_marvelousdesigner.api.file_cache import (
+    LocalFileCache,
+    get_file_cache,
 )
-from ayon_marvelousdesigner.api.pipeline import (
-    containerise,
-    imprint,
-    remove_container_data,
+from ayon_marvelousdesigner.api.lib import (
+    FabricRegistry,
+    get_local_file,
+    get_published_file_hash,
+    local_files,
+)
+from ayon_marvelousdesigner.api.pipeline import get_container_data
+from ayon_marvelousdesigner.api.resolver import (
+    get_representation_filepath,
+    get_resolver_stats,
 )
 
 
@@ -28,82 +33,313 @@ class LoadZfab(load.LoaderPlugin):
     order = -10
     icon = "code-fork"
     color = "orange"
+    is_multiple_contexts_compatible = True
+    # Settings
+    file_cache: Optional[LocalFileCache] = None
+
+    @classmethod
+    def apply_settings(cls, project_settings: dict) -> None:
+        """Apply settings from project settings."""
+        md_load_setting = project_settings["marvelous_designer"]["load"]
+        cls.file_cache = get_file_cache(
+            md_load_setting.get("local_cache", {}))
+
+    @classmethod
+    def get_options(cls, contexts: list) -> list:  # noqa: ARG003
+        """Get load options for the loader.
+
+        Returns:
+            list: List of attribute definitions for loading.
+        """
+        return [
+            BoolDef(
+                "force_new_copy",
+                label="Force new copy",
+                default=False,
+                tooltip=(
+                    "Add the fabric even if the same representation or "
+                    "an identical file is already loaded in the scene."
+                ),
+            )
+        ]
 
     def load(
             self,
-            context: dict,
+            context: Union[dict, list[dict]],
             name: Optional[str] = None,
             namespace: Optional[str] = None,
             options: Optional[dict] = None) -> None:
-        """Load pointcache into the scene.
+        """Load zfab into the scene.
+
+        Fabrics already loaded from the same representation or from a file
+        with identical content are reused instead of added again, unless
+        `force_new_copy` option is enabled. A list of contexts, passed
+        when multiple representations are loaded at once, is loaded in
+        one batch.
 
         Args:
-            context (dict): Context dictionary with representation info.
+            context (Union[dict, list[dict]]): Context dictionary with
+                representation info, or a list of them.
             name (str): Name of the container.
             namespace (str): Namespace for the loaded data.
             options (dict): Additional options for loading.
 
         """
-        file_path = self._get_filepath(context)
+        if isinstance(context, list):
+            self.load_many(context, options)
+            return
 
-        fabric_index = fabric_api.AddFabric(file_path)
-        containerise(
-            name=name,
-            namespace=namespace,
-            context=context,
-            loader=self,
-            options={"fabricIndex": fabric_index}
+        options = options or {}
+        file_path = get_local_file(
+            get_representation_filepath(context),
+            context["representation"]["id"],
+            self.file_cache,
         )
 
+        registry = FabricRegistry.from_scene()
+        registry.resolve()
+        self._load_fabric(
+            registry, context, file_path, name, namespace,
+            force_new_copy=options.get("force_new_copy", False),
+        )
+        registry.write()
+        self._log_cache_stats()
+
+    def load_many(
+            self,
+            contexts: list[dict],
+            options: Optional[dict] = None) -> None:
+        """Load multiple zfab representations in one batch.
+
+        All file paths are resolved first and the files are prefetched
+        concurrently to local storage. Fabrics are then added back-to-back
+        and all containers are written with a single metadata write.
+
+        Args:
+            contexts (list[dict]): Representation contexts to load.
+            options (dict): Additional options for loading.
+
+        """
+        options = options or {}
+        file_paths = [
+            get_representation_filepath(context) for context in contexts
+        ]
+        registry = FabricRegistry.from_scene()
+        registry.resolve()
+        with local_files(
+            [
+                (file_path, context["representation"]["id"])
+                for file_path, context in zip(file_paths, contexts)
+            ],
+            self.file_cache,
+        ) as local_paths:
+            for context, file_path in zip(contexts, file_paths):
+                self._load_fabric(
+                    registry, context, local_paths[file_path],
+                    context["product"]["name"], None,
+                    force_new_copy=options.get("force_new_copy", False),
+                )
+        registry.write()
+        self._log_cache_stats()
+
     def update(self, container: dict, context: dict) -> None:
         """Update loaded zfab in the scene.
 
+        The fabric is replaced in place when the container is its only
+        reference. A fabric shared with other containers is left untouched
+        and the container is pointed to a fabric with the new content.
+
         Args:
             container (dict): Container data.
             context (dict): Context dictionary with representation info.
 
         """
-        file_path = self._get_filepath(context)
+        file_path = get_local_file(
+            get_representation_filepath(context),
+            context["representation"]["id"],
+            self.file_cache,
+        )
 
-        fabric_index = container.get("fabricIndex")
-        if fabric_index is not None:
-            fabric_api.ReplaceFabric(fabric_index, file_path.as_posix())
-        imprint(container["objectName"], {
-            "representation": context["representation"]["id"],
-        })
+        registry = FabricRegistry.from_scene()
+        registry.resolve()
+        self._update_fabric(registry, container, context, file_path)
+        registry.write()
+        self._log_cache_stats()
+
+    def update_many(self, items: list[tuple[dict, dict]]) -> None:
+        """Update multiple loaded zfabs in one batch.
+
+        All file paths are resolved and prefetched first, fabrics are then
+        replaced back-to-back and all containers are written with a single
+        metadata write.
+
+        Args:
+            items (list[tuple[dict, dict]]): Pairs of container data and
+                context with the new representation.
+
+        """
+        file_paths = [
+            get_representation_filepath(context) for _, context in items
+        ]
+        registry = FabricRegistry.from_scene()
+        registry.resolve()
+        with local_files(
+            [
+                (file_path, context["representation"]["id"])
+                for file_path, (_, context) in zip(file_paths, items)
+            ],
+            self.file_cache,
+        ) as local_paths:
+            for (container, context), file_path in zip(items, file_paths):
+                self._update_fabric(
+                    registry, container, context, local_paths[file_path])
+        registry.write()
+        self._log_cache_stats()
 
     def remove(self, container: dict) -> None:  # noqa: PLR6301
-        """Remove loaded zfab from the scene."""
-        fabric_index = container.get("fabricIndex")
-        if fabric_index is not None:
+        """Remove loaded zfab from the scene.
+
+        The fabric itself is deleted only when the last container
+        referencing it is removed.
+        """
+        registry = FabricRegistry.from_scene()
+        registry.resolve()
+        object_name = container["objectName"]
+        registered = registry.get(object_name) or container
+        fabric_index = registered.get("fabricIndex")
+        fabric_deleted = False
+        if (
+            fabric_index is not None
+            and len(registry.get_references(fabric_index)) <= 1
+        ):
             fabric_api.DeleteFabric(fabric_index)
+            fabric_deleted = True
 
-        remove_container_data(container["objectName"])
+        # Removal shifts indices of the following fabric containers
+        registry.remove(object_name, fabric_deleted=fabric_deleted)
+        registry.write()
 
-    def _get_filepath(self, context: dict) -> Path:
-        """Gets filepath with either representation trait or context data.
+    def _log_cache_stats(self) -> None:
+        if self.file_cache is not None:
+            self.file_cache.log_stats(self.log)
+        self.log.debug("Path resolver: %s", get_resolver_stats())
 
-        For backward compatibility only.
+    def _get_file_hash(self, context: dict, file_path: str) -> str:
+        """Get content hash of the published file of a representation.
 
         Args:
-            context (dict): Context dictionary.
+            context (dict): Context dictionary with representation info.
+            file_path (str): Path to the local copy of the file.
 
         Returns:
-            Path: File path to load.
+            str: Hex digest of the file content.
 
         """
-        traits_raw = context["representation"].get("traits")
-        if traits_raw is not None:
-            # construct Representation object from the context
-            representation = Representation.from_dict(
-                name=context["representation"]["name"],
+        return get_published_file_hash(
+            get_representation_filepath(context),
+            file_path,
+            context["representation"]["id"],
+            self.file_cache,
+        )
+
+    def _load_fabric(  # noqa: PLR0913
+            self,
+            registry: FabricRegistry,
+            context: dict,
+            file_path: str,
+            name: Optional[str],
+            namespace: Optional[str],
+            *,
+            force_new_copy: bool = False) -> dict:
+        """Add fabric to the scene and register its container.
+
+        Args:
+            registry (FabricRegistry): Registry of the scene fabrics.
+            context (dict): Context dictionary with representation info.
+            file_path (str): Path to the zfab file.
+            name (str): Name of the container.
+            namespace (str): Namespace for the loaded data.
+            force_new_copy (bool): Add the fabric even if it is already
+                loaded.
+
+        Returns:
+            dict: Registered container data.
+
+        """
+        file_hash = self._get_file_hash(context, file_path)
+        existing = None
+        if not force_new_copy:
+            existing = registry.find_loaded(
                 representation_id=context["representation"]["id"],
-                trait_data=json.loads(traits_raw),
+                file_hash=file_hash,
+            )
+
+        if existing is not None:
+            fabric_index = existing["fabricIndex"]
+            fabric_name = existing.get("fabricName")
+            self.log.info(
+                "Reusing fabric '%s' (index %s) already loaded by %s.",
+                fabric_name, fabric_index, existing["objectName"]
             )
+        else:
+            fabric_index = fabric_api.AddFabric(file_path)
+            fabric_name = fabric_api.GetFabricName(fabric_index)
+
+        return registry.add(get_container_data(
+            name=name,
+            namespace=namespace,
+            context=context,
+            loader=self,
+            options={
+                "fabricIndex": fabric_index,
+                "fabricName": fabric_name,
+                "fabricHash": file_hash,
+            }
+        ))
+
+    def _update_fabric(
+            self,
+            registry: FabricRegistry,
+            container: dict,
+            context: dict,
+            file_path: str) -> None:
+        """Replace fabric of a container and update its registry data.
 
-            file_path: Path = representation.get_trait(FileLocation).file_path
+        Args:
+            registry (FabricRegistry): Registry of the scene fabrics.
+            container (dict): Container data.
+            context (dict): Context dictionary with representation info.
+            file_path (str): Path to the new zfab file.
+
+        """
+        representation_id = context["representation"]["id"]
+        object_name = container["objectName"]
+        data = {"representation": representation_id}
+        registered = registry.get(object_name) or container
+        fabric_index = registered.get("fabricIndex")
+        if fabric_index is None:
+            registry.update(object_name, data)
+            return
+
+        file_hash = self._get_file_hash(context, file_path)
+        if len(registry.get_references(fabric_index)) > 1:
+            existing = registry.find_loaded(
+                representation_id=representation_id,
+                file_hash=file_hash,
+            )
+            if existing is not None:
+                fabric_index = existing["fabricIndex"]
+                fabric_name = existing.get("fabricName")
+            else:
+                fabric_index = fabric_api.AddFabric(file_path)
+                fabric_name = fabric_api.GetFabricName(fabric_index)
         else:
-            filepath = self.filepath_from_context(context)
-            file_path = Path(filepath).as_posix()
+            fabric_api.ReplaceFabric(fabric_index, file_path)
+            fabric_name = fabric_api.GetFabricName(fabric_index)
 
-        return file_path
+        data.update({
+            "fabricIndex": fabric_index,
+            "fabricName": fabric_name,
+            "fabricHash": file_hash,
+        })
+        registry.update(object_name, data)
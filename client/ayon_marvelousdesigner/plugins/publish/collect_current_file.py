@@ -7,7 +7,8 @@ path into the publish context for Marvelous Designer projects.
 from typing import ClassVar
 
 import pyblish.api
-from ayon_core.pipeline import registered_host
+from ayon_marvelousdesigner.api.lib import get_context_snapshot
+from ayon_marvelousdesigner.api.publish_report import report_process
 
 
 class CollectCurrentFile(pyblish.api.ContextPlugin):
@@ -17,14 +18,14 @@ class CollectCurrentFile(pyblish.api.ContextPlugin):
     label = "Current Workfile"
     hosts: ClassVar[list[str]] = ["marvelousdesigner"]
 
+    @report_process
     def process(self, context: pyblish.api.Context) -> None:
         """Process the context to inject current workfile path.
 
         Args:
             context (pyblish.api.Context): The publish context to modify.
         """
-        host = registered_host()
-        path = host.get_current_workfile()
+        path = get_context_snapshot(context)["currentFile"]
         if not path:
             self.log.error("Scene is not saved.")
 
@@ -4,6 +4,7 @@ from typing import ClassVar
 import pyblish.api
 from ayon_core.lib import BoolDef, UILabelDef, UISeparatorDef
 from ayon_core.pipeline.publish import AYONPyblishPluginMixin
+from ayon_marvelousdesigner.api.publish_report import report_process
 
 
 class CollectExportOption(pyblish.api.InstancePlugin,
@@ -15,6 +16,7 @@ class CollectExportOption(pyblish.api.InstancePlugin,
     hosts: ClassVar[list[str]] = ["marvelousdesigner"]
     families: ClassVar[list[str]] = ["model", "pointcache"]
 
+    @report_process
     def process(self, instance: pyblish.api.Instance) -> None:
         """Inject the current export option.
 
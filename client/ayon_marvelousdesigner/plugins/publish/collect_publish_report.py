@@ -0,0 +1,30 @@
+"""Start per-plugin timing and memory report of the publish."""
+import os
+from typing import ClassVar
+
+import pyblish.api
+from ayon_marvelousdesigner.api.publish_report import start_publish_report
+
+
+class CollectPublishReport(pyblish.api.ContextPlugin):
+    """Start publish report before any other Marvelous Designer plugin.
+
+    Marvelous Designer plugins record their wall time, CPU time, memory
+    peak and output bytes into the report, which is written to the report
+    directory by `IntegratePublishReport`.
+    """
+
+    order = pyblish.api.CollectorOrder - 0.99
+    label = "Start Publish Report"
+    hosts: ClassVar[list[str]] = ["marvelousdesigner"]
+    # Settings
+    enabled = False
+    report_dir = ""
+
+    def process(self, context: pyblish.api.Context) -> None:
+        """Start the publish report.
+
+        Args:
+            context (pyblish.api.Context): The publish context.
+        """
+        start_publish_report(context, os.path.expandvars(self.report_dir))
@@ -0,0 +1,35 @@
+"""Collect a snapshot of the Marvelous Designer scene state."""
+from typing import ClassVar
+
+import pyblish.api
+from ayon_marvelousdesigner.api.lib import get_scene_snapshot
+from ayon_marvelousdesigner.api.publish_report import report_process
+
+
+class CollectSceneSnapshot(pyblish.api.ContextPlugin):
+    """Collect scene state into context.
+
+    Current file, unsaved changes flag, AYON metadata, fabrics and
+    workfile size and modification time are queried once, so the other
+    plugins read `context.data["sceneSnapshot"]` instead of querying
+    the host again. Plugins changing the scene refresh affected values
+    with `invalidate_context_snapshot`.
+    """
+
+    order = pyblish.api.CollectorOrder - 0.51
+    label = "Collect Scene Snapshot"
+    hosts: ClassVar[list[str]] = ["marvelousdesigner"]
+
+    @report_process
+    def process(self, context: pyblish.api.Context) -> None:
+        """Process the context to collect the scene snapshot.
+
+        Args:
+            context (pyblish.api.Context): The publish context to modify.
+        """
+        snapshot = get_scene_snapshot()
+        context.data["sceneSnapshot"] = snapshot
+        self.log.debug(
+            "Collected scene snapshot of %s with %d fabric(s).",
+            snapshot["currentFile"], len(snapshot["fabrics"])
+        )
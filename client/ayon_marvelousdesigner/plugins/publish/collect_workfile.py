@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import ClassVar
 
 import pyblish.api
+from ayon_marvelousdesigner.api.publish_report import report_process
 
 
 class CollectWorkfile(pyblish.api.InstancePlugin):
@@ -14,6 +15,7 @@ class CollectWorkfile(pyblish.api.InstancePlugin):
     hosts: ClassVar[list[str]] = ["marvelousdesigner"]
     families: ClassVar[list[str]] = ["workfile"]
 
+    @report_process
     def process(self, instance: pyblish.api.Instance) -> None:
         """Inject the current working file.
 
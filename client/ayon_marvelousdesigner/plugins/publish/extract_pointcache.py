@@ -26,6 +26,8 @@ from ayon_core.pipeline.traits import (
     Static,
     TraitValidationError,
 )
+from ayon_marvelousdesigner.api import obj_proxy
+from ayon_marvelousdesigner.api.publish_report import report_process
 
 
 class ExtractPointCache(publish.Extractor, OptionalPyblishPluginMixin):
@@ -38,6 +40,7 @@ class ExtractPointCache(publish.Extractor, OptionalPyblishPluginMixin):
     optional = True
     extension = "abc"
 
+    @report_process
     def process(self, instance: pyblish.api.Instance) -> None:
         """Process the instance to extract point cache data.
 
@@ -168,12 +171,17 @@ class ExtractObj(ExtractPointCache):
 
     label = "Extract OBJ"
     extension = "obj"
+    # Settings
+    create_proxy = False
+    proxy_grid_resolution = 64
 
+    @report_process
     def process(self, instance: pyblish.api.Instance) -> None:
         """Process the instance to extract point cache data in OBJ format.
 
         This method extends the base process method to handle additional
-        XML metadata extraction specific to OBJ exports.
+        XML metadata extraction specific to OBJ exports and the optional
+        decimated proxy.
 
         Args:
             instance (pyblish.api.Instance): The instance to process
@@ -212,6 +220,60 @@ class ExtractObj(ExtractPointCache):
                 xml_rep.get_trait(FileLocation).file_path,
             )
 
+        if self.create_proxy:
+            self._extract_proxy(instance)
+
+    def _extract_proxy(self, instance: pyblish.api.Instance) -> None:
+        """Extract decimated proxy of the extracted OBJ file.
+
+        Decimation ratio and vertex counts are stored in version data
+        under `proxy` key.
+
+        Args:
+            instance (pyblish.api.Instance): The instance to process.
+
+        """
+        if not obj_proxy.is_available():
+            self.log.warning(
+                "NumPy is not available, skipping OBJ proxy extraction.")
+            return
+
+        stagingdir = Path(self.staging_dir(instance))
+        src_path = stagingdir / f"{instance.name}.{self.extension}"
+        proxy_path = stagingdir / f"{instance.name}_proxy.{self.extension}"
+        stats = obj_proxy.decimate_obj(
+            src_path.as_posix(),
+            proxy_path.as_posix(),
+            self.proxy_grid_resolution,
+        )
+        proxy_rep = Representation(
+            "proxy",
+            traits=[
+                Static(),
+                FileLocation(file_path=proxy_path),
+                Persistent(),
+                Geometry(),
+            ],
+        )
+        try:
+            proxy_rep.validate()
+        except TraitValidationError as e:
+            msg = f"Representation {proxy_rep.name} is invalid: {e}"
+            self.log.exception(msg)
+        finally:
+            add_trait_representations(instance, [proxy_rep])
+
+        instance.data.setdefault("versionData", {})["proxy"] = stats
+        self.log.info(
+            "Extracted proxy of '%s' to: %s (%d -> %d vertices, "
+            "ratio %.3f).",
+            instance.name,
+            proxy_path,
+            stats["vertexCount"],
+            stats["proxyVertexCount"],
+            stats["ratio"],
+        )
+
 
 class ExtractFbx(ExtractPointCache):
     """Extract Geometry in FBX Format."""
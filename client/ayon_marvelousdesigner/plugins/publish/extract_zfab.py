@@ -17,6 +17,7 @@ from ayon_core.pipeline.traits import (
     Representation,
     Static,
 )
+from ayon_marvelousdesigner.api.publish_report import report_process
 
 
 class ExtractZFab(publish.Extractor):
@@ -30,6 +31,7 @@ class ExtractZFab(publish.Extractor):
     hosts: ClassVar[list[str]] = ["marvelousdesigner"]
     families: ClassVar[list[str]] = ["zfab"]
 
+    @report_process
     def process(self, instance: pyblish.api.Instance) -> None:
         """Process the instance to extract zfab data."""
         stagingdir = self.staging_dir(instance)
@@ -38,6 +40,10 @@ class ExtractZFab(publish.Extractor):
         filepath = os.path.join(stagingdir, filename)
         target_fabric_index = instance.data["fabricIndex"]
 
+        self.log.debug(
+            "Exporting fabric '%s' (index %s).",
+            instance.data.get("fabricName"), target_fabric_index
+        )
         fabric_api.ExportZFab(filepath, target_fabric_index)
 
         rep = Representation(extension, traits=[
@@ -52,7 +58,7 @@ class ExtractZFab(publish.Extractor):
         )
 
         self.log.info(
-            "Extracted instance '%: %s' to: %s",
+            "Extracted instance '%s: %s' to: %s",
             instance.name,
             rep.name,
             rep.get_trait(FileLocation).file_path,
@@ -9,6 +9,8 @@ from typing import ClassVar
 import pyblish.api
 from ayon_core.lib import version_up
 from ayon_core.pipeline import KnownPublishError, registered_host
+from ayon_marvelousdesigner.api.lib import invalidate_context_snapshot
+from ayon_marvelousdesigner.api.publish_report import report_process
 
 
 class IncrementWorkfileVersion(pyblish.api.ContextPlugin):
@@ -19,6 +21,7 @@ class IncrementWorkfileVersion(pyblish.api.ContextPlugin):
     optional = True
     hosts: ClassVar[list[str]] = ["marvelousdesigner"]
 
+    @report_process
     def process(self, context: pyblish.api.Context) -> None:
         """Process the context to increment the workfile version.
 
@@ -50,7 +53,6 @@ class IncrementWorkfileVersion(pyblish.api.ContextPlugin):
                     anatomy=context.data["anatomy"],
                 )
             )
-            new_filepath = host.get_current_workfile()
 
         except ImportError:
             # Backwards compatibility before ayon-core 1.5.0
@@ -61,4 +63,6 @@ class IncrementWorkfileVersion(pyblish.api.ContextPlugin):
             new_filepath = version_up(current_filepath)
             host.save_workfile(new_filepath)
 
+        new_filepath = invalidate_context_snapshot(
+            context, ["currentFile", "hasUnsavedChanges"])["currentFile"]
         self.log.info("Incrementing current workfile to: %s", new_filepath)
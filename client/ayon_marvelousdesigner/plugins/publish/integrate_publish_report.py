@@ -0,0 +1,36 @@
+"""Write per-plugin timing and memory report of the publish."""
+from typing import ClassVar
+
+import pyblish.api
+from ayon_marvelousdesigner.api.publish_report import (
+    finish_publish_report,
+    log_publish_report,
+    write_publish_report,
+)
+
+
+class IntegratePublishReport(pyblish.api.ContextPlugin):
+    """Write publish report to the report directory and log its summary."""
+
+    order = pyblish.api.IntegratorOrder + 10
+    label = "Write Publish Report"
+    hosts: ClassVar[list[str]] = ["marvelousdesigner"]
+
+    def process(self, context: pyblish.api.Context) -> None:
+        """Finish, write and log the publish report.
+
+        Args:
+            context (pyblish.api.Context): The publish context.
+        """
+        report = finish_publish_report(context)
+        if report is None:
+            return
+
+        log_publish_report(report, self.log)
+        try:
+            report_path = write_publish_report(report)
+        except OSError:
+            self.log.warning("Failed to write publish report.", exc_info=True)
+            return
+        if report_path:
+            self.log.info("Publish report written to: %s", report_path)
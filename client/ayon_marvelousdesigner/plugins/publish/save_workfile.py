@@ -3,6 +3,8 @@ from typing import ClassVar
 
 import pyblish.api
 from ayon_core.pipeline import KnownPublishError, registered_host
+from ayon_marvelousdesigner.api.lib import invalidate_context_snapshot
+from ayon_marvelousdesigner.api.publish_report import report_process
 
 
 class SaveCurrentWorkfile(pyblish.api.ContextPlugin):
@@ -12,6 +14,7 @@ class SaveCurrentWorkfile(pyblish.api.ContextPlugin):
     order = pyblish.api.ExtractorOrder - 0.49
     hosts: ClassVar[list[str]] = ["marvelousdesigner"]
 
+    @report_process
     def process(self, context: pyblish.api.Context) -> None:
         """Process the context to save the current workfile.
 
@@ -28,8 +31,11 @@ class SaveCurrentWorkfile(pyblish.api.ContextPlugin):
             msg = "Workfile has changed during publishing!"
             raise KnownPublishError(msg)
 
+        # Query the host, scene might have changed since collection
         if host.workfile_has_unsaved_changes():
             self.log.info("Saving current file: %s", current)
             host.save_workfile(current)
+            invalidate_context_snapshot(
+                context, ["hasUnsavedChanges", "fileSize", "fileMtime"])
         else:
             self.log.debug("No unsaved changes, skipping file save.")
@@ -5,6 +5,12 @@ import fabric_api
 import pyblish.api
 from ayon_core.pipeline import PublishValidationError
 from ayon_core.pipeline.publish import RepairAction
+from ayon_marvelousdesigner.api.lib import (
+    get_context_fabrics,
+    get_fabric_by_index,
+    invalidate_context_snapshot,
+)
+from ayon_marvelousdesigner.api.publish_report import report_process
 
 
 class ValidateNoFabric(pyblish.api.InstancePlugin):
@@ -16,6 +22,7 @@ class ValidateNoFabric(pyblish.api.InstancePlugin):
     label = "Validate No Fabric"
     actions: ClassVar = [RepairAction]
 
+    @report_process
     def process(self, instance: pyblish.api.Instance) -> None:  # noqa: PLR6301
         """Process the instance to validate no fabric is selected.
 
@@ -25,9 +32,12 @@ class ValidateNoFabric(pyblish.api.InstancePlugin):
         Raises:
             PublishValidationError: If a fabric is selected in the scene.
         """
+        fabrics = get_context_fabrics(instance.context)
+
         fabric_index = instance.data["fabricIndex"]
         fabric_name = instance.data["fabricName"]
-        if fabric_api.GetFabricName(fabric_index) != fabric_name:
+        fabric = get_fabric_by_index(fabrics, fabric_index)
+        if fabric is None or fabric["name"] != fabric_name:
             msg = (
                 f"Fabric '{fabric_name}' does not exist in the scene. "
                 "Please reselect any fabric you want to publish "
@@ -40,9 +50,17 @@ class ValidateNoFabric(pyblish.api.InstancePlugin):
     @classmethod
     def repair(cls, instance: pyblish.api.Instance) -> None:
         """Repair the instance by resetting the fabric index."""
+        # Scene might have changed since collection, refresh the snapshot
+        fabrics = invalidate_context_snapshot(
+            instance.context, ["fabrics"])["fabrics"]
+
         fabric_index = fabric_api.GetCurrentFabricIndex()
+        fabric = get_fabric_by_index(fabrics, fabric_index)
         instance.data["fabricIndex"] = fabric_index
-        instance.data["fabricName"] = fabric_api.GetFabricName(fabric_index)
+        instance.data["fabricName"] = (
+            fabric["name"] if fabric
+            else fabric_api.GetFabricName(fabric_index)
+        )
         cls.log.info(
             f"Reset fabric to '{instance.data['fabricName']}' "  # noqa: G004
             "in the instance data."
@@ -0,0 +1,203 @@
+"""Helpers shared by Marvelous Designer prelaunch hooks.
+
+Prelaunch work (PySide6 install, plugin registration) only has to be
+done again when something it depends on changed. The launch fingerprint
+combines those inputs and a stamp file records which hooks finished for
+the fingerprint, so hooks can skip their work with a single small read.
+
+Work depending on the workfile template of the launched task must not
+use the stamp. `CreateTempZprjFile` resolves the template on every
+launch and `TemplateCache` detects changed templates by their signature.
+"""
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from ayon_marvelousdesigner.addon import MARVELOUS_DESIGNER_HOST_DIR
+from ayon_marvelousdesigner.qt_binding import PYSIDE6_VERSION
+from ayon_marvelousdesigner.version import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ayon_applications import PreLaunchHook
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+DEPLOYED_SCRIPT_PATH = os.path.join(
+    MARVELOUS_DESIGNER_HOST_DIR, "deploy", "ayon_plugins.py")
+DEFAULT_TEMPLATE_PATH = os.path.join(
+    MARVELOUS_DESIGNER_HOST_DIR, "default_zprj", "Untitled_MD.zprj")
+# Prelaunch settings of the new workfile, they are not inputs of stamped
+# hooks and would invalidate them on unrelated changes
+WORKFILE_SETTINGS_KEYS = (
+    "workfile_templates",
+    "template_hardlinks",
+    "seed_workfile_metadata",
+)
+LAUNCH_STAMP_PATH = os.path.join(
+    tempfile.gettempdir(), "ayon_marvelousdesigner_launch_stamp.json")
+# Key of the fingerprint in launch context data, shared by hooks
+FINGERPRINT_DATA_KEY = "md_launch_fingerprint"
+
+
+def get_launch_fingerprint(prelaunch_settings: dict) -> str:
+    """Get fingerprint of inputs of the prelaunch work.
+
+    Workfile templates are not part of the fingerprint. The template
+    depends on the task of the launch, so hooks using it must not be
+    skipped by the stamp.
+
+    Args:
+        prelaunch_settings (dict): `prelaunch_settings` project settings.
+
+    Returns:
+        str: SHA-256 hex digest of the inputs.
+    """
+    inputs = {
+        "addon_version": __version__,
+        "pyside6_version": PYSIDE6_VERSION,
+        "deployed_script": DEPLOYED_SCRIPT_PATH,
+        "prelaunch_settings": {
+            key: value
+            for key, value in prelaunch_settings.items()
+            if key not in WORKFILE_SETTINGS_KEYS
+        },
+    }
+    return hashlib.sha256(
+        json.dumps(inputs, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def get_hook_fingerprint(hook: PreLaunchHook) -> str:
+    """Get launch fingerprint, computed once per launch.
+
+    Args:
+        hook (PreLaunchHook): Running prelaunch hook.
+
+    Returns:
+        str: Launch fingerprint.
+    """
+    fingerprint = hook.data.get(FINGERPRINT_DATA_KEY)
+    if fingerprint is None:
+        md_settings = hook.data["project_settings"]["marvelous_designer"]
+        fingerprint = get_launch_fingerprint(
+            md_settings["prelaunch_settings"])
+        hook.data[FINGERPRINT_DATA_KEY] = fingerprint
+    return fingerprint
+
+
+class LaunchStamp:
+    """Stamp file with hooks which finished for a launch fingerprint.
+
+    Hooks can also record output paths, the stamp of a hook is valid only
+    while their size and modification time did not change, e.g. when
+    Marvelous Designer rewrote its plugin settings.
+    """
+
+    def __init__(self, path: str = LAUNCH_STAMP_PATH):
+        """Initialize the stamp.
+
+        Args:
+            path (str): Path to the stamp file.
+        """
+        self.path = path
+
+    def is_done(self, hook_name: str, fingerprint: str) -> bool:
+        """Check whether a hook finished for the fingerprint.
+
+        Args:
+            hook_name (str): Name of the hook.
+            fingerprint (str): Launch fingerprint.
+
+        Returns:
+            bool: True if the hook can skip its work.
+        """
+        stamp = self._read()
+        if stamp.get("fingerprint") != fingerprint:
+            return False
+        hook_stamp = stamp.get("hooks", {}).get(hook_name)
+        if hook_stamp is None:
+            return False
+        return all(
+            _get_signature(path) == signature
+            for path, signature in hook_stamp.get("paths", {}).items()
+        )
+
+    def mark_done(
+            self,
+            hook_name: str,
+            fingerprint: str,
+            paths: Optional[Iterable[str]] = None) -> None:
+        """Record that a hook finished for the fingerprint.
+
+        Args:
+            hook_name (str): Name of the hook.
+            fingerprint (str): Launch fingerprint.
+            paths (Optional[Iterable[str]]): Output paths of the hook
+                which must stay unchanged.
+        """
+        stamp = self._read()
+        if stamp.get("fingerprint") != fingerprint:
+            stamp = {"fingerprint": fingerprint, "hooks": {}}
+        stamp.setdefault("hooks", {})[hook_name] = {
+            "paths": {path: _get_signature(path) for path in paths or []},
+            "time": time.time(),
+        }
+        self._write(stamp)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as stream:
+                return json.load(stream)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, stamp: dict) -> None:
+        # Write to a temp file and rename, concurrent launches might read
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as stream:
+                json.dump(stamp, stream)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            log.debug("Failed to write launch stamp %s", self.path,
+                      exc_info=True)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+
+def log_duration(execute: Callable) -> Callable:
+    """Log duration of a prelaunch hook's `execute`.
+
+    Returns:
+        Callable: Wrapped method.
+    """
+    @functools.wraps(execute)
+    def wrapper(self: PreLaunchHook) -> None:
+        start = time.perf_counter()
+        try:
+            execute(self)
+        finally:
+            self.log.info(
+                "%s took %.3fs",
+                self.__class__.__name__, time.perf_counter() - start
+            )
+
+    return wrapper
+
+
+def _get_signature(path: str) -> Optional[list[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
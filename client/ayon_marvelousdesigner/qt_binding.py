@@ -0,0 +1,896 @@
+"""Download of PySide6 wheels for Marvelous Designer's Python.
+
+Wheels are taken from a shared wheelhouse when available, otherwise
+they are resolved with the PyPI JSON API and downloaded in parallel.
+Partial downloads are kept next to the target file and resumed with HTTP
+range requests, finished downloads are verified against the SHA-256
+digest published by the index.
+
+The index URL is configurable, so an internal mirror or a local stand-in
+server serving the same JSON API can be used.
+"""
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+# PySide6 packages to download from PyPI.
+# Must stay in dependency order: shiboken6 first, then PySide6 core.
+PYSIDE6_VERSION = "6.10.1"
+PYSIDE6_PACKAGES = [
+    "shiboken6",
+    "PySide6",
+    "PySide6-Essentials",
+    "PySide6-Addons",
+]
+DEFAULT_INDEX_URL = "https://pypi.org/pypi"
+# Downloaded wheels are kept here so interrupted downloads can be resumed
+DEFAULT_DOWNLOAD_DIR = os.path.join(
+    tempfile.gettempdir(), "ayon_pyside6_wheels")
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+REQUEST_TIMEOUT = 60
+# Progress of a download is logged after each step in percent
+PROGRESS_STEP = 10
+PARTIAL_SUFFIX = ".part"
+LOCK_SUFFIX = ".lock"
+# Seconds to wait for a lock held by another launch
+LOCK_TIMEOUT = 30 * 60
+LOCK_POLL_INTERVAL = 0.5
+# Holder of a lock touches its file periodically, a lock file which
+# wasn't touched for the stale age is left over by a crashed process
+LOCK_HEARTBEAT_INTERVAL = 10
+LOCK_STALE_AGE = 60
+STAGING_PREFIX = ".ayon_staging_"
+# Lock file serializing installs of concurrent launches
+EXTRACT_LOCK_NAME = ".ayon_pyside6.lock"
+# Status of background provisioning written to the Qt binding directory
+READY_MARKER_NAME = ".ayon_pyside6_ready.json"
+# Environment variables telling Marvelous Designer to wait for the marker
+READY_MARKER_ENV = "AYON_MD_QT_READY_MARKER"
+READY_TIMEOUT_ENV = "AYON_MD_QT_READY_TIMEOUT"
+READY_POLL_INTERVAL = 0.5
+STATUS_PENDING = "pending"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+# File in `.dist-info` recording which files of the wheel were extracted
+EXTRACT_PROFILE_FILE = "AYON_EXTRACT_PROFILE"
+# Files needed by AYON tools (QtCore, QtGui, QtWidgets and QtSvg),
+# matched against lowercase paths in wheels. Keep in sync with server
+# settings defaults.
+DEFAULT_EXTRACT_ALLOWLIST = [
+    "shiboken6/*",
+    "pyside6/__init__.py",
+    "pyside6/_config.py",
+    "pyside6/_git_pyside_version.py",
+    "pyside6/support/*",
+    "pyside6/*pyside6*",
+    "pyside6/*shiboken6*",
+    "pyside6/*qtcore*",
+    "pyside6/*qtgui*",
+    "pyside6/*qtwidgets*",
+    "pyside6/*qtsvg*",
+    "pyside6/*qt6core*",
+    "pyside6/*qt6gui*",
+    "pyside6/*qt6widgets*",
+    "pyside6/*qt6svg*",
+    "pyside6/*qt6dbus*",
+    "pyside6/*qt6opengl.*",
+    "pyside6/*qt6xcbqpa*",
+    "pyside6/*qt6waylandclient*",
+    "pyside6/*libicu*",
+    "pyside6/msvcp*",
+    "pyside6/vcruntime*",
+    "pyside6/concrt*",
+    "pyside6/*plugins/platforms/*",
+    "pyside6/*plugins/platformthemes/*",
+    "pyside6/*plugins/platforminputcontexts/*",
+    "pyside6/*plugins/xcbglintegrations/*",
+    "pyside6/*plugins/styles/*",
+    "pyside6/*plugins/imageformats/*",
+    "pyside6/*plugins/iconengines/*",
+]
+
+
+def install_qt_binding(
+        qt_binding_dir: Path, prelaunch_settings: dict) -> dict:
+    """Download and extract PySide6 packages which are not extracted yet.
+
+    Concurrent installs into the same directory wait for each other,
+    packages are checked again once the lock is acquired. With selective
+    extraction enabled only files matching the allowlist are extracted.
+
+    Args:
+        qt_binding_dir (Path): Directory to extract the packages into.
+        prelaunch_settings (dict): `prelaunch_settings` project settings.
+
+    Returns:
+        dict: Installed `packages`, empty if all were already there, and
+            number of `files` and `bytes` written compared with
+            `totalFiles` and `totalBytes` of a full extraction.
+    """
+    allowlist = get_extract_allowlist(prelaunch_settings)
+    wheelhouse = get_wheelhouse(prelaunch_settings)
+    download_dir = Path(DEFAULT_DOWNLOAD_DIR)
+    if wheelhouse is not None and os.access(wheelhouse, os.W_OK):
+        download_dir = wheelhouse
+
+    report = {
+        "packages": [],
+        "files": 0,
+        "bytes": 0,
+        "totalFiles": 0,
+        "totalBytes": 0,
+    }
+    with FileLock(qt_binding_dir / EXTRACT_LOCK_NAME):
+        packages = get_missing_packages(qt_binding_dir, allowlist)
+        if not packages:
+            return report
+
+        log.info("Downloading wheels for %s ...", ", ".join(packages))
+        wheel_paths = download_wheels(
+            packages,
+            PYSIDE6_VERSION,
+            download_dir,
+            index_url=(
+                prelaunch_settings.get("index_url") or DEFAULT_INDEX_URL),
+            max_workers=prelaunch_settings.get(
+                "download_workers", DOWNLOAD_WORKERS),
+            wheelhouse=wheelhouse,
+        )
+        for package, wheel_path in wheel_paths.items():
+            wheel_report = extract_wheel(wheel_path, qt_binding_dir, allowlist)
+            log.info("Extracted %s", wheel_path.name)
+            report["packages"].append(package)
+            for key, value in wheel_report.items():
+                report[key] += value
+
+    log.info(
+        "Wrote %d of %d files, %.1f of %.1f MB (%s extraction).",
+        report["files"], report["totalFiles"],
+        report["bytes"] / 1024 ** 2, report["totalBytes"] / 1024 ** 2,
+        "full" if allowlist is None else "selective",
+    )
+    return report
+
+
+def get_missing_packages(
+        qt_binding_dir: Path,
+        allowlist: Optional[list[str]] = None) -> list[str]:
+    """Get PySide6 packages which are not extracted yet.
+
+    Packages extracted with a different allowlist are considered missing.
+
+    Args:
+        qt_binding_dir (Path): Directory where packages are extracted.
+        allowlist (Optional[list[str]]): Patterns of extracted files,
+            None for full extraction.
+
+    Returns:
+        list[str]: Package names in dependency order.
+    """
+    profile = _get_extract_profile(allowlist)
+    extracted = {
+        path.name.lower()
+        for path in get_dist_info_paths(qt_binding_dir)
+        if _read_extract_profile(path) == profile
+    }
+    return [
+        package
+        for package in PYSIDE6_PACKAGES
+        if _get_dist_info_name(package, PYSIDE6_VERSION) not in extracted
+    ]
+
+
+def get_dist_info_paths(qt_binding_dir: Path) -> list[Path]:
+    """Get `.dist-info` directories of extracted PySide6 packages.
+
+    Args:
+        qt_binding_dir (Path): Directory where packages are extracted.
+
+    Returns:
+        list[Path]: Paths to `.dist-info` directories.
+    """
+    names = {
+        _get_dist_info_name(package, PYSIDE6_VERSION)
+        for package in PYSIDE6_PACKAGES
+    }
+    return [
+        path
+        for path in qt_binding_dir.glob("*.dist-info")
+        if path.name.lower() in names
+    ]
+
+
+def get_extract_allowlist(prelaunch_settings: dict) -> Optional[list[str]]:
+    """Get patterns of files to extract from PySide6 wheels.
+
+    Args:
+        prelaunch_settings (dict): `prelaunch_settings` project settings.
+
+    Returns:
+        Optional[list[str]]: Patterns matched against lowercase paths in
+            wheels, None if wheels are extracted fully.
+    """
+    if not prelaunch_settings.get("selective_extraction"):
+        return None
+    return list(
+        prelaunch_settings.get("extraction_allowlist")
+        or DEFAULT_EXTRACT_ALLOWLIST
+    )
+
+
+def get_wheelhouse(prelaunch_settings: dict) -> Optional[Path]:
+    """Get wheelhouse directory from settings.
+
+    Args:
+        prelaunch_settings (dict): `prelaunch_settings` project settings.
+
+    Returns:
+        Optional[Path]: Existing wheelhouse directory or None.
+    """
+    wheelhouse = prelaunch_settings.get("wheelhouse_dir")
+    if not wheelhouse:
+        return None
+    wheelhouse = Path(os.path.expandvars(wheelhouse))
+    if not wheelhouse.is_dir():
+        log.warning("Wheelhouse directory '%s' does not exist.", wheelhouse)
+        return None
+    return wheelhouse
+
+
+def write_ready_marker(
+        marker_path: Path, status: str, error: Optional[str] = None) -> None:
+    """Write status of background provisioning.
+
+    Args:
+        marker_path (Path): Path to the readiness marker.
+        status (str): One of `STATUS_PENDING`, `STATUS_READY` and
+            `STATUS_FAILED`.
+        error (Optional[str]): Error message of failed provisioning.
+    """
+    tmp_path = marker_path.with_name(f"{marker_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as stream:
+        json.dump({"status": status, "error": error, "time": time.time()},
+                  stream)
+    os.replace(tmp_path, marker_path)
+
+
+def read_ready_marker(marker_path: Path) -> dict:
+    """Read status of background provisioning without waiting.
+
+    Args:
+        marker_path (Path): Path to the readiness marker.
+
+    Returns:
+        dict: Marker data with `status` and `error`, `STATUS_PENDING`
+            if the marker can't be read yet.
+    """
+    try:
+        with open(marker_path, encoding="utf-8") as stream:
+            return json.load(stream)
+    except (OSError, ValueError):
+        return {"status": STATUS_PENDING, "error": None}
+
+
+def wait_for_ready_marker(marker_path: Path, timeout: float) -> dict:
+    """Wait until background provisioning finished.
+
+    Args:
+        marker_path (Path): Path to the readiness marker.
+        timeout (float): Seconds to wait.
+
+    Returns:
+        dict: Marker data with `status` and `error`. Status is
+            `STATUS_PENDING` if provisioning didn't finish in time.
+    """
+    deadline = time.time() + timeout
+    logged = False
+    while True:
+        marker = read_ready_marker(marker_path)
+        if marker.get("status") != STATUS_PENDING or time.time() > deadline:
+            return marker
+        if not logged:
+            log.info("Waiting for PySide6 provisioning to finish ...")
+            logged = True
+        time.sleep(READY_POLL_INTERVAL)
+
+
+def _get_dist_info_name(package: str, version: str) -> str:
+    normalized = package.lower().replace("-", "_")
+    return f"{normalized}-{version}.dist-info"
+
+
+def download_wheels(  # noqa: PLR0913
+        packages: list[str],
+        version: str,
+        dest_dir: Path,
+        index_url: str = DEFAULT_INDEX_URL,
+        max_workers: int = DOWNLOAD_WORKERS,
+        *,
+        wheelhouse: Optional[Path] = None) -> dict[str, Path]:
+    """Download compatible wheels of packages in parallel.
+
+    Wheels found in the wheelhouse or already downloaded to the
+    destination directory are used without contacting the index.
+
+    Args:
+        packages (list[str]): PyPI package names.
+        version (str): Exact version of all packages.
+        dest_dir (Path): Directory to download wheels to.
+        index_url (str): Base URL of the PyPI JSON API.
+        max_workers (int): Number of downloads running at the same time.
+        wheelhouse (Optional[Path]): Shared directory with wheels which
+            is checked first.
+
+    Returns:
+        dict[str, Path]: Paths to downloaded wheels by package name, in
+            order of the packages.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            package: executor.submit(
+                download_wheel, package, version, dest_dir, index_url,
+                wheelhouse=wheelhouse)
+            for package in packages
+        }
+        # Raise the first error after all downloads finished
+        return {
+            package: future.result()
+            for package, future in futures.items()
+        }
+
+
+def download_wheel(
+        package: str,
+        version: str,
+        dest_dir: Path,
+        index_url: str = DEFAULT_INDEX_URL,
+        *,
+        wheelhouse: Optional[Path] = None) -> Path:
+    """Download a wheel of a package compatible with the current platform.
+
+    Wheels appear in a directory only after they were verified, so
+    a wheel found in the wheelhouse or destination directory is used as
+    is. Downloads of the same wheel by multiple processes are serialized
+    by a lock file in the destination directory.
+
+    Args:
+        package (str): PyPI package name.
+        version (str): Exact version string.
+        dest_dir (Path): Directory to save the downloaded wheel.
+        index_url (str): Base URL of the PyPI JSON API.
+        wheelhouse (Optional[Path]): Shared directory with wheels which
+            is checked first.
+
+    Returns:
+        Path: Path to the downloaded wheel.
+    """
+    for directory in filter(None, (wheelhouse, dest_dir)):
+        wheel_path = find_local_wheel(package, version, directory)
+        if wheel_path is not None:
+            log.info("Using %s", wheel_path)
+            return wheel_path
+
+    normalized = package.lower().replace("-", "_")
+    with FileLock(dest_dir / f"{normalized}-{version}{LOCK_SUFFIX}"):
+        # Another process might have downloaded it while we waited
+        wheel_path = find_local_wheel(package, version, dest_dir)
+        if wheel_path is not None:
+            return wheel_path
+
+        wheel_info = get_wheel_info(package, version, index_url)
+        dest = dest_dir / wheel_info["filename"]
+        download_file(
+            wheel_info["url"],
+            dest,
+            wheel_info.get("digests", {}).get("sha256"),
+            wheel_info.get("size"),
+        )
+    return dest
+
+
+def find_local_wheel(
+        package: str, version: str, directory: Path) -> Optional[Path]:
+    """Find a wheel compatible with the current platform in a directory.
+
+    Args:
+        package (str): PyPI package name.
+        version (str): Exact version string.
+        directory (Path): Directory with wheels.
+
+    Returns:
+        Optional[Path]: Path to the wheel or None if there is none.
+    """
+    try:
+        filenames = [
+            entry.name for entry in os.scandir(directory)
+            if entry.name.endswith(".whl") and entry.is_file()
+        ]
+    except OSError:
+        return None
+    try:
+        wheel_info = select_compatible_wheel(
+            package,
+            version,
+            [
+                {"packagetype": "bdist_wheel", "filename": filename}
+                for filename in filenames
+            ],
+        )
+    except FileNotFoundError:
+        return None
+    return directory / wheel_info["filename"]
+
+
+def extract_wheel(
+        wheel_path: Path,
+        target_dir: Path,
+        allowlist: Optional[list[str]] = None) -> dict[str, int]:
+    """Extract a wheel so a partially extracted package is never used.
+
+    The wheel is extracted to a staging directory inside the target
+    directory first and moved into place by renames. The `.dist-info`
+    directory, which marks the package as installed, is moved last.
+
+    With an allowlist only matching files are decompressed, the
+    `.dist-info` directory is always extracted and records the allowlist.
+
+    Args:
+        wheel_path (Path): Path to the wheel.
+        target_dir (Path): Directory to extract the wheel into.
+        allowlist (Optional[list[str]]): Patterns matched against
+            lowercase paths in the wheel, None to extract all files.
+
+    Returns:
+        dict[str, int]: Number of `files` and `bytes` written, and
+            `totalFiles` and `totalBytes` in the wheel.
+    """
+    staging_dir = Path(tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=target_dir))
+    try:
+        with zipfile.ZipFile(wheel_path, "r") as zip_ref:
+            members = [
+                info for info in zip_ref.infolist() if not info.is_dir()]
+            selected = [
+                info for info in members
+                if _is_extracted(info.filename, allowlist)
+            ]
+            for info in selected:
+                zip_ref.extract(info, staging_dir)
+        profile = _get_extract_profile(allowlist)
+        for dist_info in staging_dir.glob("*.dist-info"):
+            (dist_info / EXTRACT_PROFILE_FILE).write_text(
+                profile, encoding="utf-8")
+        entries = sorted(
+            staging_dir.iterdir(),
+            key=lambda entry: entry.name.endswith(".dist-info"),
+        )
+        for entry in entries:
+            _move_into(entry, target_dir / entry.name)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    return {
+        "files": len(selected),
+        "bytes": sum(info.file_size for info in selected),
+        "totalFiles": len(members),
+        "totalBytes": sum(info.file_size for info in members),
+    }
+
+
+def _is_extracted(filename: str, allowlist: Optional[list[str]]) -> bool:
+    if allowlist is None:
+        return True
+    filename = filename.lower()
+    if filename.split("/", 1)[0].endswith(".dist-info"):
+        return True
+    return any(
+        fnmatch.fnmatchcase(filename, pattern.lower())
+        for pattern in allowlist
+    )
+
+
+def _get_extract_profile(allowlist: Optional[list[str]]) -> str:
+    if allowlist is None:
+        return "full"
+    patterns = json.dumps(sorted({pattern.lower() for pattern in allowlist}))
+    return "selective-" + hashlib.sha256(patterns.encode()).hexdigest()[:16]
+
+
+def _read_extract_profile(dist_info: Path) -> str:
+    try:
+        return (dist_info / EXTRACT_PROFILE_FILE).read_text(
+            encoding="utf-8").strip()
+    except OSError:
+        # Extracted by pip or an older version of the hook
+        return "full"
+
+
+def _move_into(src: Path, dst: Path) -> None:
+    """Move a file or directory, merging into an existing directory.
+
+    New directories are moved by a single rename, files of existing
+    directories (e.g. `PySide6` shared by more wheels) one by one.
+    """
+    if src.is_dir() and dst.is_dir():
+        for child in src.iterdir():
+            _move_into(child, dst / child.name)
+        return
+    os.replace(src, dst)
+
+
+class FileLock:
+    """Cross-process lock held by an exclusively created lock file.
+
+    Lock files work on network shares where `flock` is not reliable.
+    The lock file records host and PID of its owner, which touches it
+    from a heartbeat thread while the lock is held. A lock file is
+    considered left over by a crashed process and is removed when its
+    owner on this host is not running, or when it wasn't touched for
+    the stale age.
+    """
+
+    def __init__(
+            self,
+            path: Path,
+            timeout: float = LOCK_TIMEOUT,
+            stale_age: float = LOCK_STALE_AGE,
+            heartbeat_interval: float = LOCK_HEARTBEAT_INTERVAL):
+        """Initialize the lock.
+
+        Args:
+            path (Path): Path to the lock file.
+            timeout (float): Seconds to wait for the lock.
+            stale_age (float): Age in seconds after which a lock file is
+                considered stale.
+            heartbeat_interval (float): Seconds between touches of
+                the lock file while the lock is held. Must be shorter
+                than the stale age.
+        """
+        self.path = path
+        self.timeout = timeout
+        self.stale_age = stale_age
+        self.heartbeat_interval = min(heartbeat_interval, stale_age / 2)
+        self._stop_heartbeat = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+    def acquire(self) -> None:
+        """Wait for the lock and acquire it.
+
+        Raises:
+            TimeoutError: If the lock wasn't acquired in time.
+        """
+        start = time.time()
+        logged = False
+        while True:
+            try:
+                fd = os.open(
+                    self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                pass
+            else:
+                with os.fdopen(fd, "w") as stream:
+                    stream.write(f"{socket.gethostname()}:{os.getpid()}")
+                self._start_heartbeat()
+                return
+
+            if self._is_stale():
+                log.warning("Removing stale lock %s", self.path)
+                with contextlib.suppress(OSError):
+                    os.remove(self.path)
+                continue
+            if time.time() - start > self.timeout:
+                msg = f"Timed out waiting for lock {self.path}."
+                raise TimeoutError(msg)
+            if not logged:
+                log.info("Waiting for another process holding %s", self.path)
+                logged = True
+            time.sleep(LOCK_POLL_INTERVAL)
+
+    def release(self) -> None:
+        """Release the lock."""
+        self._stop_heartbeat.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+        with contextlib.suppress(OSError):
+            os.remove(self.path)
+
+    def __enter__(self) -> None:
+        """Acquire the lock."""
+        self.acquire()
+
+    def __exit__(self, *_args: object) -> None:
+        """Release the lock."""
+        self.release()
+
+    def _start_heartbeat(self) -> None:
+        self._stop_heartbeat.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat, daemon=True)
+        self._heartbeat_thread.start()
+
+    def _heartbeat(self) -> None:
+        while not self._stop_heartbeat.wait(self.heartbeat_interval):
+            self._touch()
+
+    def _touch(self) -> None:
+        try:
+            os.utime(self.path)
+        except OSError:
+            log.warning("Failed to refresh lock %s", self.path, exc_info=True)
+
+    def _is_stale(self) -> bool:
+        try:
+            owner = Path(self.path).read_text(encoding="utf-8")
+            age = time.time() - os.path.getmtime(self.path)
+        except OSError:
+            return False
+
+        hostname, _, pid = owner.rpartition(":")
+        if (
+            hostname == socket.gethostname()
+            and pid.isdigit()
+            and not _is_process_running(int(pid))
+        ):
+            return True
+        return age > self.stale_age
+
+
+def _is_process_running(pid: int) -> bool:
+    """Check whether a process on this host is running.
+
+    Returns:
+        bool: False only if the process surely doesn't exist.
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        process_query_limited_information = 0x1000
+        error_access_denied = 5
+        still_active = 259
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.OpenProcess(
+            process_query_limited_information, False, pid)  # noqa: FBT003
+        if not handle:
+            return ctypes.get_last_error() == error_access_denied
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(
+                    handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == still_active
+        finally:
+            kernel32.CloseHandle(handle)
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def get_wheel_info(
+        package: str,
+        version: str,
+        index_url: str = DEFAULT_INDEX_URL) -> dict:
+    """Get URL info of a wheel compatible with the current platform.
+
+    Args:
+        package (str): PyPI package name.
+        version (str): Exact version string.
+        index_url (str): Base URL of the PyPI JSON API.
+
+    Returns:
+        dict: URL info with `filename`, `url`, `size` and `digests`.
+    """
+    api_url = f"{index_url.rstrip('/')}/{package}/{version}/json"
+    with urllib.request.urlopen(api_url, timeout=REQUEST_TIMEOUT) as resp:  # noqa: S310
+        data = json.loads(resp.read())
+    return select_compatible_wheel(package, version, data.get("urls", []))
+
+
+def download_file(
+        url: str,
+        dest: Path,
+        sha256: Optional[str] = None,
+        size: Optional[int] = None) -> None:
+    """Download a file, resuming a previous partial download.
+
+    Data are written to a `.part` file next to the destination which is
+    renamed once the download is complete and verified. Interrupted
+    transfers are retried and resumed with HTTP range requests.
+
+    Args:
+        url (str): URL of the file.
+        dest (Path): Destination path.
+        sha256 (Optional[str]): Expected SHA-256 hex digest.
+        size (Optional[int]): Expected size in bytes, used for progress.
+
+    Raises:
+        OSError: If the download failed after all retries.
+        ValueError: If the downloaded file does not match the digest.
+    """
+    partial = dest.with_name(dest.name + PARTIAL_SUFFIX)
+    for attempt in range(1, DOWNLOAD_RETRIES + 1):
+        try:
+            _download_to(url, partial, size)
+            break
+        except OSError as error:
+            if attempt == DOWNLOAD_RETRIES:
+                raise
+            log.warning(
+                "Download of %s interrupted (%s), resuming.", dest.name, error)
+
+    if sha256:
+        digest = get_sha256(partial)
+        if digest != sha256:
+            partial.unlink()
+            msg = (
+                f"SHA-256 of {dest.name} does not match, expected {sha256},"
+                f" got {digest}."
+            )
+            raise ValueError(msg)
+    os.replace(partial, dest)
+    log.info("Downloaded %s", dest.name)
+
+
+def get_sha256(filepath: Path) -> str:
+    """Get SHA-256 hex digest of a file.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as stream:
+        for chunk in iter(lambda: stream.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _download_to(url: str, partial: Path, size: Optional[int]) -> None:
+    """Download a file to a partial file, continuing from its end.
+
+    Raises:
+        ConnectionError: If the server closed the connection before all
+            data were received.
+    """
+    offset = partial.stat().st_size if partial.exists() else 0
+    if size and offset >= size:
+        return
+
+    request = urllib.request.Request(url)  # noqa: S310
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+    with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as resp:  # noqa: S310
+        if offset and resp.status != 206:  # noqa: PLR2004
+            # Server does not support ranges, start over
+            log.debug("Range not supported for %s, restarting.", url)
+            offset = 0
+        if offset:
+            log.info("Resuming %s at %d bytes", partial.stem, offset)
+        total = size or offset + int(resp.headers.get("Content-Length") or 0)
+        logged_step = offset * 100 // total // PROGRESS_STEP if total else 0
+        with open(partial, "ab" if offset else "wb") as stream:
+            while chunk := resp.read(DOWNLOAD_CHUNK_SIZE):
+                stream.write(chunk)
+                offset += len(chunk)
+                if not total:
+                    continue
+                step = offset * 100 // total // PROGRESS_STEP
+                if step > logged_step:
+                    logged_step = step
+                    log.info(
+                        "%s: %d%% of %.1f MB",
+                        partial.stem, min(100, step * PROGRESS_STEP),
+                        total / 1024 ** 2
+                    )
+    if total and offset < total:
+        msg = f"Connection closed at {offset} of {total} bytes."
+        raise ConnectionError(msg)
+
+
+def select_compatible_wheel(
+        package: str, version: str, urls: list[dict]) -> dict:
+    """Pick the best matching wheel entry for the current OS/arch.
+
+    Args:
+        package: PyPI package name.
+        version: Exact version string.
+        urls: List of URL info dicts from PyPI JSON API.
+
+    Returns:
+        dict: The URL info dict for the best matching wheel.
+
+    Raises:
+        FileNotFoundError: If no compatible wheel is found.
+    """
+    normalized_package = package.lower().replace("-", "_")
+    prefix = f"{normalized_package}-{version}-cp39-abi3-"
+
+    candidates = [
+        url_info
+        for url_info in urls
+        if url_info.get("packagetype") == "bdist_wheel"
+        and url_info.get("filename", "").lower().startswith(prefix)
+    ]
+
+    if not candidates:
+        msg = (
+            f"No cp39-abi3 wheel candidates found for "
+            f"{package}=={version} on PyPI"
+        )
+        raise FileNotFoundError(msg)
+
+    platform_key = sys.platform
+    machine = platform.machine().lower()
+
+    preferred_tags = get_preferred_tags(platform_key, machine)
+
+    def _score(filename: str) -> int:
+        lowered = filename.lower()
+        score = 0
+        for tag in preferred_tags:
+            if tag in lowered:
+                score += 1
+        return score
+
+    best = max(
+        candidates,
+        key=lambda url_info: _score(url_info["filename"]),
+    )
+    if _score(best["filename"]) == 0:
+        available = ", ".join(
+            url_info["filename"] for url_info in candidates
+        )
+        msg = (
+            f"No compatible wheel found for {package}=={version} on "
+            f"platform={platform_key}, arch={machine}. "
+            f"Available: {available}"
+        )
+        raise FileNotFoundError(msg)
+
+    return best
+
+
+def get_preferred_tags(platform_key: str, machine: str) -> list[str]:
+    """Return tag preferences for selecting a platform-specific wheel.
+
+    Raises:
+        RuntimeError: If the platform is unsupported.
+
+    """
+    if platform_key.startswith("win"):
+        return ["win_amd64"]
+    if platform_key.startswith("linux"):
+        if machine in {"aarch64", "arm64"}:
+            return ["manylinux", "aarch64", "arm64"]
+        return ["manylinux", "x86_64", "amd64"]
+    if platform_key == "darwin":
+        if machine in {"arm64", "aarch64"}:
+            return ["macosx", "universal2", "arm64"]
+        return ["macosx", "universal2", "x86_64"]
+
+    msg = f"Unsupported platform for wheel selection: {platform_key}"
+    raise RuntimeError(msg)
@@ -0,0 +1,208 @@
+"""Local content-addressed cache of workfile templates.
+
+Templates, which can live on a network share, are copied once into
+a local cache keyed by their SHA-256 and materialized for each launch by
+a reflink or hardlink when the file system supports it. A template is
+read again only when its size or modification time changed, otherwise
+the cached hash is used.
+"""
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from typing import Optional
+
+log = logging.getLogger("ayon_marvelousdesigner")
+
+DEFAULT_CACHE_DIR = os.path.join(
+    tempfile.gettempdir(), "ayon_marvelousdesigner_templates")
+INDEX_FILENAME = "index.json"
+COPY_BUFFER_SIZE = 1024 * 1024
+# ioctl request cloning a file on Linux (btrfs, XFS)
+FICLONE = 0x40049409
+
+METHOD_REFLINK = "reflink"
+METHOD_HARDLINK = "hardlink"
+METHOD_COPY = "copy"
+
+
+class TemplateCache:
+    """Content-addressed cache of template files."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """Initialize the cache.
+
+        Args:
+            cache_dir (str): Root directory of the cache.
+        """
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.index_path = os.path.join(cache_dir, INDEX_FILENAME)
+
+    def get(self, source_path: str) -> str:
+        """Get cached copy of a template, caching it when it changed.
+
+        Args:
+            source_path (str): Path to the template.
+
+        Returns:
+            str: Path to the read-only cached copy.
+        """
+        source_path = os.path.abspath(source_path)
+        source_stat = os.stat(source_path)
+        signature = [source_stat.st_size, source_stat.st_mtime_ns]
+        index = self._read_index()
+        entry = index.get(source_path)
+        if entry and entry["signature"] == signature:
+            object_path = self._get_object_path(entry["sha256"])
+            if _get_size(object_path) == source_stat.st_size:
+                return object_path
+
+        sha256 = self._add_object(source_path)
+        log.info("Cached template %s (%s)", source_path, sha256[:12])
+        index = self._read_index()
+        index[source_path] = {"signature": signature, "sha256": sha256}
+        self._write_index(index)
+        return self._get_object_path(sha256)
+
+    def materialize(
+            self,
+            source_path: str,
+            dst_path: str,
+            *,
+            allow_hardlink: bool = False) -> str:
+        """Create a workfile from a template.
+
+        Reflink is preferred, the workfile shares data with the cache but
+        is independent on write. A hardlink shares the read-only cached
+        file, so it is used only when allowed, for workfiles which are
+        always saved under a new path. Otherwise the file is copied.
+
+        Args:
+            source_path (str): Path to the template.
+            dst_path (str): Path to the created workfile.
+            allow_hardlink (bool): Hardlink the cached file when reflink
+                is not supported.
+
+        Returns:
+            str: Used method, one of `METHOD_REFLINK`, `METHOD_HARDLINK`
+                and `METHOD_COPY`.
+        """
+        object_path = self.get(source_path)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(dst_path)
+        if _reflink(object_path, dst_path):
+            method = METHOD_REFLINK
+        elif allow_hardlink and _hardlink(object_path, dst_path):
+            method = METHOD_HARDLINK
+        else:
+            shutil.copyfile(object_path, dst_path)
+            method = METHOD_COPY
+        log.debug("Materialized %s by %s", dst_path, method)
+        return method
+
+    def _add_object(self, source_path: str) -> str:
+        """Copy a file into the cache while hashing it.
+
+        Returns:
+            str: SHA-256 hex digest of the file.
+        """
+        os.makedirs(self.objects_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.objects_dir, suffix=".tmp")
+        digest = hashlib.sha256()
+        try:
+            with open(source_path, "rb") as src, os.fdopen(fd, "wb") as dst:
+                for chunk in iter(lambda: src.read(COPY_BUFFER_SIZE), b""):
+                    digest.update(chunk)
+                    dst.write(chunk)
+            sha256 = digest.hexdigest()
+            object_path = self._get_object_path(sha256)
+            if os.path.exists(object_path):
+                os.remove(tmp_path)
+            else:
+                # Cached objects are shared by links, never modify them
+                os.chmod(tmp_path, stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH)
+                os.replace(tmp_path, object_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+        return sha256
+
+    def _get_object_path(self, sha256: str) -> str:
+        return os.path.join(self.objects_dir, f"{sha256}.zprj")
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path, encoding="utf-8") as stream:
+                return json.load(stream)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index: dict) -> None:
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as stream:
+            json.dump(index, stream, indent=4)
+        os.replace(tmp_path, self.index_path)
+
+
+def _get_size(path: str) -> Optional[int]:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """Clone a file sharing its data blocks, if supported.
+
+    Returns:
+        bool: True if the file was cloned.
+    """
+    if sys.platform.startswith("linux"):
+        return _reflink_linux(src, dst)
+    if sys.platform == "darwin":
+        return _reflink_darwin(src, dst)
+    return False
+
+
+def _reflink_linux(src: str, dst: str) -> bool:
+    import fcntl
+
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(dst)
+        return False
+    return True
+
+
+def _reflink_darwin(src: str, dst: str) -> bool:
+    libc_path = ctypes.util.find_library("c")
+    clonefile = None
+    if libc_path:
+        clonefile = getattr(ctypes.CDLL(libc_path), "clonefile", None)
+    if clonefile is None or clonefile(src.encode(), dst.encode(), 0) != 0:
+        return False
+    # Clone copies read-only mode of the cached file
+    os.chmod(dst, stat.S_IREAD | stat.S_IWRITE)
+    return True
+
+
+def _hardlink(src: str, dst: str) -> bool:
+    try:
+        os.link(src, dst)
+    except OSError:
+        return False
+    return True
@@ -4,6 +4,7 @@ from typing import Any
 from ayon_server.settings import (
     BaseSettingsModel,
     SettingsField,
+    task_types_enum,
 )
 
 
@@ -61,14 +62,100 @@ class LoadPointCacheModel(BaseSettingsModel):
     )
 
 
+class LocalCacheModel(BaseSettingsModel):
+    """Model for local cache of loaded representation files."""
+    enabled: bool = SettingsField(
+        default=True,
+        title="Enabled",
+        description=(
+            "Copy published files to a local cache before importing them "
+            "into Marvelous Designer."
+        )
+    )
+    cache_dir: str = SettingsField(
+        default="",
+        title="Cache Directory",
+        description=(
+            "Local directory of the cache. System temp directory is used "
+            "when empty."
+        )
+    )
+    max_size_gb: float = SettingsField(
+        default=20.0,
+        ge=0.0,
+        title="Max Size (GB)",
+        description=(
+            "Least recently used files are evicted once the cache exceeds "
+            "this size."
+        )
+    )
+    copy_workers: int = SettingsField(
+        default=4,
+        ge=1,
+        title="Copy Workers",
+        description="Number of threads copying chunks of a file."
+    )
+    chunk_size_mb: int = SettingsField(
+        default=64,
+        ge=1,
+        title="Chunk Size (MB)",
+        description="Size of a file chunk copied by one thread."
+    )
+
+
+class PublishReportModel(BaseSettingsModel):
+    """Model for per-plugin publish report."""
+    enabled: bool = SettingsField(
+        default=False,
+        title="Enabled",
+        description=(
+            "Record wall time, CPU time, memory peak and output size of "
+            "each Marvelous Designer publish plugin into a JSON report."
+        )
+    )
+    report_dir: str = SettingsField(
+        "",
+        title="Report Directory",
+        description=(
+            "Directory of the reports, can use environment variables. "
+            "Reports are written to the system temp directory when empty."
+        )
+    )
+
+
+class ExtractObjModel(BasicValidateModel):
+    """Settings for OBJ extraction."""
+    create_proxy: bool = SettingsField(
+        default=False,
+        title="Create Proxy",
+        description=(
+            "Publish a decimated 'proxy' representation for fast preview "
+            "loading. Requires NumPy."
+        )
+    )
+    proxy_grid_resolution: int = SettingsField(
+        default=64,
+        ge=2,
+        title="Proxy Grid Resolution",
+        description=(
+            "Number of vertex clustering cells along the longest side of "
+            "the bounding box. Lower values create coarser proxies."
+        )
+    )
+
+
 class PublishersModel(BaseSettingsModel):
     """Settings for publishers configuration."""
+    CollectPublishReport: PublishReportModel = SettingsField(
+        default_factory=PublishReportModel,
+        title="Publish Report"
+    )
     ExtractPointCache: BasicValidateModel = SettingsField(
         default_factory=BasicValidateModel,
         title="Extract Point Cache"
     )
-    ExtractObj: BasicValidateModel = SettingsField(
-        default_factory=BasicValidateModel,
+    ExtractObj: ExtractObjModel = SettingsField(
+        default_factory=ExtractObjModel,
         title="Extract OBJ"
     )
     ExtractFbx: BasicValidateModel = SettingsField(
@@ -79,12 +166,72 @@ class PublishersModel(BaseSettingsModel):
 
 class LoadersModel(BaseSettingsModel):
     """Settings for loaders configuration."""
+    local_cache: LocalCacheModel = SettingsField(
+        default_factory=LocalCacheModel,
+        title="Local Cache"
+    )
     LoadPointCache: LoadPointCacheModel = SettingsField(
         default_factory=LoadPointCacheModel,
         title="Load Point Cache"
     )
 
 
+# Files needed by AYON tools, keep in sync with the client
+DEFAULT_QT_EXTRACTION_ALLOWLIST = [
+    "shiboken6/*",
+    "pyside6/__init__.py",
+    "pyside6/_config.py",
+    "pyside6/_git_pyside_version.py",
+    "pyside6/support/*",
+    "pyside6/*pyside6*",
+    "pyside6/*shiboken6*",
+    "pyside6/*qtcore*",
+    "pyside6/*qtgui*",
+    "pyside6/*qtwidgets*",
+    "pyside6/*qtsvg*",
+    "pyside6/*qt6core*",
+    "pyside6/*qt6gui*",
+    "pyside6/*qt6widgets*",
+    "pyside6/*qt6svg*",
+    "pyside6/*qt6dbus*",
+    "pyside6/*qt6opengl.*",
+    "pyside6/*qt6xcbqpa*",
+    "pyside6/*qt6waylandclient*",
+    "pyside6/*libicu*",
+    "pyside6/msvcp*",
+    "pyside6/vcruntime*",
+    "pyside6/concrt*",
+    "pyside6/*plugins/platforms/*",
+    "pyside6/*plugins/platformthemes/*",
+    "pyside6/*plugins/platforminputcontexts/*",
+    "pyside6/*plugins/xcbglintegrations/*",
+    "pyside6/*plugins/styles/*",
+    "pyside6/*plugins/imageformats/*",
+    "pyside6/*plugins/iconengines/*",
+]
+
+
+class WorkfileTemplateProfileModel(BaseSettingsModel):
+    _layout = "expanded"
+    task_types: list[str] = SettingsField(
+        default_factory=list,
+        title="Task types",
+        enum_resolver=task_types_enum
+    )
+    task_names: list[str] = SettingsField(
+        default_factory=list,
+        title="Task names"
+    )
+    path: str = SettingsField(
+        "",
+        title="Template Path",
+        description=(
+            "Path to a .zprj template, can use {root[...]}, {project[name]} "
+            "and {task[name]} keys and environment variables."
+        )
+    )
+
+
 class PrelaunchModel(BaseSettingsModel):
     """Settings for prelaunch configuration."""
     qt_binding_dir: str = SettingsField(
@@ -100,6 +247,92 @@ class PrelaunchModel(BaseSettingsModel):
             "plugin system."
         )
     )
+    index_url: str = SettingsField(
+        default="https://pypi.org/pypi",
+        title="Package Index URL",
+        description=(
+            "Base URL of the PyPI JSON API used to download PySide6 "
+            "wheels, e.g. an internal mirror."
+        )
+    )
+    wheelhouse_dir: str = SettingsField(
+        default="",
+        title="Wheelhouse Directory",
+        description=(
+            "Local or shared directory with PySide6 wheels checked before "
+            "the package index. Downloaded wheels are stored there when "
+            "it is writable."
+        )
+    )
+    background_install: bool = SettingsField(
+        default=False,
+        title="Install PySide6 in Background",
+        description=(
+            "Install PySide6 in a detached process and launch Marvelous "
+            "Designer right away. AYON tools are shown once it finished."
+        )
+    )
+    qt_wait_timeout: int = SettingsField(
+        default=600,
+        ge=1,
+        title="PySide6 Wait Timeout",
+        description=(
+            "Seconds Marvelous Designer waits for the background install "
+            "before AYON tools are skipped."
+        )
+    )
+    selective_extraction: bool = SettingsField(
+        default=False,
+        title="Selective PySide6 Extraction",
+        description=(
+            "Extract only files matching the allowlist from PySide6 "
+            "wheels instead of all Qt modules."
+        )
+    )
+    extraction_allowlist: list[str] = SettingsField(
+        default_factory=lambda: list(DEFAULT_QT_EXTRACTION_ALLOWLIST),
+        title="Extraction Allowlist",
+        description=(
+            "Glob patterns matched against lowercase paths in the wheels. "
+            "Metadata of the packages is always extracted."
+        )
+    )
+    workfile_templates: list[WorkfileTemplateProfileModel] = SettingsField(
+        default_factory=list,
+        title="Workfile Templates",
+        description=(
+            "Templates of new workfiles by task. The bundled template is "
+            "used when no profile matches."
+        )
+    )
+    template_hardlinks: bool = SettingsField(
+        default=False,
+        title="Hardlink Templates",
+        description=(
+            "Hardlink cached templates when the file system can't clone "
+            "them. New workfiles are read-only until saved under a new "
+            "path. Compatible with seeding workfile metadata, which never "
+            "modifies the linked file."
+        )
+    )
+    seed_workfile_metadata: bool = SettingsField(
+        default=False,
+        title="Seed Workfile Metadata",
+        description=(
+            "Pass AYON context and the workfile instance of new workfiles "
+            "to Marvelous Designer in the environment, so they are not "
+            "written into the scene on startup. The workfile is not "
+            "modified, so cloned or hardlinked templates stay shared. "
+            "The metadata is stored with the first save, so a new "
+            "workfile is still saved by its first publish."
+        )
+    )
+    download_workers: int = SettingsField(
+        default=4,
+        ge=1,
+        title="Parallel Downloads",
+        description="Number of PySide6 wheels downloaded at the same time."
+    )
 
 
 class MarvelousDesignerSettings(BaseSettingsModel):
@@ -126,13 +359,34 @@ DEFAULT_MD_VALUES: dict[str, Any] = {
     "prelaunch_settings": {
         "qt_binding_dir": "/Users/Public/Documents/MarvelousDesigner/Configuration/python311/Lib/site-packages",  # noqa: E501
         "plugins_dir": "/Users/Public/Documents/MarvelousDesigner/Configuration/Plugins",  # noqa: E501
+        "index_url": "https://pypi.org/pypi",
+        "wheelhouse_dir": "",
+        "download_workers": 4,
+        "background_install": False,
+        "qt_wait_timeout": 600,
+        "selective_extraction": False,
+        "extraction_allowlist": list(DEFAULT_QT_EXTRACTION_ALLOWLIST),
+        "workfile_templates": [],
+        "template_hardlinks": False,
+        "seed_workfile_metadata": False,
     },
     "load": {
+        "local_cache": {
+            "enabled": True,
+            "cache_dir": "",
+            "max_size_gb": 20.0,
+            "copy_workers": 4,
+            "chunk_size_mb": 64
+        },
         "LoadPointCache": {
             "scale": 1.0
         }
     },
     "publish": {
+        "CollectPublishReport": {
+            "enabled": False,
+            "report_dir": ""
+        },
         "ExtractPointCache": {
             "enabled": True,
             "optional": True,
@@ -141,7 +395,9 @@ DEFAULT_MD_VALUES: dict[str, Any] = {
         "ExtractObj": {
             "enabled": True,
             "optional": True,
-            "active": True
+            "active": True,
+            "create_proxy": False,
+            "proxy_grid_resolution": 64
         },
         "ExtractFbx": {
             "enabled": True,
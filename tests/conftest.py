@@ -0,0 +1,18 @@
+"""Shared setup of the addon tests.
+
+Tests run outside of Marvelous Designer and the AYON launcher. Modules
+of Marvelous Designer and AYON which can't be installed from PyPI are
+replaced by minimal stand-ins from `tests/stand_ins`. They are added to
+the end of `sys.path`, so installed modules are always preferred.
+"""
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+CLIENT_DIR = os.path.join(os.path.dirname(TESTS_DIR), "client")
+STAND_INS_DIR = os.path.join(TESTS_DIR, "stand_ins")
+
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)
+if STAND_INS_DIR not in sys.path:
+    sys.path.append(STAND_INS_DIR)
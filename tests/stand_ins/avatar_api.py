@@ -0,0 +1,11 @@
+"""Stand-in of Marvelous Designer `avatar_api` module without avatars."""
+
+
+def GetAvatarCount() -> int:
+    """Get number of avatars."""
+    return 0
+
+
+def GetAvatarName(index: int) -> str:
+    """Get name of an avatar."""
+    raise IndexError(index)
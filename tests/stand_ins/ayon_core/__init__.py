@@ -0,0 +1 @@
+"""Stand-in of AYON core for tests running without AYON launcher."""
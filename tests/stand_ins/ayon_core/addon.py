@@ -0,0 +1,28 @@
+"""Stand-in of `ayon_core.addon` needed to import the addon package."""
+from typing import Callable
+
+
+class AYONAddon:
+    """Stand-in of the addon base class."""
+
+
+class IHostAddon:
+    """Stand-in of the host addon interface."""
+
+
+class _ClickWrap:
+    """Stand-in of `click_wrap`, decorators return functions unchanged."""
+
+    def __getattr__(self, name: str) -> Callable:
+        def decorator_factory(*_args: object, **_kwargs: object) -> Callable:
+            def decorator(func: Callable) -> Callable:
+                func.command = decorator_factory
+                func.to_command = lambda: func
+                return func
+
+            return decorator
+
+        return decorator_factory
+
+
+click_wrap = _ClickWrap()
@@ -0,0 +1,17 @@
+"""Stand-in of `ayon_core.host` needed to import the host module."""
+
+
+class HostBase:
+    """Stand-in of the host base class."""
+
+
+class ILoadHost:
+    """Stand-in of the load host interface."""
+
+
+class IPublishHost:
+    """Stand-in of the publish host interface."""
+
+
+class IWorkfileHost:
+    """Stand-in of the workfile host interface."""
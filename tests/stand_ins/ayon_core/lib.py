@@ -0,0 +1,24 @@
+"""Stand-in of `ayon_core.lib` attribute definitions used by loaders."""
+from __future__ import annotations
+
+from typing import Any
+
+
+class _AttrDef:
+    """Attribute definition keeping only its key and keyword arguments."""
+
+    def __init__(self, key: str, **kwargs: Any) -> None:  # noqa: ANN401
+        self.key = key
+        self.kwargs = kwargs
+
+
+class BoolDef(_AttrDef):
+    """Boolean attribute definition."""
+
+
+class NumberDef(_AttrDef):
+    """Number attribute definition."""
+
+
+class UILabelDef(_AttrDef):
+    """Label shown in the options dialog."""
@@ -0,0 +1,24 @@
+"""Stand-in of `ayon_core.pipeline` needed to import the host modules."""
+from __future__ import annotations
+
+from typing import Optional
+
+AYON_CONTAINER_ID = "ayon.load.container"
+AYON_INSTANCE_ID = "ayon.create.instance"
+
+
+def registered_host() -> Optional[object]:
+    """No host is registered in tests."""
+    return None
+
+
+def register_creator_plugin_path(path: str) -> None:
+    """Ignore creator plugin path."""
+
+
+def register_inventory_action_path(path: str) -> None:
+    """Ignore inventory action path."""
+
+
+def register_loader_plugin_path(path: str) -> None:
+    """Ignore loader plugin path."""
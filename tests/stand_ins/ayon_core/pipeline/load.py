@@ -0,0 +1,27 @@
+"""Stand-in of `ayon_core.pipeline.load` used by the resolver and loaders."""
+from __future__ import annotations
+
+import logging
+
+
+class LoadError(Exception):
+    """Error raised by loaders when loading fails."""
+
+
+class LoaderPlugin:
+    """Base class of loader plugins."""
+
+    is_multiple_contexts_compatible = False
+
+    def __init__(self) -> None:
+        """Create logger of the loader."""
+        self.log = logging.getLogger(self.__class__.__name__)
+
+
+def get_representation_path_from_context(context: dict) -> str:
+    """Get path of a representation from its `path` attribute.
+
+    Returns:
+        str: Path of the representation.
+    """
+    return context["representation"]["attrib"]["path"]
@@ -0,0 +1,48 @@
+"""Stand-in of `ayon_core.pipeline.traits` used by the path resolver."""
+from __future__ import annotations
+
+from pathlib import Path
+
+
+class FileLocation:
+    """Stand-in of the file location trait."""
+
+    id = "ayon.content.FileLocation.v1"
+
+    def __init__(self, file_path: Path):
+        """Initialize the trait."""
+        self.file_path = file_path
+
+
+class Representation:
+    """Stand-in of a representation with traits.
+
+    Only the file location trait is read from trait data.
+    """
+
+    def __init__(self, name: str, traits: list):
+        """Initialize the representation."""
+        self.name = name
+        self._traits = {type(trait): trait for trait in traits}
+
+    @classmethod
+    def from_dict(
+            cls,
+            name: str,
+            representation_id: str,  # noqa: ARG003
+            trait_data: dict) -> Representation:
+        """Create representation from serialized trait data.
+
+        Returns:
+            Representation: Representation with its file location.
+        """
+        file_path = trait_data[FileLocation.id]["file_path"]
+        return cls(name, [FileLocation(Path(file_path))])
+
+    def get_trait(self, trait: type) -> object:
+        """Get trait of the representation by its type.
+
+        Returns:
+            object: The trait.
+        """
+        return self._traits[trait]
@@ -0,0 +1,67 @@
+"""Stand-in of Marvelous Designer `fabric_api` module.
+
+Fabrics of the open project are kept in memory as a list of names, the
+name of an added fabric is the file name of its .zfab file. Tests set
+the state with `reset`.
+"""
+from __future__ import annotations
+
+import os
+import pathlib
+
+_fabrics: list[str] = []
+_state: dict = {"current_index": 0}
+
+
+def reset(names: tuple[str, ...] = ("Default",)) -> None:
+    """Reset fabrics of the open project."""
+    _fabrics[:] = names
+    _state["current_index"] = 0
+
+
+def set_current_fabric_index(index: int) -> None:
+    """Select a fabric."""
+    _state["current_index"] = index
+
+
+def GetFabricCount() -> int:
+    """Get number of fabrics."""
+    return len(_fabrics)
+
+
+def GetFabricName(index: int) -> str:
+    """Get name of a fabric."""
+    return _fabrics[index]
+
+
+def GetCurrentFabricIndex() -> int:
+    """Get index of the selected fabric."""
+    return _state["current_index"]
+
+
+def AddFabric(file_path: str) -> int:
+    """Add a fabric from a .zfab file and get its index."""
+    _fabrics.append(_get_name(file_path))
+    return len(_fabrics) - 1
+
+
+def ReplaceFabric(index: int, file_path: str) -> None:
+    """Replace a fabric with a .zfab file."""
+    _fabrics[index] = _get_name(file_path)
+
+
+def DeleteFabric(index: int) -> None:
+    """Delete a fabric, following fabrics shift to lower indices."""
+    del _fabrics[index]
+
+
+def ExportZFab(file_path: str, index: int) -> None:
+    """Export a fabric to a .zfab file."""
+    pathlib.Path(file_path).write_text(_fabrics[index], encoding="utf-8")
+
+
+def _get_name(file_path: str) -> str:
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+
+reset()
@@ -0,0 +1,53 @@
+"""Stand-in of Marvelous Designer `utility_api` module.
+
+Keeps the project file path and the AYON metadata of a single open
+project in memory. Tests set the state with `reset`.
+"""
+from __future__ import annotations
+
+_state: dict = {}
+
+
+def reset(project_path: str = "", metadata: str = "{}") -> None:
+    """Reset the state of the open project."""
+    _state.update({
+        "project_path": project_path,
+        "metadata": metadata,
+        "unsaved": False,
+    })
+
+
+def GetProjectFilePath() -> str:
+    """Get path of the open project."""
+    return _state["project_path"]
+
+
+def GetMetaDataForCurrentGarment() -> str:
+    """Get metadata of the open project as JSON string."""
+    return _state["metadata"]
+
+
+def SetMetaDataForCurrentGarment(metadata: str) -> None:
+    """Set metadata of the open project as JSON string."""
+    _state["metadata"] = metadata
+    _state["unsaved"] = True
+
+
+def CheckZPRJForUnsavedChanges() -> bool:
+    """Check whether the open project changed since it was saved."""
+    return _state["unsaved"]
+
+
+def DeleteWidgets() -> None:
+    """Remove registered widgets."""
+
+
+def RegisterWidget(widget_address: int) -> None:
+    """Register a widget by its address."""
+
+
+def ResetWidgetRegistry() -> None:
+    """Reset the widget registry."""
+
+
+reset()
@@ -0,0 +1,65 @@
+"""Tests of sample selection of trimmed Alembic caches."""
+import pytest
+from ayon_marvelousdesigner.api.alembic_trim import (
+    get_sample_indices,
+    get_time_sampling,
+)
+
+FPS = 25.0
+
+
+def _frame_times(frames: range, per_frame: int = 1) -> list[float]:
+    return [
+        (frame + sub / per_frame) / FPS
+        for frame in frames
+        for sub in range(per_frame)
+    ]
+
+
+def test_window_selects_whole_frames():
+    times = _frame_times(range(1, 11), per_frame=4)
+    frame_window = {"frameStart": 3, "frameEnd": 5, "subsamples": 1}
+
+    indices = get_sample_indices(times, FPS, frame_window)
+
+    assert [times[index] * FPS for index in indices] == pytest.approx(
+        [3, 4, 5])
+
+
+def test_subsamples_and_frame_step():
+    times = _frame_times(range(1, 11), per_frame=4)
+    frame_window = {
+        "frameStart": 2, "frameEnd": 6, "frameStep": 2, "subsamples": 2}
+
+    indices = get_sample_indices(times, FPS, frame_window)
+    selected = [times[index] for index in indices]
+    start_times, cycle = get_time_sampling(selected, 2 / FPS)
+
+    assert [time * FPS for time in selected] == pytest.approx(
+        [2, 2.5, 4, 4.5, 6, 6.5])
+    assert [time * FPS for time in start_times] == pytest.approx([2, 2.5])
+    assert cycle == pytest.approx(2 / FPS)
+
+
+def test_subsamples_are_clamped_to_source_samples():
+    # Source has one sample per frame, more subsamples are requested
+    times = _frame_times(range(1, 11))
+    frame_window = {"frameStart": 1, "frameEnd": 10, "subsamples": 4}
+
+    indices = get_sample_indices(times, FPS, frame_window)
+    start_times, cycle = get_time_sampling(
+        [times[index] for index in indices], 1 / FPS)
+
+    assert len(indices) == 10
+    assert start_times == pytest.approx((1 / FPS,))
+    assert cycle == pytest.approx(1 / FPS)
+
+
+def test_irregular_times_get_single_cycle():
+    times = [frame / FPS for frame in (1, 1.5, 2, 3, 3.5, 4)]
+
+    start_times, cycle = get_time_sampling(times, 1 / FPS)
+
+    assert start_times == pytest.approx(tuple(times))
+    # Every sample is in the first cycle
+    assert times[-1] < times[0] + cycle
@@ -0,0 +1,130 @@
+"""Tests of batch publishing scheduled from the launcher."""
+from __future__ import annotations
+
+import json
+import os
+import shlex
+from typing import TYPE_CHECKING
+
+from ayon_marvelousdesigner.api.batch_publish import (
+    STATUS_FAILED,
+    STATUS_SUCCESS,
+    batch_publish,
+    get_published_workfiles,
+)
+from conftest import STAND_INS_DIR
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Worker session standing in for Marvelous Designer. It opens the
+# workfile with the stand-in MD API, which must be on `PYTHONPATH`, and
+# fails workfiles with "bad" in their name.
+WORKER_SCRIPT = """
+import json, os, sys, time
+import utility_api
+from ayon_marvelousdesigner.api.batch_publish import RESULT_ENV, WORKFILE_ENV
+
+workfile = os.environ[WORKFILE_ENV]
+utility_api.reset(project_path=workfile)
+start = time.time()
+time.sleep(0.3)
+bad = "bad" in os.path.basename(utility_api.GetProjectFilePath())
+result = {
+    "status": "failed" if bad else "success",
+    "start": start,
+    "end": time.time(),
+}
+with open(os.environ[RESULT_ENV], "w") as stream:
+    json.dump(result, stream)
+sys.exit(1 if bad else 0)
+"""
+
+
+def _make_workfiles(tmp_path: Path, names: list[str]) -> list[str]:
+    paths = []
+    for name in names:
+        path = tmp_path / f"{name}.zprj"
+        path.write_bytes(b"zprj")
+        paths.append(str(path))
+    return paths
+
+
+def _run(tmp_path: Path, workfiles: list[str], **kwargs: object) -> dict:
+    script_path = tmp_path / "worker.py"
+    script_path.write_text(WORKER_SCRIPT)
+    return batch_publish(
+        workfiles,
+        str(tmp_path / "batch.jsonl"),
+        worker_command=f"{{python}} {shlex.quote(str(script_path))}",
+        md_api_path=STAND_INS_DIR,
+        timeout=30,
+        **kwargs,
+    )
+
+
+def _read_log(tmp_path: Path) -> list[dict]:
+    lines = (tmp_path / "batch.jsonl").read_text().splitlines()
+    return [json.loads(line) for line in lines]
+
+
+def test_batch_runs_workers_in_parallel_and_logs_results(tmp_path):
+    workfiles = _make_workfiles(tmp_path, ["a", "b", "c", "bad"])
+
+    summary = _run(tmp_path, workfiles, workers=2)
+
+    assert summary == {"skipped": 0, STATUS_SUCCESS: 3, STATUS_FAILED: 1}
+    results = _read_log(tmp_path)
+    assert sorted(result["workfile"] for result in results) == sorted(
+        workfiles)
+    statuses = {
+        os.path.basename(result["workfile"]): result["status"]
+        for result in results
+    }
+    assert statuses["bad.zprj"] == STATUS_FAILED
+    assert "output" in next(
+        result for result in results if result["status"] == STATUS_FAILED)
+
+    # At most two sessions ran at the same time, and two did overlap
+    events = sorted(
+        [(result["start"], 1) for result in results]
+        + [(result["end"], -1) for result in results]
+    )
+    running = max_running = 0
+    for _, change in events:
+        running += change
+        max_running = max(max_running, running)
+    assert max_running == 2
+
+
+def test_resume_skips_unchanged_published_workfiles(tmp_path):
+    workfiles = _make_workfiles(tmp_path, ["a", "b", "bad"])
+    _run(tmp_path, workfiles)
+
+    assert _run(tmp_path, workfiles) == {"skipped": 2, STATUS_FAILED: 1}
+
+    # Modified workfile is published again
+    mtime = os.path.getmtime(workfiles[0]) + 10
+    os.utime(workfiles[0], (mtime, mtime))
+    assert _run(tmp_path, workfiles) == {
+        "skipped": 1, STATUS_SUCCESS: 1, STATUS_FAILED: 1}
+
+    assert _run(tmp_path, workfiles, resume=False) == {
+        "skipped": 0, STATUS_SUCCESS: 2, STATUS_FAILED: 1}
+
+
+def test_published_workfiles_from_log(tmp_path):
+    log_path = tmp_path / "batch.jsonl"
+    lines = [
+        {"workfile": "a.zprj", "status": STATUS_SUCCESS, "mtime": 1.0},
+        {"workfile": "b.zprj", "status": STATUS_SUCCESS, "mtime": 2.0},
+        {"workfile": "b.zprj", "status": STATUS_FAILED, "mtime": 3.0},
+    ]
+    log_path.write_text(
+        "".join(json.dumps(line) + "\n" for line in lines)
+        # Incomplete line of an interrupted batch
+        + '{"workfile": "c.zprj", "sta'
+    )
+
+    assert get_published_workfiles(str(log_path)) == {"a.zprj": 1.0}
+    assert get_published_workfiles(str(tmp_path / "missing.jsonl")) == {}
@@ -0,0 +1,35 @@
+"""Tests of the local index of representations loaded in workfiles."""
+from __future__ import annotations
+
+import json
+
+from ayon_marvelousdesigner.api import dependency_index
+from ayon_marvelousdesigner.api.dependency_index import DependencyIndex
+
+
+def test_failed_workfile_is_read_again(tmp_path, monkeypatch):
+    workfile = tmp_path / "scene.zprj"
+    workfile.write_text(json.dumps({
+        "ayon_containers": [{"objectName": "a", "representation": "rep1"}],
+    }), encoding="utf-8")
+    read_zprj_metadata = dependency_index.read_zprj_metadata
+
+    def fail(filepath: str) -> dict:
+        msg = f"File is locked: {filepath}"
+        raise OSError(msg)
+
+    index = DependencyIndex(str(tmp_path / "index.db"))
+    try:
+        monkeypatch.setattr(dependency_index, "read_zprj_metadata", fail)
+        assert index.update([str(tmp_path)])["failed"] == 1
+
+        monkeypatch.setattr(
+            dependency_index, "read_zprj_metadata", read_zprj_metadata)
+        summary = index.update([str(tmp_path)])
+
+        assert (summary["updated"], summary["failed"]) == (1, 0)
+        assert index.get_workfiles_by_representation(["rep1"]) == {
+            "rep1": [str(workfile)]}
+        assert index.update([str(tmp_path)])["unchanged"] == 1
+    finally:
+        index.close()
@@ -0,0 +1,160 @@
+"""Tests of the registry of fabrics loaded by AYON containers."""
+from __future__ import annotations
+
+import json
+
+import fabric_api
+import pytest
+import utility_api
+from ayon_marvelousdesigner.api.lib import FabricRegistry, get_fabrics
+
+
+@pytest.fixture(autouse=True)
+def scene() -> None:
+    utility_api.reset(project_path="scene.zprj")
+    fabric_api.reset(("Default",))
+
+
+def _container(
+        name: str,
+        index: int,
+        fabric_name: str,
+        representation: str = "",
+        file_hash: str = "") -> dict:
+    return {
+        "objectName": name,
+        "fabricIndex": index,
+        "fabricName": fabric_name,
+        "representation": representation or name,
+        "fabricHash": file_hash or name,
+    }
+
+
+def _load(name: str) -> int:
+    return fabric_api.AddFabric(f"/publish/{name}.zfab")
+
+
+def _stored_containers() -> list[dict]:
+    metadata = json.loads(utility_api.GetMetaDataForCurrentGarment())
+    return metadata["ayon_containers"]
+
+
+def test_remove_shifts_indices_of_following_fabrics():
+    registry = FabricRegistry([
+        _container(name, _load(name), name) for name in ("a", "b", "c")
+    ])
+
+    fabric_api.DeleteFabric(registry.get("a")["fabricIndex"])
+    registry.remove("a")
+    registry.write()
+
+    assert [
+        (container["objectName"], container["fabricIndex"])
+        for container in _stored_containers()
+    ] == [("b", 1), ("c", 2)]
+    for container in registry.containers:
+        assert fabric_api.GetFabricName(
+            container["fabricIndex"]) == container["fabricName"]
+
+
+def test_remove_shared_fabric_keeps_indices():
+    index = _load("a")
+    registry = FabricRegistry([
+        _container("a", index, "a"),
+        _container("a_1", index, "a"),
+        _container("b", _load("b"), "b"),
+    ])
+
+    registry.remove("a", fabric_deleted=False)
+
+    assert registry.get("a") is None
+    assert registry.get("b")["fabricIndex"] == 2
+    assert len(registry.get_references(index)) == 1
+
+
+def test_resolve_fixes_drifted_indices_by_name():
+    for name in ("a", "b", "c"):
+        _load(name)
+    registry = FabricRegistry([
+        _container("b", 2, "b"),
+        _container("c", 3, "c"),
+        _container("lost", 1, "x"),
+    ])
+    # Fabric deleted outside of AYON shifted the following fabrics
+    fabric_api.DeleteFabric(1)
+
+    changed = registry.resolve()
+
+    assert {container["objectName"] for container in changed} == {"b", "c"}
+    indices = {
+        container["objectName"]: container["fabricIndex"]
+        for container in registry.containers
+    }
+    assert indices == {"b": 1, "c": 2, "lost": 1}
+
+
+def test_resolve_picks_nearest_fabric_with_same_name():
+    for name in ("b", "a", "b", "a", "b"):
+        _load(name)
+    registry = FabricRegistry([
+        _container("b1", 1, "b"),
+        _container("b2", 5, "b"),
+    ])
+    fabric_api.DeleteFabric(2)
+
+    registry.resolve()
+
+    assert registry.get("b1")["fabricIndex"] == 1
+    assert registry.get("b2")["fabricIndex"] == 4
+
+
+def test_resolve_keeps_shared_fabric_together():
+    _load("x")
+    index = _load("a")
+    registry = FabricRegistry([
+        _container("a", index, "a"),
+        _container("a_1", index, "a"),
+    ])
+    fabric_api.DeleteFabric(1)
+
+    changed = registry.resolve()
+
+    assert len(changed) == 2
+    assert registry.get("a")["fabricIndex"] == 1
+    assert registry.get("a_1")["fabricIndex"] == 1
+    assert len(registry.get_references(1)) == 2
+
+
+def test_resolve_uses_passed_snapshot():
+    _load("a")
+    registry = FabricRegistry([_container("a", 1, "a")])
+    fabrics = get_fabrics()
+    fabric_api.DeleteFabric(0)
+
+    assert registry.resolve(fabrics) == []
+
+
+def test_find_loaded_and_unique_names():
+    registry = FabricRegistry([
+        _container("a", _load("a"), "a", representation="rep1",
+                   file_hash="hash1"),
+    ])
+
+    assert registry.find_loaded("rep1")["objectName"] == "a"
+    assert registry.find_loaded("rep2", "hash1")["objectName"] == "a"
+    assert registry.find_loaded("rep2", "hash2") is None
+
+    added = registry.add(_container("a", 1, "a"))
+    assert added["objectName"] == "a_1"
+    assert len(registry.get_references(1)) == 2
+
+
+def test_write_only_when_changed():
+    registry = FabricRegistry([_container("a", _load("a"), "a")])
+    registry.resolve()
+    registry.write()
+    assert not utility_api.CheckZPRJForUnsavedChanges()
+
+    registry.update("a", {"representation": "rep2"})
+    registry.write()
+    assert _stored_containers()[0]["representation"] == "rep2"
@@ -0,0 +1,113 @@
+"""Tests of the local read-through file cache."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from ayon_marvelousdesigner.api import lib
+from ayon_marvelousdesigner.api.file_cache import (
+    COMPLETE_MARKER,
+    LocalFileCache,
+)
+
+
+def _write(path: Path, size: int, mtime: Optional[int] = None) -> str:
+    Path(path).write_bytes(os.urandom(size))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def _entries(cache_dir: Path) -> list[str]:
+    return sorted(
+        entry.name for entry in os.scandir(cache_dir) if entry.is_dir())
+
+
+def test_get_copies_once_and_hits(tmp_path):
+    source = _write(tmp_path / "cache.abc", 3000)
+    cache = LocalFileCache(str(tmp_path / "cache"), max_size=10 ** 6,
+                           chunk_size=1024)
+
+    local_path = cache.get(source, "rep1")
+    assert cache.get(source, "rep1") == local_path
+    assert Path(source).read_bytes() == Path(local_path).read_bytes()
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["bytes_saved"] == 3000
+
+
+def test_republished_file_is_copied_again(tmp_path):
+    source = _write(tmp_path / "cache.abc", 100, mtime=1000)
+    cache = LocalFileCache(str(tmp_path / "cache"), max_size=10 ** 6)
+    first_path = cache.get(source, "rep1")
+
+    _write(source, 200, mtime=2000)
+    second_path = cache.get(source, "rep1")
+
+    assert second_path != first_path
+    assert os.path.getsize(second_path) == 200
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = LocalFileCache(str(cache_dir), max_size=250)
+    sources = [_write(tmp_path / f"{idx}.abc", 100) for idx in range(3)]
+    paths = []
+    for idx, source in enumerate(sources):
+        paths.append(cache.get(source, f"rep{idx}"))
+        marker = os.path.join(os.path.dirname(paths[-1]), COMPLETE_MARKER)
+        os.utime(marker, (idx, idx))
+
+    # Touch the oldest entry, second one becomes least recently used
+    cache.get(sources[0], "rep0")
+    cache.get(_write(tmp_path / "3.abc", 100), "rep3")
+
+    assert os.path.exists(paths[0])
+    assert not os.path.exists(paths[1])
+    assert len(_entries(cache_dir)) == 2
+
+
+def test_get_many_keeps_all_fetched_entries(tmp_path):
+    cache_dir = tmp_path / "cache"
+    # Quota is smaller than the fetched files together
+    cache = LocalFileCache(str(cache_dir), max_size=150)
+    items = [
+        (_write(tmp_path / f"{idx}.abc", 100), f"rep{idx}")
+        for idx in range(4)
+    ]
+
+    local_paths = cache.get_many(items, max_workers=4)
+
+    assert len(local_paths) == 4
+    for source, _ in items:
+        assert local_paths[source] != source
+        assert os.path.exists(local_paths[source])
+
+    # Next fetch evicts entries of the finished batch
+    cache.get(_write(tmp_path / "next.abc", 100), "next")
+    assert len(_entries(cache_dir)) == 1
+
+
+def test_published_file_hash_is_computed_once(tmp_path, monkeypatch):
+    hashed = []
+
+    def get_file_hash(filepath: str) -> str:
+        hashed.append(filepath)
+        return "digest"
+
+    monkeypatch.setattr(lib, "get_file_hash", get_file_hash)
+    monkeypatch.setattr(lib, "_published_file_hashes", {})
+    source = _write(tmp_path / "cache.abc", 100)
+    cache = LocalFileCache(str(tmp_path / "cache"), max_size=10 ** 6)
+    local_path = cache.get(source, "rep1")
+
+    for _ in range(2):
+        assert lib.get_published_file_hash(
+            source, local_path, "rep1", cache) == "digest"
+    # Another session reads the digest stored in the cache
+    monkeypatch.setattr(lib, "_published_file_hashes", {})
+    assert lib.get_published_file_hash(
+        source, local_path, "rep1", cache) == "digest"
+
+    assert hashed == [local_path]
@@ -0,0 +1,50 @@
+"""Tests of loading zfab representations."""
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import fabric_api
+import pytest
+import utility_api
+from ayon_marvelousdesigner.plugins.load.load_zfab import LoadZfab
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def scene() -> None:
+    utility_api.reset(project_path="scene.zprj")
+    fabric_api.reset(("Default",))
+
+
+def _context(tmp_path: Path, name: str) -> dict:
+    path = tmp_path / f"{name}.zfab"
+    path.write_bytes(name.encode())
+    return {
+        "project": {"name": "project"},
+        "product": {"name": name},
+        "representation": {
+            "id": f"rep_{name}",
+            "name": "zfab",
+            "attrib": {"path": str(path)},
+        },
+    }
+
+
+def test_multiple_contexts_are_written_once(tmp_path, monkeypatch):
+    writes = []
+    monkeypatch.setattr(
+        utility_api, "SetMetaDataForCurrentGarment", writes.append)
+    contexts = [_context(tmp_path, name) for name in ("a", "b", "c")]
+
+    LoadZfab().load(contexts)
+
+    assert len(writes) == 1
+    containers = json.loads(writes[0])["ayon_containers"]
+    assert [
+        (container["fabricName"], container["fabricIndex"])
+        for container in containers
+    ] == [("a", 1), ("b", 2), ("c", 3)]
+    assert fabric_api.GetFabricCount() == 4
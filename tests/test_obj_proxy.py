@@ -0,0 +1,97 @@
+"""Tests of decimated OBJ proxies."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from ayon_marvelousdesigner.api import obj_proxy
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.skipif(
+    not obj_proxy.is_available(), reason="NumPy is not available")
+
+
+def _write_grid_obj(path: Path, size: int) -> None:
+    """Write a wavy plane of `size` x `size` vertices made of triangles.
+
+    Faces alternate between absolute `v/vt/vn` indices and negative
+    indices relative to the last vertex.
+    """
+    lines = ["o cloth\n"]
+    for row in range(size):
+        lines.extend(
+            f"v {col} {row} {(col * row) % 3 * 0.01}\n"
+            for col in range(size)
+        )
+    lines.append("g panel\n")
+    vertex_count = size * size
+    for row in range(size - 1):
+        for col in range(size - 1):
+            a = row * size + col + 1
+            b, c, d = a + 1, a + size, a + size + 1
+            lines.extend((
+                f"f {a}/{a}/{a} {b}/{b}/{b} {d}/{d}/{d}\n",
+                "f {} {} {}\n".format(
+                    *(index - vertex_count - 1 for index in (a, d, c))),
+            ))
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+def _read_obj(path: Path) -> tuple[int, list[list[int]], list[str]]:
+    vertex_count = 0
+    faces = []
+    names = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.startswith("v "):
+            vertex_count += 1
+        elif line.startswith("f "):
+            faces.append([int(item) for item in line.split()[1:]])
+        elif line.startswith(("o ", "g ")):
+            names.append(line)
+    return vertex_count, faces, names
+
+
+def test_decimated_faces_are_valid(tmp_path):
+    src = tmp_path / "cloth.obj"
+    dst = tmp_path / "proxy.obj"
+    _write_grid_obj(src, 20)
+
+    stats = obj_proxy.decimate_obj(str(src), str(dst), grid_resolution=5)
+
+    vertex_count, faces, names = _read_obj(dst)
+    assert names == ["o cloth", "g panel"]
+    assert stats["vertexCount"] == 400
+    assert stats["faceCount"] == 2 * 19 * 19
+    assert stats["proxyVertexCount"] == vertex_count
+    assert 0 < vertex_count < 400
+    assert stats["proxyFaceCount"] == len(faces) > 0
+    for face in faces:
+        assert len(face) >= 3
+        assert len(set(face)) == len(face)
+        assert all(1 <= index <= vertex_count for index in face)
+
+
+def test_fine_grid_keeps_mesh(tmp_path):
+    src = tmp_path / "cloth.obj"
+    dst = tmp_path / "proxy.obj"
+    _write_grid_obj(src, 6)
+
+    stats = obj_proxy.decimate_obj(str(src), str(dst), grid_resolution=1000)
+
+    assert stats["proxyVertexCount"] == 36
+    assert stats["proxyFaceCount"] == stats["faceCount"] == 50
+    assert stats["ratio"] == 1.0
+
+
+def test_chunked_reading_gives_same_proxy(tmp_path, monkeypatch):
+    src = tmp_path / "cloth.obj"
+    _write_grid_obj(src, 12)
+    obj_proxy.decimate_obj(str(src), str(tmp_path / "whole.obj"), 4)
+
+    monkeypatch.setattr(obj_proxy, "CHUNK_LINES", 7)
+    obj_proxy.decimate_obj(str(src), str(tmp_path / "chunked.obj"), 4)
+
+    assert (tmp_path / "whole.obj").read_text() == (
+        tmp_path / "chunked.obj").read_text()
@@ -0,0 +1,22 @@
+"""Tests of helpers shared by prelaunch hooks."""
+from __future__ import annotations
+
+from ayon_marvelousdesigner.prelaunch import get_launch_fingerprint
+
+SETTINGS = {
+    "plugins_dir": "/md/plugins",
+    "workfile_templates": [],
+    "template_hardlinks": False,
+}
+
+
+def test_workfile_settings_do_not_change_fingerprint():
+    changed = dict(SETTINGS, workfile_templates=[
+        {"task_types": ["Modeling"], "path": "{root[work]}/tpl.zprj"}
+    ], template_hardlinks=True)
+
+    assert get_launch_fingerprint(changed) == get_launch_fingerprint(
+        SETTINGS)
+    assert get_launch_fingerprint(
+        dict(SETTINGS, plugins_dir="/other")) != get_launch_fingerprint(
+        SETTINGS)
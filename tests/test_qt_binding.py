@@ -0,0 +1,170 @@
+"""Tests of PySide6 provisioning helpers."""
+from __future__ import annotations
+
+import hashlib
+import http.server
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from ayon_marvelousdesigner.qt_binding import (
+    PARTIAL_SUFFIX,
+    FileLock,
+    download_file,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+DATA = os.urandom(300 * 1024)
+DATA_SHA256 = hashlib.sha256(DATA).hexdigest()
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serve `DATA`, optionally with range requests and broken transfers.
+
+    Behavior is configured on the server: `ranges` enables range
+    requests and `cut_at` closes the first response after that many
+    bytes of the file. Range headers of requests are recorded in
+    `server.ranges_requested`.
+    """
+
+    def do_GET(self) -> None:
+        server = self.server
+        range_header = self.headers.get("Range")
+        server.ranges_requested.append(range_header)
+        start = 0
+        if range_header and server.ranges:
+            start = int(range_header.removeprefix("bytes=").split("-")[0])
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(DATA) - 1}/{len(DATA)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(DATA) - start))
+        self.end_headers()
+
+        end = len(DATA)
+        if server.cut_at is not None:
+            end, server.cut_at = server.cut_at, None
+        self.wfile.write(DATA[start:end])
+        if end < len(DATA):
+            self.close_connection = True
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[http.server.HTTPServer]:
+    httpd = http.server.HTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.ranges = True
+    httpd.cut_at = None
+    httpd.ranges_requested = []
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/file.whl"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+def _partial(dest: Path) -> Path:
+    return dest.with_name(dest.name + PARTIAL_SUFFIX)
+
+
+def test_download_resumes_partial_file(server, tmp_path):
+    dest = tmp_path / "file.whl"
+    _partial(dest).write_bytes(DATA[:1000])
+
+    download_file(server.url, dest, DATA_SHA256, len(DATA))
+
+    assert dest.read_bytes() == DATA
+    assert not _partial(dest).exists()
+    assert server.ranges_requested == ["bytes=1000-"]
+
+
+def test_download_restarts_when_ranges_are_not_supported(server, tmp_path):
+    server.ranges = False
+    dest = tmp_path / "file.whl"
+    _partial(dest).write_bytes(b"stale data")
+
+    download_file(server.url, dest, DATA_SHA256, len(DATA))
+
+    assert dest.read_bytes() == DATA
+
+
+def test_interrupted_download_is_resumed(server, tmp_path):
+    server.cut_at = 100 * 1024
+    dest = tmp_path / "file.whl"
+
+    download_file(server.url, dest, DATA_SHA256, len(DATA))
+
+    assert dest.read_bytes() == DATA
+    assert server.ranges_requested == [None, f"bytes={100 * 1024}-"]
+
+
+def test_complete_partial_file_is_not_downloaded_again(server, tmp_path):
+    dest = tmp_path / "file.whl"
+    _partial(dest).write_bytes(DATA)
+
+    download_file(server.url, dest, DATA_SHA256, len(DATA))
+
+    assert dest.read_bytes() == DATA
+    assert server.ranges_requested == []
+
+
+def test_hash_mismatch_discards_download(server, tmp_path):
+    dest = tmp_path / "file.whl"
+
+    with pytest.raises(ValueError, match="SHA-256"):
+        download_file(server.url, dest, "0" * 64, len(DATA))
+
+    assert not dest.exists()
+    assert not _partial(dest).exists()
+
+
+def _dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", ""])
+    process.wait()
+    return process.pid
+
+
+def test_lock_heartbeat_keeps_lock_fresh(tmp_path):
+    lock_path = tmp_path / "test.lock"
+    lock = FileLock(lock_path, stale_age=1, heartbeat_interval=0.1)
+    with lock:
+        os.utime(lock_path, (0, 0))
+        time.sleep(0.3)
+        assert time.time() - os.path.getmtime(lock_path) < 1
+        with pytest.raises(TimeoutError):
+            FileLock(lock_path, timeout=0.6, stale_age=1).acquire()
+    assert not lock_path.exists()
+
+
+def test_lock_of_dead_owner_is_stale(tmp_path):
+    lock_path = tmp_path / "test.lock"
+    lock_path.write_text(f"{socket.gethostname()}:{_dead_pid()}")
+
+    lock = FileLock(lock_path, timeout=0)
+    lock.acquire()
+    assert lock_path.read_text() == f"{socket.gethostname()}:{os.getpid()}"
+    lock.release()
+
+
+def test_old_lock_of_other_host_is_stale(tmp_path):
+    lock_path = tmp_path / "test.lock"
+    lock_path.write_text("other-host:1")
+
+    with pytest.raises(TimeoutError):
+        FileLock(lock_path, timeout=0, stale_age=60).acquire()
+    os.utime(lock_path, (0, 0))
+    with FileLock(lock_path, timeout=0, stale_age=60):
+        assert lock_path.read_text().endswith(f":{os.getpid()}")
@@ -0,0 +1,71 @@
+"""Tests of the memoized representation path resolver."""
+from __future__ import annotations
+
+import json
+
+from ayon_marvelousdesigner.api.resolver import RepresentationPathResolver
+
+FILE_LOCATION = "ayon.content.FileLocation.v1"
+
+
+def _context(
+        representation_id: str,
+        file_path: str,
+        *,
+        traits: bool = True) -> dict:
+    representation = {
+        "id": representation_id,
+        "name": "zfab",
+        "attrib": {"path": f"/legacy{file_path}"},
+    }
+    if traits:
+        representation["traits"] = json.dumps(
+            {FILE_LOCATION: {"file_path": file_path}})
+    return {"representation": representation}
+
+
+def test_paths_are_resolved_once():
+    resolver = RepresentationPathResolver()
+
+    assert resolver.resolve(_context("r1", "/a.zfab")) == "/a.zfab"
+    assert resolver.resolve(_context("r1", "/a.zfab")) == "/a.zfab"
+    assert resolver.resolve(_context("r2", "/b.zfab", traits=False)) == (
+        "/legacy/b.zfab")
+
+    stats = resolver.get_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+
+
+def test_changed_traits_are_resolved_again():
+    resolver = RepresentationPathResolver()
+    resolver.resolve(_context("r1", "/a.zfab"))
+
+    assert resolver.resolve(_context("r1", "/moved/a.zfab")) == (
+        "/moved/a.zfab")
+    assert resolver.get_stats()["misses"] == 2
+
+
+def test_key_ignores_traits_serialization():
+    traits = {FILE_LOCATION: {"file_path": "/a.zfab"}, "other": {"b": 1}}
+    parsed = {"id": "r1", "traits": traits}
+    serialized = {"id": "r1", "traits": json.dumps(traits, sort_keys=True)}
+    legacy = {"id": "r1"}
+
+    get_key = RepresentationPathResolver.get_key
+    assert get_key(parsed) == get_key(serialized)
+    assert get_key(legacy) == ("r1", None)
+    assert get_key(legacy) != get_key(parsed)
+
+
+def test_least_recently_used_paths_are_dropped():
+    resolver = RepresentationPathResolver(max_size=2)
+    resolver.resolve(_context("r1", "/a.zfab"))
+    resolver.resolve(_context("r2", "/b.zfab"))
+    resolver.resolve(_context("r1", "/a.zfab"))
+    resolver.resolve(_context("r3", "/c.zfab"))
+
+    resolver.resolve(_context("r1", "/a.zfab"))
+    resolver.resolve(_context("r2", "/b.zfab"))
+
+    stats = resolver.get_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 4, 2)
@@ -0,0 +1,92 @@
+"""Tests of reading AYON metadata from .zprj files."""
+from __future__ import annotations
+
+import html
+import io
+import json
+import os
+import zipfile
+from typing import TYPE_CHECKING
+
+from ayon_marvelousdesigner.api import zprj_metadata
+from ayon_marvelousdesigner.api.zprj_metadata import (
+    read_zprj_metadata,
+    scan_zprj_metadata,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+METADATA = {
+    "ayon_context_data": {"publish_attributes": {}},
+    "ayon_instances": {"id1": {"productName": "workfileMain"}},
+    "ayon_containers": [{"objectName": "fabric_0", "representation": "r"}],
+}
+
+
+def _write_zprj(path: Path, members: dict[str, bytes]) -> str:
+    # Binary header in front of a ZIP archive, like thumbnails of a project
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for name, data in members.items():
+            zip_file.writestr(name, data)
+    path.write_bytes(b"ZPRJ" + os.urandom(2048) + archive.getvalue())
+    return str(path)
+
+
+def test_metadata_in_escaped_xml_member(tmp_path):
+    escaped = html.escape(json.dumps(METADATA), quote=True)
+    path = _write_zprj(tmp_path / "a.zprj", {
+        "avatar.bin": os.urandom(100_000),
+        "project.xml": f'<garment meta="{escaped}"/>'.encode(),
+    })
+
+    assert read_zprj_metadata(path) == METADATA
+
+
+def test_metadata_in_utf16_member(tmp_path):
+    text = 'Garment {"name": "x"} ' + json.dumps(METADATA)
+    path = _write_zprj(tmp_path / "a.zprj", {
+        "garment.dat": b"\x00\x01" + text.encode("utf-16-le"),
+    })
+
+    assert read_zprj_metadata(path) == METADATA
+
+
+def test_marker_outside_metadata_is_skipped(tmp_path, monkeypatch):
+    # Chunks smaller than the metadata make it span chunk boundaries
+    monkeypatch.setattr(zprj_metadata, "READ_CHUNK_SIZE", 16)
+    decoy = b'{"name": "ayon_", "other": "\\"ayon_tool\\""} '
+    path = tmp_path / "raw.zprj"
+    path.write_bytes(
+        os.urandom(500) + decoy + json.dumps(METADATA).encode()
+        + os.urandom(500)
+    )
+
+    assert read_zprj_metadata(str(path)) == METADATA
+
+
+def test_file_without_metadata(tmp_path):
+    path = _write_zprj(tmp_path / "a.zprj", {"project.xml": b"<garment/>"})
+
+    assert read_zprj_metadata(path) is None
+
+
+def test_scan_reports_errors_in_order(tmp_path):
+    good = _write_zprj(tmp_path / "a.zprj", {
+        "meta.json": json.dumps(METADATA).encode()})
+    broken = _write_zprj(tmp_path / "b.zprj", {"garment.dat": b"x" * 4096})
+    # Corrupt the compressed member data
+    data = bytearray((tmp_path / "b.zprj").read_bytes())
+    start = data.index(b"garment.dat") + len("garment.dat")
+    data[start:start + 8] = b"\xff" * 8
+    (tmp_path / "b.zprj").write_bytes(bytes(data))
+    (tmp_path / "notes.txt").write_text(json.dumps(METADATA))
+
+    results = list(scan_zprj_metadata([str(tmp_path)], max_workers=2))
+
+    assert [result["workfile"] for result in results] == [good, broken]
+    assert results[0]["metadata"] == METADATA
+    assert results[0]["error"] is None
+    assert results[1]["metadata"] is None
+    assert results[1]["error"]
@@ -0,0 +1,192 @@
+"""Measure import time of Marvelous Designer addon modules.
+
+Runs a fresh interpreter with `-X importtime` for each measured module and
+reports the cumulative import cost of the module and of its most
+expensive dependencies. Modules which should be imported lazily (Qt and
+AYON tools) are reported when they were imported anyway.
+
+Run it with the Python interpreter of Marvelous Designer, or any other
+interpreter which can import the Marvelous Designer API modules, e.g.:
+
+    python tools/benchmark_imports.py ayon_marvelousdesigner.api.pipeline
+
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_MODULES = (
+    "ayon_marvelousdesigner.api",
+    "ayon_marvelousdesigner.api.pipeline",
+    "ayon_marvelousdesigner.api.ayon_dialog",
+)
+# Modules which are expected to be imported only on first use
+DEFERRED_PREFIXES = (
+    "qtpy",
+    "PySide2",
+    "PySide6",
+    "ayon_core.tools",
+    "ayon_core.style",
+    "ayon_core.resources",
+    "ayon_marvelousdesigner.api.ayon_dialog",
+)
+log = logging.getLogger("benchmark_imports")
+
+CLIENT_DIR = Path(__file__).resolve().parent.parent / "client"
+
+_LINE_REGEX = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|"
+    r"(?P<indent>\s+)(?P<name>\S+)\s*$"
+)
+
+
+def measure_module(module_name: str, repeat: int = 3) -> dict:
+    """Measure import of a module in fresh interpreters.
+
+    The fastest of the runs is reported to reduce the effect of a cold
+    file system cache.
+
+    Args:
+        module_name (str): Name of the module to import.
+        repeat (int): Number of runs.
+
+    Returns:
+        dict: Total import time, cumulative time of imported modules and
+            list of imported modules which should be deferred.
+
+    Raises:
+        RuntimeError: If the module can't be imported.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [CLIENT_DIR.as_posix(), env.get("PYTHONPATH")]))
+
+    best = None
+    for _ in range(max(1, repeat)):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c",
+             f"import {module_name}"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        modules = _parse_importtime(process.stderr)
+        if process.returncode != 0:
+            errors = [
+                line for line in process.stderr.splitlines()
+                if not line.startswith("import time:")
+            ]
+            msg = f"Failed to import {module_name}:\n" + "\n".join(errors)
+            raise RuntimeError(msg)
+
+        total = modules.get(module_name, {}).get("cumulative", 0)
+        if best is None or total < best["total"]:
+            best = {"module": module_name, "total": total, "modules": modules}
+
+    best["deferred"] = sorted(
+        name for name in best["modules"]
+        if name.startswith(DEFERRED_PREFIXES) and name != module_name
+    )
+    return best
+
+
+def _parse_importtime(output: str) -> dict[str, dict]:
+    """Parse output of `-X importtime`.
+
+    Returns:
+        dict[str, dict]: Self and cumulative time in microseconds and
+            nesting depth by module name.
+    """
+    modules = {}
+    for line in output.splitlines():
+        match = _LINE_REGEX.match(line)
+        if not match:
+            continue
+        modules[match.group("name")] = {
+            "self": int(match.group("self")),
+            "cumulative": int(match.group("cumulative")),
+            "depth": (len(match.group("indent")) - 1) // 2,
+        }
+    return modules
+
+
+def log_report(result: dict, top: int) -> None:
+    """Log report of a measured module.
+
+    Args:
+        result (dict): Result of `measure_module`.
+        top (int): Number of most expensive dependencies to list.
+    """
+    log.info("%s: %.1f ms", result["module"], result["total"] / 1000)
+    dependencies = sorted(
+        (
+            (data["cumulative"], name)
+            for name, data in result["modules"].items()
+            if name != result["module"]
+        ),
+        reverse=True,
+    )
+    for cumulative, name in dependencies[:top]:
+        log.info("    %9.1f ms  %s", cumulative / 1000, name)
+    if result["deferred"]:
+        log.info("  Imported modules expected to be deferred:")
+        for name in result["deferred"]:
+            log.info("    %s", name)
+    log.info("")
+
+
+def main() -> int:
+    """Run the benchmark.
+
+    Returns:
+        int: Exit code, 1 if expected deferred modules were imported by
+            a module not expected to import them.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "modules", nargs="*", default=list(DEFAULT_MODULES),
+        help="Modules to measure.")
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="Number of runs per module, the fastest is reported.")
+    parser.add_argument(
+        "--top", type=int, default=15,
+        help="Number of most expensive dependencies to list.")
+    parser.add_argument(
+        "--json", dest="json_path",
+        help="Write full results to a JSON file.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    results = []
+    for module_name in args.modules:
+        try:
+            result = measure_module(module_name, args.repeat)
+        except RuntimeError as exc:
+            log.error("%s", exc)  # noqa: TRY400
+            continue
+        log_report(result, args.top)
+        results.append(result)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as stream:
+            json.dump(results, stream, indent=4)
+
+    unexpected = [
+        result["module"] for result in results
+        if result["deferred"]
+        and not result["module"].startswith(DEFERRED_PREFIXES)
+    ]
+    return 1 if unexpected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())